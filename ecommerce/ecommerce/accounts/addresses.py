@@ -0,0 +1,289 @@
+from typing import Any, Iterable
+
+from django.db import connection, transaction
+from django.db.models import Case, Exists, F, OuterRef, Q, QuerySet, When
+from django.utils import timezone
+
+from ..core.db.routers import pin_user_to_primary
+from .exceptions import AddressNotFoundError, SharedAddressError
+from .models import (
+    ADDRESS_CONTENT_FIELDS,
+    Address,
+    User,
+    get_address_content_hash,
+)
+from .search import update_user_search_documents
+
+ADDRESS_FIELDS = ADDRESS_CONTENT_FIELDS
+DEFAULT_ADDRESS_TYPES = ("shipping", "billing")
+ADDRESS_BULK_MAX_SIZE = 100
+
+UserAddress = User.addresses.through
+
+
+def get_address_book(user: User) -> QuerySet:
+    """사용자의 주소를 기본 배송지/청구지 여부와 함께 한 번의 쿼리로 읽는다."""
+    defaults = {
+        f"is_default_{address_type}": Exists(
+            User.objects.filter(
+                pk=user.pk,
+                **{f"default_{address_type}_address": OuterRef("pk")},
+            )
+        )
+        for address_type in DEFAULT_ADDRESS_TYPES
+    }
+    return (
+        Address.objects.filter(user_addresses=user)
+        .annotate(**defaults)
+        .order_by("id")
+    )
+
+
+def get_or_create_addresses(items: list[dict[str, Any]]) -> list[Address]:
+    """같은 내용의 주소는 content_hash 인덱스로 찾은 기존 행을 쓰고, 없는 주소만
+    한 번의 INSERT로 만든다. items와 같은 순서로 반환한다."""
+    hashes = [get_address_content_hash(item) for item in items]
+    found = Address.objects.in_bulk(hashes, field_name="content_hash")
+    missing = {
+        content_hash: Address(
+            content_hash=content_hash,
+            **{field: item.get(field, "") for field in ADDRESS_FIELDS},
+        )
+        for content_hash, item in zip(hashes, items)
+        if content_hash not in found
+    }
+    if missing:
+        Address.objects.bulk_create(missing.values(), ignore_conflicts=True)
+        # 다른 요청이 같은 주소를 먼저 만들었을 수 있어 해시로 다시 읽는다.
+        found.update(
+            Address.objects.in_bulk(list(missing), field_name="content_hash")
+        )
+    return [found[content_hash] for content_hash in hashes]
+
+
+def _get_owned_ids(user: User, ids: Iterable[int]) -> set[int]:
+    ids = set(ids)
+    owned = set(
+        UserAddress.objects.filter(
+            user_id=user.pk, address_id__in=ids
+        ).values_list("address_id", flat=True)
+    )
+    if owned != ids:
+        raise AddressNotFoundError
+    return owned
+
+
+def _replace_defaults(user: User, replacements: dict[int, int | None]) -> None:
+    """replacements의 키를 가리키는 기본 주소를 값으로 바꾼다."""
+    User.objects.filter(pk=user.pk).update(
+        **{
+            f"default_{address_type}_address": Case(
+                *(
+                    When(
+                        **{f"default_{address_type}_address": old},
+                        then=new,
+                    )
+                    for old, new in replacements.items()
+                ),
+                default=F(f"default_{address_type}_address"),
+                output_field=Address._meta.pk,
+            )
+            for address_type in DEFAULT_ADDRESS_TYPES
+        },
+        updated_at=timezone.now(),
+    )
+
+
+def _delete_orphans(ids: Iterable[int]) -> int:
+    """어느 사용자도 연결하거나 기본 주소로 쓰지 않는 주소를 지운다.
+
+    Address의 삭제 시그널 때문에 QuerySet.delete()는 행마다 시그널을 보내므로
+    한 번의 DELETE로 지운다.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {Address._meta.db_table} a WHERE a.id = ANY(%s) "
+            f"AND NOT EXISTS (SELECT 1 FROM {UserAddress._meta.db_table} t "
+            "WHERE t.address_id = a.id) "
+            f"AND NOT EXISTS (SELECT 1 FROM {User._meta.db_table} u "
+            "WHERE u.default_shipping_address_id = a.id "
+            "OR u.default_billing_address_id = a.id)",
+            [list(ids)],
+        )
+        return cursor.rowcount
+
+
+def _after_write(user: User, user_ids: Iterable[int] = ()) -> None:
+    """bulk 문장은 시그널을 보내지 않으므로 검색 문서와 읽기 고정을 직접
+    처리한다."""
+    update_user_search_documents(
+        User.objects.filter(pk__in={user.pk, *user_ids})
+    )
+    pin_user_to_primary(user.uuid)
+
+
+def upsert_addresses(user: User, items: list[dict[str, Any]]) -> None:
+    """주소를 내용 해시로 찾거나 만들어 사용자와 연결한다.
+
+    주소 행은 다른 사용자와 공유될 수 있으므로 id가 있는 항목은 행을 직접
+    고치지 않고, 새 내용의 주소로 연결과 기본 주소를 옮긴 뒤 남은 행을 지운다.
+    """
+    with transaction.atomic():
+        replaced = [item["id"] for item in items if item.get("id")]
+        if replaced:
+            _get_owned_ids(user, replaced)
+        addresses = get_or_create_addresses(items)
+        replacements = {
+            item["id"]: address.pk
+            for item, address in zip(items, addresses)
+            if item.get("id") and item["id"] != address.pk
+        }
+        if replacements:
+            UserAddress.objects.filter(
+                user_id=user.pk, address_id__in=replacements
+            ).delete()
+            _replace_defaults(user, replacements)
+        UserAddress.objects.bulk_create(
+            (
+                UserAddress(user_id=user.pk, address_id=address.pk)
+                for address in addresses
+            ),
+            ignore_conflicts=True,
+        )
+        if replacements:
+            _delete_orphans(replacements)
+        _after_write(user)
+
+
+def replace_address(address: Address) -> Address:
+    """내용이 바뀐 주소 행을 직접 저장할 때 copy-on-write로 바꾼다.
+
+    새 내용의 주소를 get_or_create_addresses로 찾거나 만들고, 행을 쓰던
+    사용자의 연결과 기본 주소를 옮긴 뒤 기존 행을 지운다. 어느 사용자의
+    주소를 바꾸는지 알 수 없으므로 두 명 이상이 쓰는 행은 고칠 수 없다.
+    """
+    values = {field: getattr(address, field) for field in ADDRESS_FIELDS}
+    with transaction.atomic():
+        referrers = list(
+            User.objects.filter(
+                Q(addresses=address.pk)
+                | Q(default_shipping_address=address.pk)
+                | Q(default_billing_address=address.pk)
+            )
+            .values_list("uuid", flat=True)
+            .distinct()
+        )
+        if len(referrers) > 1:
+            raise SharedAddressError
+        (replaced,) = get_or_create_addresses([values])
+        _merge_addresses({address.pk: replaced.pk})
+    for user_uuid in referrers:
+        pin_user_to_primary(user_uuid)
+    return replaced
+
+
+def delete_addresses(user: User, ids: Iterable[int]) -> None:
+    """주소록에서 주소를 빼고, 더 이상 쓰이지 않는 주소 행을 지운다."""
+    with transaction.atomic():
+        ids = _get_owned_ids(user, ids)
+        UserAddress.objects.filter(
+            user_id=user.pk, address_id__in=ids
+        ).delete()
+        _replace_defaults(user, dict.fromkeys(ids))
+        _delete_orphans(ids)
+        _after_write(user)
+
+
+def set_default_address(
+    user: User, address_type: str, address_id: int | None
+) -> None:
+    """사용자의 주소록에 있는 주소만 기본 주소로 지정할 수 있다."""
+    queryset = User.objects.filter(pk=user.pk)
+    if address_id is not None:
+        queryset = queryset.filter(addresses=address_id)
+    with transaction.atomic():
+        updated = queryset.update(
+            **{f"default_{address_type}_address": address_id},
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            raise AddressNotFoundError
+    pin_user_to_primary(user.uuid)
+
+
+def deduplicate_address_chunk(
+    after_id: int = 0, chunk_size: int = 1000
+) -> tuple[int | None, int]:
+    """content_hash가 없는 기존 주소를 id 순으로 chunk_size개씩 정리한다.
+
+    같은 내용의 주소가 이미 있으면 연결과 기본 주소를 그 주소로 옮기고 지운다.
+    다음 청크의 시작 id와 합친 주소 수를 반환하며, 남은 주소가 없으면 시작
+    id는 None이다.
+    """
+    with transaction.atomic():
+        chunk = list(
+            Address.objects.filter(pk__gt=after_id, content_hash=None)
+            .order_by("pk")
+            .select_for_update()[:chunk_size]
+        )
+        if not chunk:
+            return None, 0
+        for address in chunk:
+            address.content_hash = get_address_content_hash(
+                {field: getattr(address, field) for field in ADDRESS_FIELDS}
+            )
+        canonical = {
+            content_hash: address.pk
+            for content_hash, address in Address.objects.in_bulk(
+                {address.content_hash for address in chunk},
+                field_name="content_hash",
+            ).items()
+        }
+        kept, merged = [], {}
+        for address in chunk:
+            if address.content_hash in canonical:
+                merged[address.pk] = canonical[address.content_hash]
+            else:
+                canonical[address.content_hash] = address.pk
+                kept.append(address)
+        if merged:
+            _merge_addresses(merged)
+        Address.objects.bulk_update(kept, ["content_hash"])
+    return chunk[-1].pk, len(merged)
+
+
+def _merge_addresses(merged: dict[int, int]) -> None:
+    """중복 주소(키)를 가리키는 연결과 기본 주소를 대표 주소(값)로 옮긴다."""
+    mapping = "unnest(%s::bigint[], %s::bigint[]) m(duplicate, canonical)"
+    params = [list(merged), list(merged.values())]
+    user_addresses = UserAddress._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT DISTINCT user_id FROM {user_addresses} "
+            "WHERE address_id = ANY(%s)",
+            [list(merged)],
+        )
+        user_ids = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            f"INSERT INTO {user_addresses} (user_id, address_id) "
+            f"SELECT DISTINCT t.user_id, m.canonical FROM {user_addresses} t "
+            f"JOIN {mapping} ON t.address_id = m.duplicate "
+            "ON CONFLICT DO NOTHING",
+            params,
+        )
+        cursor.execute(
+            f"DELETE FROM {user_addresses} WHERE address_id = ANY(%s)",
+            [list(merged)],
+        )
+        for address_type in DEFAULT_ADDRESS_TYPES:
+            column = f"default_{address_type}_address_id"
+            cursor.execute(
+                f"UPDATE {User._meta.db_table} u SET {column} = m.canonical "
+                f"FROM {mapping} WHERE u.{column} = m.duplicate",
+                params,
+            )
+        cursor.execute(
+            f"DELETE FROM {Address._meta.db_table} WHERE id = ANY(%s)",
+            [list(merged)],
+        )
+    update_user_search_documents(User.objects.filter(pk__in=user_ids))
@@ -1,6 +1,10 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 
+from ..core.pagination import KeysetChangeList
+from .exceptions import TokenRevocationUnavailableError
 from .models import User
+from .revocation import token_revocations
+from .search import search_users
 
 
 @admin.register(User)
@@ -9,6 +13,8 @@ class UserAdmin(admin.ModelAdmin):
     list_filter = ("is_staff", "is_superuser", "is_active", "groups")
     search_fields = ("email", "first_name", "last_name")
     ordering = ("email",)
+    show_full_result_count = False
+    actions = ("revoke_tokens",)
     filter_horizontal = (
         "groups",
         "user_permissions",
@@ -39,3 +45,22 @@ class UserAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+    def get_changelist(self, request, **kwargs):
+        """COUNT와 OFFSET 없이 키셋으로 페이지를 넘깁니다."""
+        return KeysetChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        """icontains 대신 search_document의 전문 검색 인덱스를 사용합니다."""
+        if not search_term:
+            return queryset, False
+        return search_users(queryset, search_term), False
+
+    @admin.action(description="Revoke all tokens of selected users")
+    def revoke_tokens(self, request, queryset):
+        """선택한 사용자에게 발급된 모든 토큰을 폐기합니다."""
+        try:
+            for user_uuid in queryset.values_list("uuid", flat=True):
+                token_revocations.revoke_user(user_uuid)
+        except TokenRevocationUnavailableError as exc:
+            self.message_user(request, str(exc.detail), messages.ERROR)
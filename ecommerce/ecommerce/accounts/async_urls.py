@@ -0,0 +1,43 @@
+from django.urls import path
+
+from .async_views import (
+    AsyncAccountConfirmationView,
+    AsyncAccountRegisterView,
+    AsyncTokenCreateView,
+    AsyncTokenRefreshView,
+    AsyncTokenRevokeView,
+    AsyncTokenVerifyView,
+)
+from .views import (
+    AddressBookView,
+    AddressBulkDeleteView,
+    AddressDefaultView,
+    UserExportView,
+    UserListView,
+    UserSearchView,
+)
+
+urlpatterns = [
+    path("signup/", AsyncAccountRegisterView.as_view(), name="signup"),
+    path("signin/", AsyncTokenCreateView.as_view(), name="signin"),
+    path("confirm/", AsyncAccountConfirmationView.as_view(), name="confirm"),
+    path("token/verify/", AsyncTokenVerifyView.as_view(), name="token_verify"),
+    path(
+        "token/refresh/", AsyncTokenRefreshView.as_view(), name="token_refresh"
+    ),
+    path("token/revoke/", AsyncTokenRevokeView.as_view(), name="token_revoke"),
+    path("addresses/", AddressBookView.as_view(), name="address_book"),
+    path(
+        "addresses/delete/",
+        AddressBulkDeleteView.as_view(),
+        name="address_bulk_delete",
+    ),
+    path(
+        "addresses/default/",
+        AddressDefaultView.as_view(),
+        name="address_default",
+    ),
+    path("export/", UserExportView.as_view(), name="user_export"),
+    path("users/", UserListView.as_view(), name="user_list"),
+    path("users/search/", UserSearchView.as_view(), name="user_search"),
+]
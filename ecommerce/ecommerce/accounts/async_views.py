@@ -0,0 +1,213 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import APIException, Throttled
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from .authentication import JWTAuthentication
+from .models import User
+from .serializers import (
+    AccountConfirmationSerializer,
+    AccountRegisterSerializer,
+    TokenCreateSerializer,
+    TokenRefreshSerializer,
+    TokenRevokeSerializer,
+    TokenVerifySerializer,
+)
+from .services import AccountService
+from .throttling import (
+    ConfirmEmailRateThrottle,
+    ConfirmRateThrottle,
+    SigninEmailRateThrottle,
+    SigninRateThrottle,
+    SignupEmailRateThrottle,
+    SignupRateThrottle,
+    TokenRefreshRateThrottle,
+)
+
+
+class AsyncAPIView(View):
+    """ASGI에서 사용하는 비동기 계정 API 뷰의 베이스 클래스
+
+    요청은 DRF 시리얼라이저로 검증하고, 응답과 오류는 동기 뷰와 같은
+    형식으로 반환합니다. 로그인과 토큰 뷰는 사용자를 비동기 ORM으로 미리
+    조회해 시리얼라이저에 전달하므로 검증을 이벤트 루프에서 실행합니다.
+    가입과 확인의 검증(비밀번호 규칙 검사, PIN 실패 기록)과 스로틀 확인은
+    스레드에서 실행합니다. 비밀번호 해싱과 브로커 발행은 이벤트 루프를 막지 않도록
+    서비스의 비동기 메서드를 사용합니다.
+    """
+
+    http_method_names = ["post"]
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def post(self, request, *args, **kwargs):
+        request = Request(request, parsers=[JSONParser()])
+        try:
+            await sync_to_async(self.check_throttles)(request)
+            return await self.handle(request)
+        except APIException as exc:
+            return self.handle_exception(exc)
+
+    async def handle(self, request):
+        raise NotImplementedError
+
+    def check_throttles(self, request):
+        for throttle_class in self.throttle_classes:
+            throttle = throttle_class()
+            if not throttle.allow_request(request, self):
+                raise Throttled(throttle.wait())
+
+    async def validate(self, serializer):
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+
+    def handle_exception(self, exc):
+        detail = exc.detail
+        if not isinstance(detail, (list, dict)):
+            detail = {"detail": detail}
+        response = JsonResponse(detail, status=exc.status_code, safe=False)
+        wait = getattr(exc, "wait", None)
+        if wait:
+            response["Retry-After"] = str(int(wait))
+        return response
+
+    def token_response(self, tokens):
+        response = JsonResponse(tokens, status=status.HTTP_200_OK)
+        for token_type in (
+            settings.JWT_ACCESS_TYPE,
+            settings.JWT_REFRESH_TYPE,
+        ):
+            response.set_cookie(
+                key=token_type,
+                value=tokens[token_type],
+                httponly=True,
+                samesite="lax",
+                secure=settings.SECURE_SSL_REDIRECT,
+            )
+        return response
+
+
+class AsyncAccountRegisterView(AsyncAPIView):
+    query_budget = 4
+    throttle_classes = (SignupRateThrottle, SignupEmailRateThrottle)
+
+    async def handle(self, request):
+        serializer = AccountRegisterSerializer(data=request.data)
+        await self.validate(serializer)
+        await AccountService(serializer, request).acreate_user()
+        return JsonResponse(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class AsyncAccountConfirmationView(AsyncAPIView):
+    query_budget = 3
+    throttle_classes = (ConfirmRateThrottle, ConfirmEmailRateThrottle)
+
+    async def handle(self, request):
+        user = (
+            await User.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+            .filter(email=request.data.get("email"))
+            .afirst()
+        )
+        if user is None:
+            return JsonResponse(
+                {"email": "User with this email does not exist."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = AccountConfirmationSerializer(user, data=request.data)
+        await self.validate(serializer)
+        await user.aactivate()
+        return JsonResponse(serializer.data, status=status.HTTP_200_OK)
+
+
+class AsyncTokenCreateView(AsyncAPIView):
+    query_budget = 1
+    throttle_classes = (SigninRateThrottle, SigninEmailRateThrottle)
+
+    async def handle(self, request):
+        context = {}
+        email = request.data.get("email")
+        if isinstance(email, str):
+            context["user"] = await TokenCreateSerializer.aget_user(
+                email.strip()
+            )
+        serializer = TokenCreateSerializer(data=request.data, context=context)
+        serializer.is_valid(raise_exception=True)
+
+        account_service = AccountService(serializer, request)
+        user = await account_service.aget_user()
+        tokens = await account_service.acreate_tokens(user)
+        return self.token_response(tokens)
+
+
+class AsyncTokenInputView(AsyncAPIView):
+    """본문의 토큰을 확인하는 비동기 뷰의 베이스 클래스
+
+    토큰의 사용자는 JWTAuthentication.aauthenticate_credentials로 조회합니다.
+    """
+
+    serializer_class = None
+
+    async def get_serializer(self, request):
+        context = {}
+        token = request.data.get("token")
+        if isinstance(token, str):
+            authenticate = JWTAuthentication().aauthenticate_credentials
+            try:
+                principal = await authenticate(token.strip())
+            except Exception:
+                principal = None
+            context["principal"] = principal
+        return self.serializer_class(data=request.data, context=context)
+
+
+class AsyncTokenVerifyView(AsyncTokenInputView):
+    serializer_class = TokenVerifySerializer
+    query_budget = 1
+
+    async def handle(self, request):
+        serializer = await self.get_serializer(request)
+        serializer.is_valid(raise_exception=True)
+        return JsonResponse(serializer.data, status=status.HTTP_200_OK)
+
+
+class AsyncTokenRefreshView(AsyncTokenInputView):
+    serializer_class = TokenRefreshSerializer
+    query_budget = 1
+    throttle_classes = (TokenRefreshRateThrottle,)
+
+    async def handle(self, request):
+        serializer = await self.get_serializer(request)
+        serializer.is_valid(raise_exception=True)
+
+        account_service = AccountService(serializer, request)
+        tokens = await account_service.arefresh_token()
+        return self.token_response(tokens)
+
+
+class AsyncTokenRevokeView(AsyncTokenInputView):
+    serializer_class = TokenRevokeSerializer
+    query_budget = 1
+
+    async def handle(self, request):
+        serializer = await self.get_serializer(request)
+        serializer.is_valid(raise_exception=True)
+
+        account_service = AccountService(serializer, request)
+        await sync_to_async(account_service.revoke_tokens)()
+        response = HttpResponse(status=status.HTTP_204_NO_CONTENT)
+        for token_type in (
+            settings.JWT_ACCESS_TYPE,
+            settings.JWT_REFRESH_TYPE,
+        ):
+            response.delete_cookie(token_type, samesite="lax")
+        return response
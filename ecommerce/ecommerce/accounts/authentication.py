@@ -2,29 +2,58 @@ from django.conf import settings
 from rest_framework.authentication import BaseAuthentication
 
 from .exceptions import DoesNotExistUserError, JWTInvalidTokenError
-from .jwt import get_user_from_payload, jwt_decode
+from .jwt import aget_user_from_payload, get_user_from_payload, jwt_decode
 from .models import User
 
 
 class JWTAuthentication(BaseAuthentication):
     def authenticate(self, request):
         """토큰을 확인하고 사용자를 반환합니다."""
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
+        token = self._get_token(request)
+        if token is None:
             return None
+        return self.authenticate_credentials(token)
 
-        try:
-            token = auth_header.split(" ")[1]
-            payload = jwt_decode(token)
-        except Exception:
-            raise JWTInvalidTokenError
+    async def aauthenticate(self, request):
+        """비동기 뷰에서 토큰을 확인하고 사용자를 반환합니다."""
+        token = self._get_token(request)
+        if token is None:
+            return None
+        return await self.aauthenticate_credentials(token)
 
+    def authenticate_credentials(self, token: str):
+        """토큰의 사용자와 payload를 반환합니다."""
+        payload = self._decode(token)
         try:
             user = get_user_from_payload(payload)
         except User.DoesNotExist:
             raise DoesNotExistUserError
+        return (user, payload)
+
+    async def aauthenticate_credentials(self, token: str):
+        """사용자를 비동기 ORM으로 조회합니다."""
+        payload = self._decode(token)
+        try:
+            user = await aget_user_from_payload(payload)
+        except User.DoesNotExist:
+            raise DoesNotExistUserError
+        return (user, payload)
 
-        return (user, None)
+    def _get_token(self, request):
+        auth_header = request.headers.get("Authorization")
+        if not auth_header:
+            return None
+
+        try:
+            return auth_header.split(" ")[1]
+        except IndexError:
+            raise JWTInvalidTokenError
+
+    def _decode(self, token: str):
+        try:
+            return jwt_decode(token)
+        except Exception:
+            raise JWTInvalidTokenError
 
     def authenticate_header(self, request):
         """인증 헤더를 반환합니다."""
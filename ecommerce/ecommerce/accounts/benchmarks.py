@@ -0,0 +1,197 @@
+import gc
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hashers
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .authentication import JWTAuthentication
+from .cache import principal_cache
+from .jwt import (
+    create_access_token,
+    create_refresh_token,
+    get_user_from_payload,
+    jwt_decode,
+    jwt_encode,
+    jwt_user_payload,
+)
+from .models import User
+from .serializers import (
+    TokenCreateSerializer,
+    TokenRefreshSerializer,
+    TokenVerifySerializer,
+)
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+BENCHMARK_PASSWORD = "benchmark1234!!"
+
+
+@dataclass
+class BenchmarkCase:
+    """측정할 함수와, 매 호출 전에 측정 밖에서 실행할 준비 함수"""
+
+    name: str
+    func: Callable[[], Any]
+    setup: Callable[[], Any] | None = None
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+
+
+def get_cases(user: User) -> list[BenchmarkCase]:
+    """accounts의 토큰 발급, 검증, 인증 경로를 측정하는 케이스 목록"""
+    access_token = create_access_token(user)
+    payload = jwt_decode(access_token)
+    request = APIRequestFactory().get(
+        "/", HTTP_AUTHORIZATION=f"{settings.AUTH_HEADER_TYPE} {access_token}"
+    )
+    authentication = JWTAuthentication()
+    signin_data = {"email": user.email, "password": BENCHMARK_PASSWORD}
+    refresh_data = {"token": create_refresh_token(user)}
+    verify_data = {"token": access_token}
+
+    cases = [
+        BenchmarkCase("jwt_encode", lambda: jwt_encode(payload)),
+        BenchmarkCase("jwt_decode", lambda: jwt_decode(access_token)),
+        BenchmarkCase(
+            "jwt_user_payload",
+            lambda: jwt_user_payload(
+                user, settings.JWT_ACCESS_TYPE, settings.JWT_TTL_ACCESS
+            ),
+        ),
+        BenchmarkCase(
+            "get_user_from_payload", lambda: get_user_from_payload(payload)
+        ),
+        BenchmarkCase(
+            "get_user_from_payload[cold]",
+            lambda: get_user_from_payload(payload),
+            setup=lambda: principal_cache.delete(user.uuid),
+        ),
+        BenchmarkCase(
+            "JWTAuthentication.authenticate",
+            lambda: authentication.authenticate(Request(request)),
+        ),
+        BenchmarkCase(
+            "TokenCreateSerializer.is_valid",
+            lambda: TokenCreateSerializer(data=signin_data).is_valid(
+                raise_exception=True
+            ),
+        ),
+        BenchmarkCase(
+            "TokenRefreshSerializer.is_valid",
+            lambda: TokenRefreshSerializer(data=refresh_data).is_valid(
+                raise_exception=True
+            ),
+        ),
+        BenchmarkCase(
+            "TokenVerifySerializer.is_valid",
+            lambda: TokenVerifySerializer(data=verify_data).is_valid(
+                raise_exception=True
+            ),
+        ),
+    ]
+    for hasher in get_hashers():
+        try:
+            encoded = hasher.encode(BENCHMARK_PASSWORD, hasher.salt())
+        except ValueError:
+            # bcrypt처럼 선택 라이브러리가 설치되지 않은 해셔는 건너뛴다.
+            continue
+        cases.append(
+            BenchmarkCase(
+                f"check_password[{hasher.algorithm}]",
+                lambda encoded=encoded: check_password(
+                    BENCHMARK_PASSWORD, encoded
+                ),
+            )
+        )
+    return cases
+
+
+def _call(case: BenchmarkCase) -> int:
+    if case.setup:
+        case.setup()
+    started_at = time.perf_counter_ns()
+    case.func()
+    return time.perf_counter_ns() - started_at
+
+
+def run_case(
+    case: BenchmarkCase, duration: float, min_iterations: int = 20
+) -> BenchmarkResult:
+    """duration초 동안, 최소 min_iterations번 호출하며 호출마다 시간을 잰다.
+
+    duration의 10% 동안 먼저 워밍업하고, 측정 중에는 GC를 멈춘다. ops/sec은
+    준비 함수를 뺀 호출 시간의 합으로 계산한다.
+    """
+    _call(case)
+    deadline = time.perf_counter() + duration / 10
+    while time.perf_counter() < deadline:
+        _call(case)
+
+    samples = []
+    gc.collect()
+    gc.disable()
+    try:
+        deadline = time.perf_counter() + duration
+        while len(samples) < min_iterations or time.perf_counter() < deadline:
+            samples.append(_call(case))
+    finally:
+        gc.enable()
+
+    quantiles = statistics.quantiles(samples, n=100)
+    return BenchmarkResult(
+        name=case.name,
+        iterations=len(samples),
+        ops_per_sec=len(samples) / (sum(samples) / 1e9),
+        p50_us=quantiles[49] / 1000,
+        p99_us=quantiles[98] / 1000,
+    )
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(
+    results: list[BenchmarkResult], path: Path = BASELINE_PATH
+) -> None:
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.name] = {
+            key: round(value, 2) if isinstance(value, float) else value
+            for key, value in asdict(result).items()
+            if key != "name"
+        }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """p50이 기준값보다 threshold 비율 넘게 느려진 케이스 이름 목록"""
+    return [
+        result.name
+        for result in results
+        if result.name in baseline
+        and result.p50_us > baseline[result.name]["p50_us"] * (1 + threshold)
+    ]
@@ -0,0 +1,197 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from ..core.db.routers import pin_if_user_pinned
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_FIELDS = (
+    "id",
+    "uuid",
+    "email",
+    "username",
+    "first_name",
+    "last_name",
+    "phone_number",
+    "jwt_token_key",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+)
+
+
+class LocalTTLCache:
+    """프로세스 내 LRU 캐시. 항목은 TTL이 지나면 만료됩니다."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class PrincipalCache:
+    """JWT 인증에 필요한 사용자 정보를 2단계(프로세스 내 LRU, 공유 캐시)로
+    캐싱합니다.
+
+    항목은 사용자 uuid로 저장되고 조회 시 jwt_token_key로 검증됩니다.
+    토큰 키가 일치하지 않으면 캐시 미스로 처리하여 DB에서 다시 확인합니다.
+    """
+
+    key_prefix = "accounts:principal"
+
+    def __init__(self, maxsize: int, local_ttl: float, ttl: int) -> None:
+        self.local = LocalTTLCache(maxsize, local_ttl)
+        self.ttl = ttl
+
+    def _shared_key(self, user_uuid: str) -> str:
+        return f"{self.key_prefix}:{user_uuid}"
+
+    def _get_values(self, user_uuid: str) -> dict[str, Any] | None:
+        values = self.local.get(user_uuid)
+        if values is not None:
+            return values
+        try:
+            values = cache.get(self._shared_key(user_uuid))
+        except Exception:
+            logger.warning("Principal cache read failed", exc_info=True)
+            return None
+        if values is not None:
+            self.local.set(user_uuid, values)
+        return values
+
+    async def _aget_values(self, user_uuid: str) -> dict[str, Any] | None:
+        values = self.local.get(user_uuid)
+        if values is not None:
+            return values
+        try:
+            values = await cache.aget(self._shared_key(user_uuid))
+        except Exception:
+            logger.warning("Principal cache read failed", exc_info=True)
+            return None
+        if values is not None:
+            self.local.set(user_uuid, values)
+        return values
+
+    def _set_values(self, user_uuid: str, values: dict[str, Any]) -> None:
+        self.local.set(user_uuid, values)
+        try:
+            cache.set(self._shared_key(user_uuid), values, self.ttl)
+        except Exception:
+            logger.warning("Principal cache write failed", exc_info=True)
+
+    async def _aset_values(
+        self, user_uuid: str, values: dict[str, Any]
+    ) -> None:
+        self.local.set(user_uuid, values)
+        try:
+            await cache.aset(self._shared_key(user_uuid), values, self.ttl)
+        except Exception:
+            logger.warning("Principal cache write failed", exc_info=True)
+
+    def get(self, user_uuid: str, jwt_token_key: str) -> User | None:
+        """캐시에서 토큰 키가 일치하는 활성 사용자를 가져옵니다."""
+        values = self._get_values(str(user_uuid))
+        if values is None or values["jwt_token_key"] != jwt_token_key:
+            return None
+        return self._build_user(values)
+
+    def load(self, user_uuid: str) -> User | None:
+        """DB에서 활성 사용자를 조회하고 캐시에 저장합니다."""
+        pin_if_user_pinned(user_uuid)
+        values = (
+            User.objects.filter(uuid=user_uuid, is_active=True)
+            .values(*PRINCIPAL_FIELDS)
+            .first()
+        )
+        if values is None:
+            return None
+        self._set_values(str(user_uuid), values)
+        return self._build_user(values)
+
+    async def aget(self, user_uuid: str, jwt_token_key: str) -> User | None:
+        values = await self._aget_values(str(user_uuid))
+        if values is None or values["jwt_token_key"] != jwt_token_key:
+            return None
+        return self._build_user(values)
+
+    async def aload(self, user_uuid: str) -> User | None:
+        await sync_to_async(pin_if_user_pinned)(user_uuid)
+        values = (
+            await User.objects.filter(uuid=user_uuid, is_active=True)
+            .values(*PRINCIPAL_FIELDS)
+            .afirst()
+        )
+        if values is None:
+            return None
+        await self._aset_values(str(user_uuid), values)
+        return self._build_user(values)
+
+    def delete(self, user_uuid: UUID | str) -> None:
+        """사용자의 캐시 항목을 무효화합니다."""
+        self.local.delete(str(user_uuid))
+        try:
+            cache.delete(self._shared_key(str(user_uuid)))
+        except Exception:
+            logger.warning("Principal cache delete failed", exc_info=True)
+
+    def clear(self) -> None:
+        """프로세스 내 캐시를 비웁니다."""
+        self.local.clear()
+
+    @staticmethod
+    def _build_user(values: dict[str, Any]) -> User:
+        field_names = [
+            field.attname
+            for field in User._meta.concrete_fields
+            if field.attname in values
+        ]
+        return User.from_db(
+            DEFAULT_DB_ALIAS,
+            field_names,
+            [values[field_name] for field_name in field_names],
+        )
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    local_ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+)
@@ -1,25 +1,263 @@
+import json
+import logging
+import os
+import smtplib
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+from uuid import uuid4
+
+from celery.signals import worker_process_shutdown
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
 from django.utils import timezone
+from redis.exceptions import RedisError
 
 from ..celeryconf import app
+from ..core.redis import get_redis_client
 from .models import User
 
+logger = logging.getLogger(__name__)
+
+# 처리 목록에 남은 메시지를 대기열로 되돌리고 처리 목록을 지웁니다.
+RECOVER_SCRIPT = """
+local items = redis.call("LRANGE", KEYS[1], 0, -1)
+if #items > 0 then
+    redis.call("RPUSH", KEYS[2], unpack(items))
+end
+redis.call("DEL", KEYS[1])
+redis.call("ZREM", KEYS[3], KEYS[1])
+return #items
+"""
+
+
+@lru_cache(maxsize=None)
+def get_recover_script():
+    return get_redis_client().register_script(RECOVER_SCRIPT)
+
+
+def confirmation_email_keys() -> tuple[str, str, str]:
+    """배치 대기열, 플러시 잠금, 처리 목록 집합의 Redis 키를 반환합니다."""
+    queue = settings.EMAIL_BATCH_QUEUE_KEY
+    return queue, f"{queue}:flush", f"{queue}:processing"
+
+
+class PersistentMailConnection:
+    """워커 프로세스마다 하나의 메일 연결을 열어 두고 재사용합니다.
+
+    작업마다 SMTP(TLS) 세션을 새로 맺지 않도록 연결은 워커 프로세스가 끝날
+    때까지 유지되고, 서버가 연결을 끊으면 다음 전송에서 다시 엽니다.
+    """
+
+    def __init__(self) -> None:
+        self._connection = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._connection is None or self._pid != os.getpid():
+                self._connection = get_connection(fail_silently=False)
+                self._pid = os.getpid()
+            self._connection.open()
+            return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:
+            logger.debug("Mail connection close failed", exc_info=True)
+
+
+mail_connection = PersistentMailConnection()
+
+
+@worker_process_shutdown.connect
+def close_mail_connection(**kwargs: Any) -> None:
+    mail_connection.close()
+
 
 def send_account_confirmation_email(user: User, pin: str) -> None:
     """지정된 사용자에 대한 계정 확인 이메일 전송을 트리거합니다."""
-    _send_account_confirmation_email.delay(user.email, pin)
+    enqueue_account_confirmation_email(user.email, pin)
     user.pin_sent_at = timezone.now()
     user.save(update_fields=["pin_sent_at"])
 
 
-@app.task
-def _send_account_confirmation_email(email: str, pin: str) -> None:
-    """실제로 계정 확인 이메일을 전송합니다."""
-    send_mail(
+def enqueue_account_confirmation_email(email: str, pin: str) -> None:
+    """배치 전송이 켜져 있으면 대기열에 추가하고, 아니면 바로 작업을 보냅니다.
+
+    대기열의 메시지는 EMAIL_BATCH_WINDOW초가 지나거나 EMAIL_BATCH_SIZE개가
+    쌓이면 한 번에 전송됩니다.
+    """
+    client = get_redis_client()
+    if not settings.EMAIL_BATCH_ENABLED or client is None:
+        _send_account_confirmation_email.delay(email, pin)
+        return
+
+    queue, flush_lock, _ = confirmation_email_keys()
+    try:
+        pending = client.rpush(queue, json.dumps([email, pin]))
+        if pending >= settings.EMAIL_BATCH_SIZE:
+            _flush_account_confirmation_emails.delay()
+        elif client.set(
+            flush_lock,
+            1,
+            nx=True,
+            px=int(settings.EMAIL_BATCH_WINDOW * 1000),
+        ):
+            _flush_account_confirmation_emails.apply_async(
+                countdown=settings.EMAIL_BATCH_WINDOW
+            )
+    except RedisError:
+        logger.warning("Confirmation email batching failed", exc_info=True)
+        _send_account_confirmation_email.delay(email, pin)
+
+
+def _build_account_confirmation_email(email: str, pin: str) -> EmailMessage:
+    return EmailMessage(
         subject="Verify your account",
-        message=f"Enter this code to verify your account: {pin}",
+        body=f"Enter this code to verify your account: {pin}",
         from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[email],
-        fail_silently=False,
+        to=[email],
+    )
+
+
+def _send_message(message: EmailMessage) -> None:
+    """열려 있는 연결로 메시지를 보내고, 연결이 끊겼으면 한 번 다시 엽니다."""
+    try:
+        mail_connection.get().send_messages([message])
+    except smtplib.SMTPServerDisconnected:
+        mail_connection.close()
+        mail_connection.get().send_messages([message])
+
+
+def _is_permanent_failure(exc: Exception) -> bool:
+    """수신자가 거부되었거나 5xx 응답이면 다시 보내도 실패합니다."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return True
+    return (
+        isinstance(exc, smtplib.SMTPResponseException)
+        and 500 <= exc.smtp_code < 600
+    )
+
+
+@app.task(bind=True, max_retries=settings.EMAIL_MAX_RETRIES)
+def _send_account_confirmation_email(self, email: str, pin: str) -> None:
+    """실제로 계정 확인 이메일을 전송합니다.
+
+    일시적인 실패는 배치 전송과 같은 간격으로 다시 시도하고, 수신자 거부나
+    5xx 응답은 다시 시도하지 않습니다.
+    """
+    try:
+        _send_message(_build_account_confirmation_email(email, pin))
+    except (smtplib.SMTPException, OSError) as exc:
+        if _is_permanent_failure(exc):
+            raise
+        raise self.retry(
+            exc=exc,
+            countdown=settings.EMAIL_RETRY_DELAY * 2**self.request.retries,
+        )
+
+
+@app.task(
+    bind=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    time_limit=settings.EMAIL_FLUSH_TIMEOUT,
+)
+def _flush_account_confirmation_emails(self) -> dict[str, Any]:
+    """대기 중인 계정 확인 이메일을 하나의 연결로 전송합니다.
+
+    메시지는 플러시마다 만드는 처리 목록으로 옮긴 뒤 보내고, 전송하거나
+    대기열에 다시 넣은 뒤에야 처리 목록에서 지웁니다. 워커가 중간에 죽으면
+    다시 전달된 같은 작업이나 EMAIL_FLUSH_TIMEOUT초 뒤의 다른 플러시가 남은
+    메시지를 대기열로 되돌립니다.
+
+    메시지별 실패는 기록하고 나머지 메시지는 계속 전송합니다. 일시적인
+    실패는 대기열에 다시 넣고 EMAIL_RETRY_DELAY초부터 두 배씩 늘어나는
+    간격으로 다시 플러시하며, EMAIL_MAX_RETRIES번 넘게 실패하면 버립니다.
+    """
+    client = get_redis_client()
+    if client is None:
+        return {"sent": 0, "failed": [], "retrying": []}
+
+    queue, flush_lock, processing_set = confirmation_email_keys()
+    # 잠금을 먼저 지워 전송 중에 들어온 메시지가 새 플러시를 예약하게 합니다.
+    client.delete(flush_lock)
+    processing = f"{processing_set}:{self.request.id or uuid4().hex}"
+    _recover_account_confirmation_emails(client, processing)
+    with client.pipeline() as pipe:
+        pipe.zadd(processing_set, {processing: time.time()})
+        for _ in range(settings.EMAIL_BATCH_SIZE):
+            pipe.lmove(queue, processing, "LEFT", "RIGHT")
+        pipe.llen(queue)
+        _, *moved, remaining = pipe.execute()
+    items = [item for item in moved if item is not None]
+    if remaining:
+        _flush_account_confirmation_emails.delay()
+
+    sent = 0
+    failed = []
+    retrying = []
+    attempts = 0
+    for item in items:
+        email, pin, *rest = json.loads(item)
+        previous_attempts = rest[0] if rest else 0
+        with client.pipeline() as pipe:
+            try:
+                _send_message(_build_account_confirmation_email(email, pin))
+            except Exception as exc:
+                logger.warning(
+                    "Confirmation email delivery failed", exc_info=True
+                )
+                if (
+                    _is_permanent_failure(exc)
+                    or previous_attempts >= settings.EMAIL_MAX_RETRIES
+                ):
+                    failed.append(email)
+                else:
+                    retrying.append(email)
+                    attempts = max(attempts, previous_attempts + 1)
+                    pipe.rpush(
+                        queue, json.dumps([email, pin, previous_attempts + 1])
+                    )
+            else:
+                sent += 1
+            pipe.lpop(processing)
+            pipe.execute()
+    with client.pipeline() as pipe:
+        pipe.delete(processing)
+        pipe.zrem(processing_set, processing)
+        pipe.execute()
+
+    if failed:
+        logger.error(
+            "%d of %d confirmation emails failed", len(failed), len(items)
+        )
+    if retrying:
+        _flush_account_confirmation_emails.apply_async(
+            countdown=settings.EMAIL_RETRY_DELAY * 2 ** (attempts - 1)
+        )
+    return {"sent": sent, "failed": failed, "retrying": retrying}
+
+
+def _recover_account_confirmation_emails(client, processing: str) -> None:
+    """이 작업의 이전 전달이나 오래된 플러시가 남긴 메시지를 되돌립니다."""
+    queue, _, processing_set = confirmation_email_keys()
+    stale = client.zrangebyscore(
+        processing_set, "-inf", time.time() - settings.EMAIL_FLUSH_TIMEOUT
     )
+    recovered = 0
+    for key in {processing, *(key.decode() for key in stale)}:
+        recovered += get_recover_script()(keys=[key, queue, processing_set])
+    if recovered:
+        logger.warning(
+            "Recovered %d confirmation emails from interrupted flushes",
+            recovered,
+        )
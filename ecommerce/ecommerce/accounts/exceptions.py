@@ -7,6 +7,11 @@ class PasswordValidationError(serializers.ValidationError):
     default_code = "password_validation_error"
 
 
+class DuplicateEmailError(serializers.ValidationError):
+    default_detail = {"email": [_("user with this email already exists.")]}
+    default_code = "unique"
+
+
 class InvalidPinError(serializers.ValidationError):
     default_detail = _("Invalid PIN")
     default_code = "invalid_pin"
@@ -58,3 +63,34 @@ class DoesNotExistUserError(exceptions.AuthenticationFailed):
     default_detail = _("User does not exist")
     default_code = "does_not_exist_user"
     status_code = status.HTTP_401_UNAUTHORIZED
+
+
+class RefreshTokenReusedError(exceptions.AuthenticationFailed):
+    default_detail = _("Refresh token has already been used")
+    default_code = "refresh_token_reused"
+    status_code = status.HTTP_401_UNAUTHORIZED
+
+
+class PasswordHashingBusyError(exceptions.APIException):
+    default_detail = _("Server is busy. Please try again later.")
+    default_code = "password_hashing_busy"
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    wait = 1
+
+
+class TokenRevocationUnavailableError(exceptions.APIException):
+    default_detail = _("Could not revoke the token. Please try again later.")
+    default_code = "token_revocation_unavailable"
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    wait = 1
+
+
+class AddressNotFoundError(exceptions.NotFound):
+    default_detail = _("Address not found")
+    default_code = "address_not_found"
+
+
+class SharedAddressError(exceptions.APIException):
+    default_detail = _("Address is shared and cannot be changed in place.")
+    default_code = "shared_address"
+    status_code = status.HTTP_409_CONFLICT
@@ -0,0 +1,130 @@
+import csv
+import json
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import ADDRESS_CONTENT_FIELDS, Address, User
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_USER_FIELDS = (
+    "id",
+    "uuid",
+    "email",
+    "username",
+    "first_name",
+    "last_name",
+    "phone_number",
+    "language_code",
+    "is_active",
+    "is_staff",
+    "date_joined",
+    "last_login",
+)
+EXPORT_ADDRESS_FIELDS = ADDRESS_CONTENT_FIELDS
+DEFAULT_ADDRESS_ROLES = {
+    "shipping": "default_shipping_address",
+    "billing": "default_billing_address",
+}
+
+
+def get_export_database(replica: bool = False) -> str:
+    """레플리카가 활성화되어 있을 때만 레플리카에서 읽는다."""
+    if replica and settings.DATABASE_REPLICA_ENABLED:
+        return settings.DATABASE_CONNECTION_REPLICA_NAME
+    return settings.DATABASE_CONNECTION_DEFAULT_NAME
+
+
+def iter_users(using: str, chunk_size: int = 2000) -> Iterator[dict]:
+    """사용자와 주소를 서버 측 커서로 chunk_size씩 읽어 한 명씩 반환한다.
+
+    주소 M2M은 청크마다 한 번의 쿼리로 미리 가져오므로 메모리 사용량은
+    전체 사용자 수가 아니라 chunk_size에 비례한다.
+    """
+    queryset = (
+        User.objects.using(using)
+        .select_related(*DEFAULT_ADDRESS_ROLES.values())
+        .prefetch_related("addresses")
+        .order_by("pk")
+    )
+    for user in queryset.iterator(chunk_size=chunk_size):
+        record = {field: getattr(user, field) for field in EXPORT_USER_FIELDS}
+        for role, attr in DEFAULT_ADDRESS_ROLES.items():
+            record[f"default_{role}_address"] = _address(getattr(user, attr))
+        record["addresses"] = [
+            _address(address) for address in user.addresses.all()
+        ]
+        yield record
+
+
+def _address(address: Address | None) -> dict[str, Any] | None:
+    if address is None:
+        return None
+    return {
+        "id": address.pk,
+        **{field: getattr(address, field) for field in EXPORT_ADDRESS_FIELDS},
+    }
+
+
+def render_ndjson(records: Iterable[dict]) -> Iterator[str]:
+    for record in records:
+        yield json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def render_csv(records: Iterable[dict]) -> Iterator[str]:
+    """기본 배송지/청구지는 import_users와 같은 shipping_/billing_ 열로,
+    나머지 주소는 JSON 열로 내보낸다."""
+    address_columns = [
+        f"{role}_{field}"
+        for role in DEFAULT_ADDRESS_ROLES
+        for field in EXPORT_ADDRESS_FIELDS
+    ]
+    writer = csv.writer(_Echo())
+    yield writer.writerow([*EXPORT_USER_FIELDS, *address_columns, "addresses"])
+    for record in records:
+        row = [record[field] for field in EXPORT_USER_FIELDS]
+        for role in DEFAULT_ADDRESS_ROLES:
+            address = record[f"default_{role}_address"] or {}
+            row.extend(
+                address.get(field, "") for field in EXPORT_ADDRESS_FIELDS
+            )
+        row.append(json.dumps(record["addresses"], cls=DjangoJSONEncoder))
+        yield writer.writerow(row)
+
+
+RENDERERS = {"ndjson": render_ndjson, "csv": render_csv}
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def export_users(
+    export_format: str, replica: bool = False, chunk_size: int = 2000
+) -> Iterator[str]:
+    records = iter_users(get_export_database(replica), chunk_size)
+    return RENDERERS[export_format](records)
+
+
+async def aexport_users(
+    export_format: str, replica: bool = False, chunk_size: int = 2000
+) -> AsyncIterator[str]:
+    """ASGI에서 버퍼링 없이 스트리밍하도록 export_users를 비동기로 감싼다.
+
+    동기 이터레이터를 주면 ASGI 핸들러가 전체를 리스트로 읽은 뒤 보내므로,
+    요청의 동기 스레드(같은 DB 연결)에서 chunk_size줄씩 꺼내 보낸다.
+    """
+    lines = export_users(export_format, replica, chunk_size)
+    next_lines = sync_to_async(
+        lambda: "".join(islice(lines, chunk_size)), thread_sensitive=True
+    )
+    try:
+        while content := await next_lines():
+            yield content
+    finally:
+        await sync_to_async(lines.close, thread_sensitive=True)()
@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class CalibratedArgon2PasswordHasher(Argon2PasswordHasher):
+    """`calibrate_argon2` 명령으로 측정한 비용 파라미터를 사용하는 Argon2 해셔
+
+    알고리즘 이름은 그대로이므로 기존 argon2 해시도 검증할 수 있고,
+    파라미터가 다른 해시는 must_update로 판별되어 로그인 시 갱신됩니다.
+    """
+
+    time_cost = settings.ARGON2_TIME_COST
+    memory_cost = settings.ARGON2_MEMORY_COST
+    parallelism = settings.ARGON2_PARALLELISM
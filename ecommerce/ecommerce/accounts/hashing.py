@@ -0,0 +1,236 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+import django
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.db import connection
+from django.dispatch import Signal
+
+from ..core.tracing import traced
+from .exceptions import PasswordHashingBusyError
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+# operation, queue_wait, compute_time 인자와 함께 전송됩니다.
+password_hashed = Signal()
+
+
+def _timed(func: Callable, *args: Any) -> tuple[Any, float]:
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started_at
+
+
+def _make_password(password: str) -> str:
+    return hashers.make_password(password)
+
+
+def _verify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    must_update = False
+
+    def setter(raw_password: str) -> None:
+        nonlocal must_update
+        must_update = True
+
+    is_correct = hashers.check_password(password, encoded, setter=setter)
+    return is_correct, must_update
+
+
+class PasswordHashingExecutor:
+    """비밀번호 해싱을 전용 프로세스 풀에서 실행합니다.
+
+    실행 중이거나 대기 중인 작업 수가 workers + max_pending을 넘으면
+    요청을 기다리게 하지 않고 즉시 PasswordHashingBusyError를 발생시킵니다.
+    workers가 0이면 요청 스레드에서 직접 해싱합니다.
+    """
+
+    def __init__(self, workers: int, max_pending: int, timeout: float):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(workers, 1) + max_pending)
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pid: int | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=django.setup,
+                )
+                self._pid = os.getpid()
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _acquire(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusyError
+
+    def _submit(self, func: Callable, *args: Any) -> Future:
+        """풀에 작업을 넣고, 작업이 끝나면 슬롯을 반납합니다.
+
+        호출자가 시간 초과로 기다림을 멈춰도 프로세스에서 계산 중인 작업은
+        끝날 때까지 슬롯을 차지합니다.
+        """
+        self._acquire()
+        try:
+            future = self._get_pool().submit(_timed, func, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._reset_pool()
+            raise PasswordHashingBusyError
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _execute(self, func: Callable, *args: Any) -> tuple[Any, float]:
+        if not self.workers:
+            self._acquire()
+            try:
+                return _timed(func, *args)
+            finally:
+                self._slots.release()
+        future = self._submit(func, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise PasswordHashingBusyError
+        except BrokenProcessPool:
+            self._reset_pool()
+            raise PasswordHashingBusyError
+
+    async def _aexecute(self, func: Callable, *args: Any) -> tuple[Any, float]:
+        if not self.workers:
+            self._acquire()
+            try:
+                return await sync_to_async(_timed, thread_sensitive=False)(
+                    func, *args
+                )
+            finally:
+                self._slots.release()
+        future = self._submit(func, *args)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), self.timeout
+            )
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise PasswordHashingBusyError
+        except BrokenProcessPool:
+            self._reset_pool()
+            raise PasswordHashingBusyError
+
+    def run(self, func: Callable, *args: Any) -> Any:
+        """해싱 함수를 실행하고 대기 시간과 계산 시간을 기록합니다."""
+        submitted_at = time.perf_counter()
+        result, compute_time = self._execute(func, *args)
+        self._record(func, time.perf_counter() - submitted_at, compute_time)
+        return result
+
+    async def arun(self, func: Callable, *args: Any) -> Any:
+        """이벤트 루프를 막지 않고 해싱 함수를 실행합니다."""
+        submitted_at = time.perf_counter()
+        result, compute_time = await self._aexecute(func, *args)
+        self._record(func, time.perf_counter() - submitted_at, compute_time)
+        return result
+
+    def _record(
+        self, func: Callable, elapsed: float, compute_time: float
+    ) -> None:
+        queue_wait = elapsed - compute_time
+        logger.debug(
+            "%s: queue_wait=%.4fs compute_time=%.4fs",
+            func.__name__,
+            queue_wait,
+            compute_time,
+        )
+        password_hashed.send(
+            sender=self.__class__,
+            operation=func.__name__.lstrip("_"),
+            queue_wait=queue_wait,
+            compute_time=compute_time,
+        )
+
+
+executor = PasswordHashingExecutor(
+    workers=settings.PASSWORD_HASHING_WORKERS,
+    max_pending=settings.PASSWORD_HASHING_MAX_PENDING,
+    timeout=settings.PASSWORD_HASHING_TIMEOUT,
+)
+
+
+@traced()
+def make_password(password: str) -> str:
+    """비밀번호를 해싱합니다."""
+    return executor.run(_make_password, password)
+
+
+@traced()
+def verify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    """비밀번호가 일치하는지와 해시를 갱신해야 하는지를 반환합니다."""
+    return executor.run(_verify_password, password, encoded)
+
+
+@traced()
+async def amake_password(password: str) -> str:
+    return await executor.arun(_make_password, password)
+
+
+@traced()
+async def averify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    return await executor.arun(_verify_password, password, encoded)
+
+
+_rehash_pool = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="password-rehash"
+)
+_rehash_slots = threading.BoundedSemaphore(
+    max(settings.PASSWORD_HASHING_MAX_PENDING, 1)
+)
+
+
+def _rehash_password(user_pk: int, password: str, encoded: str) -> None:
+    try:
+        new_encoded = make_password(password)
+        User.objects.filter(pk=user_pk, password=encoded).update(
+            password=new_encoded
+        )
+    except PasswordHashingBusyError:
+        logger.info("Skipped password rehash for user %s", user_pk)
+    finally:
+        connection.close()
+
+
+def rehash_password_later(user: User, password: str) -> None:
+    """오래된 파라미터나 해셔로 저장된 해시를 백그라운드에서 갱신합니다.
+
+    로그인 응답을 지연시키지 않으며, 여유가 없으면 다음 로그인에서 다시
+    시도합니다. 그 사이 비밀번호가 바뀌었다면 갱신하지 않습니다.
+    """
+    if not _rehash_slots.acquire(blocking=False):
+        return
+    future = _rehash_pool.submit(
+        _rehash_password, user.pk, password, user.password
+    )
+    future.add_done_callback(lambda _: _rehash_slots.release())
@@ -1,15 +1,24 @@
 from typing import Any
+from uuid import uuid4
 
 import jwt
 from django.conf import settings
 from django.utils.timezone import datetime, timedelta
 
+from ..core.metrics import JWT_DURATION
+from ..core.tracing import traced
+from .cache import principal_cache
 from .exceptions import (
     JWTDecodeError,
     JWTInvalidTokenError,
     JWTTokenSignatureExpiredError,
 )
+from .keys import get_key_set
 from .models import User
+from .revocation import token_revocations
+
+_encode_duration = JWT_DURATION.labels("encode")
+_decode_duration = JWT_DURATION.labels("decode")
 
 
 def jwt_base_payload(exp_delta: timedelta) -> dict[str, Any]:
@@ -17,18 +26,34 @@ def jwt_base_payload(exp_delta: timedelta) -> dict[str, Any]:
     return {"iat": utc_now, "exp": utc_now + exp_delta}
 
 
+@traced()
 def jwt_encode(payload: dict[str, Any]) -> str:
-    return jwt.encode(
-        payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
+    key_set = get_key_set()
+    with _encode_duration.time():
+        return jwt.encode(
+            payload,
+            key_set.signing_key,
+            algorithm=key_set.algorithm,
+            headers={"kid": key_set.kid} if key_set.kid else None,
+        )
 
 
+@traced()
 def jwt_decode(token: str) -> dict[str, Any]:
-    return jwt.decode(
-        token,
-        settings.JWT_SECRET_KEY,
-        algorithms=settings.JWT_ALGORITHM,
-    )
+    """비대칭 키를 쓰면 kid 헤더가 가리키는 검증 키와 그 알고리즘만
+    허용한다."""
+    key_set = get_key_set()
+    with _decode_duration.time():
+        if not key_set.is_asymmetric:
+            return jwt.decode(
+                token, key_set.signing_key, algorithms=[key_set.algorithm]
+            )
+        key = key_set.get_verification_key(
+            jwt.get_unverified_header(token).get("kid")
+        )
+        if key is None:
+            raise jwt.InvalidTokenError("Unknown signing key")
+        return jwt.decode(token, key.key, algorithms=[key.algorithm])
 
 
 def jwt_user_payload(
@@ -40,6 +65,7 @@ def jwt_user_payload(
     payload = jwt_base_payload(exp_delta)
     payload.update(
         {
+            "jti": uuid4().hex,
             "token": user.jwt_token_key,
             "email": user.email,
             "type": token_type,
@@ -90,9 +116,35 @@ def get_payload(token: str) -> dict[str, Any]:
 
 
 def get_user_from_payload(payload: dict[str, Any]) -> User:
-    """JWT 토큰의 payload로부터 유저를 가져온다."""
-    user = User.objects.filter(email=payload["email"], is_active=True).first()
+    """JWT 토큰의 payload로부터 유저를 가져온다.
+
+    폐기된 토큰은 거부하고, 캐시에 토큰 키가 일치하는 사용자가 없을 때만 DB를
+    조회한다.
+    """
+    user_uuid = payload.get("user_id")
     jwt_token_key = payload.get("token")
-    if not user or not jwt_token_key or user.jwt_token_key != jwt_token_key:
+    if not user_uuid or not jwt_token_key:
+        raise JWTInvalidTokenError
+    if token_revocations.is_revoked(payload):
+        raise JWTInvalidTokenError
+    user = principal_cache.get(user_uuid, jwt_token_key)
+    if user is None:
+        user = principal_cache.load(user_uuid)
+    if not user or user.jwt_token_key != jwt_token_key:
+        raise JWTInvalidTokenError
+    return user
+
+
+async def aget_user_from_payload(payload: dict[str, Any]) -> User:
+    user_uuid = payload.get("user_id")
+    jwt_token_key = payload.get("token")
+    if not user_uuid or not jwt_token_key:
+        raise JWTInvalidTokenError
+    if await token_revocations.ais_revoked(payload):
+        raise JWTInvalidTokenError
+    user = await principal_cache.aget(user_uuid, jwt_token_key)
+    if user is None:
+        user = await principal_cache.aload(user_uuid)
+    if not user or user.jwt_token_key != jwt_token_key:
         raise JWTInvalidTokenError
     return user
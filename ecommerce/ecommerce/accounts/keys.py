@@ -0,0 +1,133 @@
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm
+
+ASYMMETRIC_ALGORITHMS = ("EdDSA", "ES256")
+
+
+@dataclass(frozen=True)
+class VerificationKey:
+    kid: str
+    algorithm: str
+    key: Any
+    jwk: dict[str, Any]
+
+
+def _get_algorithm(public_key) -> str:
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    if isinstance(public_key, ec.EllipticCurvePublicKey) and isinstance(
+        public_key.curve, ec.SECP256R1
+    ):
+        return "ES256"
+    raise ImproperlyConfigured(
+        "JWT keys must be Ed25519 (EdDSA) or P-256 (ES256) keys."
+    )
+
+
+def build_verification_key(public_key) -> VerificationKey:
+    """kid는 공개 키의 JWK 썸네일(RFC 7638)이라 키 파일만으로 정해진다."""
+    algorithm = _get_algorithm(public_key)
+    jwk_algorithm = OKPAlgorithm if algorithm == "EdDSA" else ECAlgorithm
+    jwk = jwk_algorithm.to_jwk(public_key, as_dict=True)
+    required = {
+        name: jwk[name] for name in ("crv", "kty", "x", "y") if name in jwk
+    }
+    digest = hashlib.sha256(
+        json.dumps(required, separators=(",", ":"), sort_keys=True).encode()
+    ).digest()
+    kid = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+    return VerificationKey(
+        kid=kid,
+        algorithm=algorithm,
+        key=public_key,
+        jwk={**jwk, "kid": kid, "alg": algorithm, "use": "sig"},
+    )
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class JWTKeySet:
+    """토큰 서명 키와 검증 키를 한 번만 읽어 키 객체로 보관합니다.
+
+    HS* 알고리즘은 JWT_SECRET_KEY로 서명하고 검증합니다. EdDSA/ES256은
+    JWT_SIGNING_KEY_FILE의 개인 키로 서명하며 kid 헤더를 붙이고, 그 공개 키와
+    JWT_VERIFICATION_KEY_FILES의 공개 키 중 kid가 일치하는 키로 검증합니다.
+    """
+
+    jwks = b'{"keys": []}'
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret: str,
+        signing_key_file: str = "",
+        verification_key_files: list[str] | tuple[str, ...] = (),
+    ) -> None:
+        self.algorithm = algorithm
+        self.kid = None
+        self.signing_key: Any = secret
+        self.verification_keys: dict[str, VerificationKey] = {}
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            return
+
+        if not signing_key_file:
+            raise ImproperlyConfigured(
+                f"JWT_SIGNING_KEY_FILE is required for {algorithm}."
+            )
+        self.signing_key = load_pem_private_key(
+            _read(signing_key_file), password=None
+        )
+        signing = build_verification_key(self.signing_key.public_key())
+        if signing.algorithm != algorithm:
+            raise ImproperlyConfigured(
+                f"JWT_SIGNING_KEY_FILE is not a {algorithm} key."
+            )
+        self.kid = signing.kid
+        for path in verification_key_files:
+            key = build_verification_key(load_pem_public_key(_read(path)))
+            self.verification_keys[key.kid] = key
+        self.verification_keys[signing.kid] = signing
+        self.jwks = json.dumps(
+            {"keys": [key.jwk for key in self.verification_keys.values()]}
+        ).encode()
+
+    @property
+    def is_asymmetric(self) -> bool:
+        return self.kid is not None
+
+    def get_verification_key(self, kid: str | None) -> VerificationKey | None:
+        return self.verification_keys.get(kid)
+
+
+@lru_cache(maxsize=None)
+def get_key_set() -> JWTKeySet:
+    return JWTKeySet(
+        settings.JWT_ALGORITHM,
+        settings.JWT_SECRET_KEY,
+        settings.JWT_SIGNING_KEY_FILE,
+        settings.JWT_VERIFICATION_KEY_FILES,
+    )
+
+
+@receiver(setting_changed)
+def reset_key_set(setting, **kwargs):
+    if setting.startswith("JWT_"):
+        get_key_set.cache_clear()
@@ -0,0 +1,263 @@
+import http.client
+import itertools
+import json
+import random
+import statistics
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import User
+
+ENDPOINTS = ("signup", "signin", "confirm", "token_verify", "token_refresh")
+LOAD_TEST_PASSWORD = "load-test-1234!!"
+LOAD_TEST_PIN = "123456"
+
+
+def get_email(run_id: str, kind: str, number: int) -> str:
+    return f"load-{run_id}-{kind}-{number}@example.invalid"
+
+
+def seed_users(
+    run_id: str, count: int, active: bool, batch_size: int = 1000
+) -> list[str]:
+    """같은 비밀번호 해시를 공유하는 사용자를 bulk_create로 만든다.
+
+    활성 사용자는 로그인용이고, 비활성 사용자는 LOAD_TEST_PIN으로 계정 확인을
+    요청할 수 있다.
+    """
+    kind = "active" if active else "pending"
+    password = make_password(LOAD_TEST_PASSWORD)
+    now = timezone.now()
+    emails = [get_email(run_id, kind, number) for number in range(count)]
+    User.objects.bulk_create(
+        (
+            User(
+                email=email,
+                username=email,
+                password=password,
+                is_active=active,
+                pin="" if active else LOAD_TEST_PIN,
+                pin_sent_at=None if active else now,
+            )
+            for email in emails
+        ),
+        batch_size=batch_size,
+    )
+    return emails
+
+
+def delete_users(run_id: str) -> None:
+    User.objects.filter(email__startswith=f"load-{run_id}-").delete()
+
+
+class HTTPClient:
+    """스레드마다 keep-alive 연결 하나를 열어 JSON POST를 보낸다."""
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        url = urlsplit(base_url)
+        self.connection_class = (
+            http.client.HTTPSConnection
+            if url.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self.netloc = url.netloc
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def post(self, path: str, data: dict[str, Any]) -> tuple[int, bytes]:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self.connection_class(
+                self.netloc, timeout=self.timeout
+            )
+            self._local.connection = connection
+        try:
+            connection.request(
+                "POST",
+                self.prefix + path,
+                json.dumps(data),
+                {"Content-Type": "application/json"},
+            )
+            response = connection.getresponse()
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            self._local.connection = None
+            raise
+
+
+class Workload:
+    """엔드포인트별 요청 본문을 만들고, 응답으로 받은 토큰을 다음 요청에
+    재사용한다.
+
+    리프레시 토큰은 한 번만 쓸 수 있으므로 꺼내 쓰고, 갱신 응답의 새 토큰을
+    다시 넣는다.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        active_emails: list[str],
+        pending_emails: list[str],
+        seed: int | None = None,
+    ) -> None:
+        self.run_id = run_id
+        self.active_emails = active_emails
+        self.pending_emails = deque(pending_emails)
+        self.access_tokens: deque[str] = deque(maxlen=1000)
+        self.refresh_tokens: deque[str] = deque()
+        self.paths = {endpoint: reverse(endpoint) for endpoint in ENDPOINTS}
+        self._signups = itertools.count()
+        self._random = random.Random(seed)
+
+    def build(self, endpoint: str) -> dict[str, Any] | None:
+        """요청 본문을 반환한다. 쓸 수 있는 토큰이나 사용자가 없으면 None"""
+        try:
+            if endpoint == "signup":
+                email = get_email(self.run_id, "signup", next(self._signups))
+                return {
+                    "email": email,
+                    "username": email,
+                    "password": LOAD_TEST_PASSWORD,
+                }
+            if endpoint == "signin":
+                return {
+                    "email": self._random.choice(self.active_emails),
+                    "password": LOAD_TEST_PASSWORD,
+                }
+            if endpoint == "confirm":
+                return {
+                    "email": self.pending_emails.popleft(),
+                    "pin": LOAD_TEST_PIN,
+                }
+            if endpoint == "token_verify":
+                return {"token": self._random.choice(self.access_tokens)}
+            return {"token": self.refresh_tokens.popleft()}
+        except IndexError:
+            return None
+
+    def handle(self, endpoint: str, status: int, body: bytes) -> None:
+        if status != 200 or endpoint not in ("signin", "token_refresh"):
+            return
+        tokens = json.loads(body)
+        self.access_tokens.append(tokens[settings.JWT_ACCESS_TYPE])
+        self.refresh_tokens.append(tokens[settings.JWT_REFRESH_TYPE])
+
+
+@dataclass
+class RequestResult:
+    endpoint: str
+    status: int | str
+    latency: float
+
+
+def send(
+    client: HTTPClient,
+    workload: Workload,
+    endpoint: str,
+    scheduled_at: float,
+) -> RequestResult:
+    """지연 시간은 예정 시각부터 잰다. 워커가 밀려 늦게 보낸 시간도 포함해
+    부하가 높을 때의 지연을 과소평가하지 않는다."""
+    data = workload.build(endpoint)
+    if data is None:
+        return RequestResult(endpoint, "no_data", 0.0)
+    try:
+        status, body = client.post(workload.paths[endpoint], data)
+    except Exception as e:
+        status, body = type(e).__name__, b""
+    result = RequestResult(
+        endpoint, status, time.perf_counter() - scheduled_at
+    )
+    if isinstance(status, int):
+        workload.handle(endpoint, status, body)
+    return result
+
+
+def run_load(
+    client: HTTPClient,
+    workload: Workload,
+    mix: dict[str, float],
+    rps: float,
+    duration: float,
+    max_in_flight: int,
+    seed: int | None = None,
+) -> tuple[list[RequestResult], float]:
+    """개방형 부하: 응답을 기다리지 않고 평균 rps의 포아송 도착 간격으로
+    요청을 보낸다. 결과와 마지막 응답까지 걸린 시간을 반환한다."""
+    rng = random.Random(seed)
+    endpoints, weights = zip(*mix.items())
+    futures = []
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        started_at = scheduled_at = time.perf_counter()
+        while True:
+            scheduled_at += rng.expovariate(rps)
+            if scheduled_at - started_at >= duration:
+                break
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            endpoint = rng.choices(endpoints, weights)[0]
+            futures.append(
+                pool.submit(send, client, workload, endpoint, scheduled_at)
+            )
+    elapsed = time.perf_counter() - started_at
+    return [future.result() for future in futures], elapsed
+
+
+def _percentile(quantiles: list[float], value: int) -> float:
+    return round(quantiles[value - 1] * 1000, 2)
+
+
+def _summarize(results: list[RequestResult], elapsed: float) -> dict[str, Any]:
+    sent = [r for r in results if r.status != "no_data"]
+    ok = [r for r in sent if isinstance(r.status, int) and r.status < 400]
+    latencies = [r.latency for r in sent] or [0.0]
+    quantiles = (
+        statistics.quantiles(latencies, n=100, method="inclusive")
+        if len(latencies) > 1
+        else latencies * 99
+    )
+    return {
+        "requests": len(sent),
+        "ok": len(ok),
+        "errors": len(sent) - len(ok),
+        "error_rate": round((len(sent) - len(ok)) / len(sent), 4)
+        if sent
+        else 0.0,
+        "skipped": len(results) - len(sent),
+        "throughput": round(len(ok) / elapsed, 2),
+        "statuses": dict(sorted(Counter(str(r.status) for r in sent).items())),
+        "latency_ms": {
+            "p50": _percentile(quantiles, 50),
+            "p90": _percentile(quantiles, 90),
+            "p99": _percentile(quantiles, 99),
+            "max": round(max(latencies) * 1000, 2),
+        },
+    }
+
+
+def summarize(
+    results: list[RequestResult], elapsed: float
+) -> dict[str, dict[str, Any]]:
+    """엔드포인트별, 전체 처리량(성공 요청/초), 오류율, 지연 시간
+    백분위(ms). 보낼 토큰이나 사용자가 없어 건너뛴 요청은 skipped로 센다."""
+    summary = {
+        endpoint: _summarize(
+            [r for r in results if r.endpoint == endpoint], elapsed
+        )
+        for endpoint in sorted({result.endpoint for result in results})
+    }
+    summary["total"] = _summarize(results, elapsed)
+    return summary
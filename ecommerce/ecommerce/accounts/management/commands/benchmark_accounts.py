@@ -0,0 +1,112 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import setup_databases, teardown_databases
+
+from ...benchmarks import (
+    BASELINE_PATH,
+    BENCHMARK_PASSWORD,
+    find_regressions,
+    get_cases,
+    load_baseline,
+    run_case,
+    save_baseline,
+)
+from ...models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the accounts microbenchmarks against a throwaway test database, "
+        "print ops/sec and p50/p99 per case and fail when a case's p50 is "
+        "slower than the stored baseline by more than --threshold."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=1.0,
+            help="Seconds to run each case.",
+        )
+        parser.add_argument("--min-iterations", type=int, default=20)
+        parser.add_argument(
+            "-k",
+            "--filter",
+            nargs="+",
+            default=[],
+            help="Only run cases whose name contains one of these strings.",
+        )
+        parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.3,
+            help="Allowed p50 slowdown against the baseline, as a fraction.",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Write the results to the baseline file instead of comparing.",
+        )
+
+    def handle(self, *args, **options):
+        if options["min_iterations"] < 2:
+            raise CommandError("--min-iterations must be at least 2.")
+
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            results = self._run(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        if options["save_baseline"]:
+            save_baseline(results, options["baseline"])
+            self.stderr.write(f"Saved the baseline to {options['baseline']}.")
+            return
+        regressions = find_regressions(
+            results, load_baseline(options["baseline"]), options["threshold"]
+        )
+        if regressions:
+            raise CommandError(
+                f"p50 regressed by more than {options['threshold']:.0%}: "
+                f"{', '.join(regressions)}"
+            )
+
+    def _run(self, options):
+        user = User.objects.create_user(
+            email="benchmark@example.invalid",
+            password=BENCHMARK_PASSWORD,
+            username="benchmark",
+            is_active=True,
+        )
+        cases = [
+            case
+            for case in get_cases(user)
+            if not options["filter"]
+            or any(term in case.name for term in options["filter"])
+        ]
+        baseline = load_baseline(options["baseline"])
+
+        self.stdout.write(
+            f"{'case':<36} {'ops/s':>10} {'p50':>10} {'p99':>10} "
+            f"{'baseline p50':>12} {'change':>7}"
+        )
+        results = []
+        for case in cases:
+            result = run_case(
+                case, options["duration"], options["min_iterations"]
+            )
+            results.append(result)
+            line = (
+                f"{result.name:<36} {result.ops_per_sec:>10.1f} "
+                f"{result.p50_us:>8.1f}us {result.p99_us:>8.1f}us"
+            )
+            if result.name in baseline:
+                expected = baseline[result.name]["p50_us"]
+                line += (
+                    f" {expected:>10.1f}us "
+                    f"{(result.p50_us - expected) / expected:>+7.0%}"
+                )
+            self.stdout.write(line)
+        return results
@@ -0,0 +1,195 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from ....celeryconf import app
+from ....core.redis import get_redis_client
+from ....core.smtp import SMTPSink
+from ...emails import (
+    confirmation_email_keys,
+    enqueue_account_confirmation_email,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure confirmation email throughput end to end: enqueue N "
+        "messages through enqueue_account_confirmation_email, as signup "
+        "does after commit, run a Celery worker per concurrency setting "
+        "against a local SMTP sink and report enqueue latency, delivery "
+        "latency percentiles and messages/sec. With --batch the messages "
+        "go through the Redis batch queue and the flush task."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=200)
+        parser.add_argument(
+            "--concurrency", type=int, nargs="+", default=[1, 4, 8]
+        )
+        parser.add_argument("--pool", default="prefork")
+        parser.add_argument("--smtp-host", default="127.0.0.1")
+        parser.add_argument(
+            "--smtp-port",
+            type=int,
+            default=0,
+            help="Port for the SMTP sink. 0 picks a free port.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=120,
+            help="Seconds to wait for all messages of one run.",
+        )
+        parser.add_argument(
+            "--batch",
+            action=argparse.BooleanOptionalAction,
+            default=settings.EMAIL_BATCH_ENABLED,
+            help="Batch messages in Redis (EMAIL_BATCH_ENABLED).",
+        )
+
+    def handle(self, *args, **options):
+        if options["count"] < 2:
+            raise CommandError("--count must be at least 2.")
+        if options["batch"] and not settings.REDIS_URL:
+            raise CommandError("--batch requires REDIS_URL.")
+
+        run_id = uuid4().hex[:8]
+        recipients = [
+            f"bench-{run_id}-{i}@example.invalid"
+            for i in range(options["count"])
+        ]
+        sink = SMTPSink((options["smtp_host"], options["smtp_port"])).start()
+        try:
+            self.stdout.write(
+                f"{'concurrency':>11} {'enqueue p50':>11} {'enqueue p99':>11} "
+                f"{'deliver p50':>11} {'deliver p95':>11} "
+                f"{'deliver p99':>11} {'msg/s':>8}"
+            )
+            for concurrency in options["concurrency"]:
+                result = self._run(sink, recipients, concurrency, options)
+                self.stdout.write(
+                    f"{concurrency:>11} "
+                    f"{result['enqueue_p50']:>9.2f}ms "
+                    f"{result['enqueue_p99']:>9.2f}ms "
+                    f"{result['deliver_p50']:>9.1f}ms "
+                    f"{result['deliver_p95']:>9.1f}ms "
+                    f"{result['deliver_p99']:>9.1f}ms "
+                    f"{result['throughput']:>8.1f}"
+                )
+        finally:
+            sink.stop()
+
+    def _run(self, sink, recipients, concurrency, options):
+        sink.clear()
+        # 같은 브로커의 다른 워커와 작업을 주고받지 않도록 실행마다 고유한
+        # 큐로 발행하고 소비하며, 배치 대기열도 실행마다 따로 둡니다.
+        queue = f"email-benchmark-{uuid4().hex[:8]}"
+        overrides = {
+            "CELERY_TASK_DEFAULT_QUEUE": queue,
+            "EMAIL_BATCH_ENABLED": options["batch"],
+            "EMAIL_BATCH_QUEUE_KEY": f"{queue}:confirmation_emails",
+        }
+        worker = self._start_worker(sink, overrides, concurrency, options)
+        try:
+            with override_settings(**overrides):
+                enqueued_at = {}
+                enqueue_ms = []
+                for email in recipients:
+                    started_at = time.perf_counter()
+                    enqueue_account_confirmation_email(email, "123456")
+                    enqueue_ms.append(
+                        (time.perf_counter() - started_at) * 1000
+                    )
+                    enqueued_at[email] = time.time()
+
+            if not sink.wait_for(len(recipients), options["timeout"]):
+                raise CommandError(
+                    f"Only {sink.received} of {len(recipients)} messages "
+                    f"arrived within {options['timeout']:.0f}s "
+                    f"(concurrency={concurrency})."
+                )
+        finally:
+            worker.terminate()
+            worker.wait()
+            if options["batch"]:
+                with override_settings(**overrides):
+                    self._delete_batch_keys()
+
+        messages = list(sink.messages)
+        deliver_ms = [
+            (message.received_at - enqueued_at[message.recipients[0]]) * 1000
+            for message in messages
+        ]
+        elapsed = max(message.received_at for message in messages) - min(
+            enqueued_at.values()
+        )
+        enqueue = statistics.quantiles(enqueue_ms, n=100)
+        deliver = statistics.quantiles(deliver_ms, n=100)
+        return {
+            "enqueue_p50": enqueue[49],
+            "enqueue_p99": enqueue[98],
+            "deliver_p50": deliver[49],
+            "deliver_p95": deliver[94],
+            "deliver_p99": deliver[98],
+            "throughput": len(messages) / elapsed,
+        }
+
+    def _start_worker(self, sink, overrides, concurrency, options):
+        """벤치마크 큐만 소비하고 SMTP 싱크로 메일을 보내는 Celery 워커를
+        띄우고 준비될 때까지 기다린다."""
+        queue = overrides["CELERY_TASK_DEFAULT_QUEUE"]
+        hostname = f"{queue}@localhost"
+        env = {
+            **os.environ,
+            **{name: str(value) for name, value in overrides.items()},
+            "EMAIL_HOST": options["smtp_host"],
+            "EMAIL_PORT": str(sink.port),
+            "EMAIL_USE_TLS": "False",
+            "EMAIL_USE_SSL": "False",
+            "EMAIL_HOST_USER": "",
+            "EMAIL_HOST_PASSWORD": "",
+        }
+        worker = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "celery",
+                "--app=ecommerce.celeryconf",
+                "worker",
+                f"--queues={queue}",
+                f"--concurrency={concurrency}",
+                f"--pool={options['pool']}",
+                f"--hostname={hostname}",
+                "--loglevel=WARNING",
+                "--without-gossip",
+                "--without-mingle",
+            ],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            if worker.poll() is not None:
+                raise CommandError("Celery worker exited during startup.")
+            if app.control.ping(destination=[hostname], timeout=1):
+                return worker
+        worker.terminate()
+        raise CommandError("Celery worker did not become ready in 60s.")
+
+    def _delete_batch_keys(self):
+        client = get_redis_client()
+        queue, flush_lock, processing_set = confirmation_email_keys()
+        client.delete(
+            queue,
+            flush_lock,
+            processing_set,
+            *client.keys(f"{processing_set}:*"),
+        )
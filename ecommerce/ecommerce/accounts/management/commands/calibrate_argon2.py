@@ -0,0 +1,118 @@
+import statistics
+import time
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.crypto import get_random_string
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark Argon2 cost parameters on this host and write the "
+        "strongest ARGON2_* settings whose p95 hash latency meets the target."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=250,
+            help="Target p95 latency of a single hash in milliseconds.",
+        )
+        parser.add_argument(
+            "--max-memory-mib",
+            type=int,
+            default=64,
+            help=(
+                "Largest memory cost to try. Keep it below the container "
+                "memory limit divided by PASSWORD_HASHING_WORKERS."
+            ),
+        )
+        parser.add_argument("--min-memory-mib", type=int, default=8)
+        parser.add_argument("--max-time-cost", type=int, default=10)
+        parser.add_argument(
+            "--parallelism", type=int, nargs="+", default=[1, 2]
+        )
+        parser.add_argument("--samples", type=int, default=20)
+        parser.add_argument(
+            "--output",
+            help="Write the settings to this env file instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        if options["samples"] < 2:
+            raise CommandError("--samples must be at least 2.")
+
+        best = None
+        for parallelism in options["parallelism"]:
+            params = self._calibrate_parallelism(parallelism, options)
+            if params and (
+                not best or self._score(params) > self._score(best)
+            ):
+                best = params
+        if not best:
+            raise CommandError(
+                "No Argon2 parameters meet the target latency on this host."
+            )
+
+        lines = [
+            f"ARGON2_TIME_COST={best['time_cost']}",
+            f"ARGON2_MEMORY_COST={best['memory_cost']}",
+            f"ARGON2_PARALLELISM={best['parallelism']}",
+        ]
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                output.write("\n".join(lines) + "\n")
+        else:
+            self.stdout.write("\n".join(lines))
+        self.stderr.write(
+            f"Selected parameters with p95 {best['p95_ms']:.1f}ms "
+            f"(target {options['target_ms']:.0f}ms)."
+        )
+
+    def _calibrate_parallelism(self, parallelism, options):
+        """목표 지연 시간 안에서 가장 큰 메모리 비용과 시간 비용을 찾는다."""
+        memory_mib = options["max_memory_mib"]
+        while memory_mib >= options["min_memory_mib"]:
+            best = None
+            for time_cost in range(1, options["max_time_cost"] + 1):
+                params = {
+                    "time_cost": time_cost,
+                    "memory_cost": memory_mib * 1024,
+                    "parallelism": parallelism,
+                }
+                p95_ms = self._measure(params, options["samples"])
+                if options["verbosity"] >= 2:
+                    self.stderr.write(
+                        f"time_cost={time_cost} memory={memory_mib}MiB "
+                        f"parallelism={parallelism}: p95 {p95_ms:.1f}ms"
+                    )
+                if p95_ms > options["target_ms"]:
+                    break
+                best = {**params, "p95_ms": p95_ms}
+            if best:
+                return best
+            memory_mib //= 2
+        return None
+
+    def _measure(self, params, samples):
+        hasher = Argon2PasswordHasher()
+        hasher.time_cost = params["time_cost"]
+        hasher.memory_cost = params["memory_cost"]
+        hasher.parallelism = params["parallelism"]
+        password = get_random_string(16)
+
+        hasher.encode(password, hasher.salt())
+        durations = []
+        for _ in range(samples):
+            started_at = time.perf_counter()
+            hasher.encode(password, hasher.salt())
+            durations.append((time.perf_counter() - started_at) * 1000)
+        return statistics.quantiles(durations, n=20)[-1]
+
+    @staticmethod
+    def _score(params):
+        return (
+            params["memory_cost"] * params["time_cost"],
+            -params["parallelism"],
+        )
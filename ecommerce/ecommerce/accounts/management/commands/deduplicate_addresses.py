@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...addresses import deduplicate_address_chunk
+from ...tasks import deduplicate_addresses
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill Address.content_hash for existing rows in id-ordered chunks, "
+        "merging duplicates into one row and rewiring user_addresses and "
+        "default addresses."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--background",
+            action="store_true",
+            help="Enqueue a Celery task that works through the chunks.",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+        if options["background"]:
+            deduplicate_addresses.delay(0, options["chunk_size"])
+            self.stdout.write("Enqueued address deduplication.")
+            return
+
+        next_id, merged = 0, 0
+        while next_id is not None:
+            next_id, count = deduplicate_address_chunk(
+                next_id, options["chunk_size"]
+            )
+            merged += count
+            if options["verbosity"] >= 2 and next_id is not None:
+                self.stderr.write(f"Processed addresses up to id {next_id}")
+        self.stdout.write(f"Merged {merged} duplicate addresses.")
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from ...export import EXPORT_FORMATS, export_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream every user with their addresses as NDJSON or CSV. Rows are "
+        "read with a server-side cursor, so memory use does not grow with "
+        "the number of users."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format", choices=EXPORT_FORMATS, default="ndjson"
+        )
+        parser.add_argument(
+            "--output", help="Write to this file instead of stdout."
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument(
+            "--replica",
+            action="store_true",
+            help="Read from the replica database when it is enabled.",
+        )
+
+    def handle(self, *args, **options):
+        chunks = export_users(
+            options["format"], options["replica"], options["chunk_size"]
+        )
+        if not options["output"]:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+        with open(options["output"], "w", newline="") as output:
+            output.writelines(chunks)
@@ -0,0 +1,51 @@
+import os
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+from django.core.management.base import BaseCommand, CommandError
+
+from ...keys import ASYMMETRIC_ALGORITHMS, build_verification_key
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a JWT signing key pair. Writes the PEM private key to "
+        "--output and the public key to <output>.pub, and prints the kid."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--algorithm", choices=ASYMMETRIC_ALGORITHMS, default="EdDSA"
+        )
+        parser.add_argument("--output", required=True)
+
+    def handle(self, *args, **options):
+        if options["algorithm"] == "EdDSA":
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        else:
+            private_key = ec.generate_private_key(ec.SECP256R1())
+        public_key = private_key.public_key()
+
+        path = options["output"]
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            raise CommandError(f"{path} already exists.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                private_key.private_bytes(
+                    Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+                )
+            )
+        with open(f"{path}.pub", "wb") as f:
+            f.write(
+                public_key.public_bytes(
+                    Encoding.PEM, PublicFormat.SubjectPublicKeyInfo
+                )
+            )
+        self.stdout.write(build_verification_key(public_key).kid)
@@ -0,0 +1,376 @@
+import csv
+import io
+import json
+import sys
+from itertools import islice
+from types import SimpleNamespace
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ...models import (
+    ADDRESS_CONTENT_FIELDS,
+    Address,
+    User,
+    get_address_content_hash,
+)
+from ...search import prepare_user_search_document_value
+
+USER_INPUT_FIELDS = (
+    "email",
+    "username",
+    "first_name",
+    "last_name",
+    "phone_number",
+    "language_code",
+    "note",
+)
+ADDRESS_FIELDS = ADDRESS_CONTENT_FIELDS
+USER_COLUMNS = tuple(
+    field.attname
+    for field in User._meta.concrete_fields
+    if not field.primary_key
+)
+ADDRESS_ROLES = ("shipping", "billing")
+
+
+class InvalidRow(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream users and their addresses from CSV or JSON Lines into the "
+        "database with COPY, in bounded batches. Passwords must already be "
+        "hashed; rows whose email already exists are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or - for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=("csv", "jsonl"),
+            help="Input format. Defaults to the file extension.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        input_format = options["format"] or self._guess_format(options["path"])
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        stats = {"read": 0, "users": 0, "addresses": 0, "invalid": 0}
+        with self._open(options["path"]) as source:
+            records = self._read(source, input_format)
+            self._create_staging_tables()
+            try:
+                while batch := list(islice(records, options["batch_size"])):
+                    self._import_batch(batch, stats)
+                    if options["verbosity"] >= 2:
+                        self.stderr.write(f"{stats['read']} rows read")
+            finally:
+                self._drop_staging_tables()
+
+        self.stdout.write(
+            f"Imported {stats['users']} users and {stats['addresses']} "
+            f"addresses from {stats['read']} rows; skipped "
+            f"{stats['read'] - stats['users'] - stats['invalid']} existing "
+            f"emails and {stats['invalid']} invalid rows."
+        )
+
+    @staticmethod
+    def _guess_format(path):
+        if path.endswith(".csv"):
+            return "csv"
+        if path.endswith((".jsonl", ".ndjson")):
+            return "jsonl"
+        raise CommandError("Cannot guess the input format; pass --format.")
+
+    @staticmethod
+    def _open(path):
+        if path == "-":
+            return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+        return open(path, encoding="utf-8", newline="")
+
+    def _read(self, source, input_format):
+        """입력을 한 행씩 읽어 사용자와 주소 레코드로 변환한다."""
+        if input_format == "csv":
+            for row in csv.DictReader(source):
+                yield self._from_csv(row)
+        else:
+            for line in source:
+                if line.strip():
+                    yield self._from_json(json.loads(line))
+
+    @staticmethod
+    def _from_csv(row):
+        addresses, defaults = [], {}
+        for role in ADDRESS_ROLES:
+            address = {
+                name: row.get(f"{role}_{name}") or ""
+                for name in ADDRESS_FIELDS
+            }
+            if not any(address.values()):
+                continue
+            if address in addresses:
+                defaults[role] = addresses.index(address)
+            else:
+                defaults[role] = len(addresses)
+                addresses.append(address)
+        return {
+            "user": row,
+            "addresses": addresses,
+            "shipping": defaults.get("shipping"),
+            "billing": defaults.get("billing"),
+        }
+
+    @staticmethod
+    def _from_json(data):
+        return {
+            "user": data,
+            "addresses": data.get("addresses") or [],
+            "shipping": data.get("default_shipping_address"),
+            "billing": data.get("default_billing_address"),
+        }
+
+    def _create_staging_tables(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE import_user (LIKE accounts_user); "
+                "ALTER TABLE import_user ALTER COLUMN id DROP NOT NULL, "
+                "ADD COLUMN row_no integer, "
+                "ADD COLUMN shipping_position integer, "
+                "ADD COLUMN billing_position integer; "
+                "CREATE TEMP TABLE import_address (LIKE accounts_address); "
+                "ALTER TABLE import_address ALTER COLUMN id DROP NOT NULL, "
+                "ADD COLUMN row_no integer, "
+                "ADD COLUMN position integer"
+            )
+
+    def _drop_staging_tables(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS import_user, import_address")
+
+    def _import_batch(self, batch, stats):
+        """배치를 임시 테이블로 COPY한 뒤 집합 연산으로 실제 테이블에 넣는다."""
+        users, addresses = io.StringIO(), io.StringIO()
+        user_writer, address_writer = csv.writer(users), csv.writer(addresses)
+        now = timezone.now()
+        for record in batch:
+            stats["read"] += 1
+            try:
+                user_row, address_rows = self._build_rows(record, now)
+            except InvalidRow as e:
+                stats["invalid"] += 1
+                self.stderr.write(f"Row {stats['read']}: {e}")
+                continue
+            user_writer.writerow([stats["read"], *user_row])
+            for position, address_row in enumerate(address_rows):
+                address_writer.writerow(
+                    [stats["read"], position, *address_row]
+                )
+        users.seek(0)
+        addresses.seek(0)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("TRUNCATE import_user, import_address")
+            cursor.copy_expert(
+                self._copy_sql(
+                    "import_user",
+                    ("row_no", *USER_COLUMNS)
+                    + ("shipping_position", "billing_position"),
+                ),
+                users,
+            )
+            cursor.copy_expert(
+                self._copy_sql(
+                    "import_address",
+                    ("row_no", "position", *ADDRESS_FIELDS, "content_hash"),
+                ),
+                addresses,
+            )
+            stats["users"] += self._insert(cursor)
+            stats["addresses"] += self._insert_addresses(cursor)
+
+    @staticmethod
+    def _copy_sql(table, columns):
+        return (
+            f"COPY {table} ({', '.join(columns)}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+
+    @staticmethod
+    def _insert(cursor):
+        """주소 id를 정하고 사용자를 기본 배송지/청구지와 함께 넣는다.
+
+        내용이 같은 주소는 기존 행의 id를 쓰고, 배치 안에서도 해시마다 하나의
+        id만 할당한다. 이메일이 이미 있는 사용자는 건너뛰고, 새로 들어간
+        사용자의 id를 임시 테이블에 기록한다.
+        """
+        columns = [
+            column
+            for column in USER_COLUMNS
+            if column
+            not in (
+                "default_shipping_address_id",
+                "default_billing_address_id",
+            )
+        ]
+        cursor.execute(
+            "UPDATE import_address i SET id = a.id FROM accounts_address a "
+            "WHERE a.content_hash = i.content_hash"
+        )
+        cursor.execute(
+            "WITH n AS MATERIALIZED (SELECT content_hash, "
+            "nextval(pg_get_serial_sequence('accounts_address', 'id')) AS id "
+            "FROM (SELECT DISTINCT content_hash FROM import_address "
+            "WHERE id IS NULL) h) "
+            "UPDATE import_address i SET id = n.id FROM n "
+            "WHERE i.id IS NULL AND i.content_hash = n.content_hash"
+        )
+        cursor.execute(
+            f"INSERT INTO accounts_user ({', '.join(columns)}, "
+            "default_shipping_address_id, default_billing_address_id) "
+            f"SELECT {', '.join(f'u.{column}' for column in columns)}, "
+            "s.id, b.id FROM import_user u "
+            "LEFT JOIN import_address s "
+            "ON s.row_no = u.row_no AND s.position = u.shipping_position "
+            "LEFT JOIN import_address b "
+            "ON b.row_no = u.row_no AND b.position = u.billing_position "
+            "ORDER BY u.row_no "
+            "ON CONFLICT (email) DO NOTHING"
+        )
+        inserted = cursor.rowcount
+        cursor.execute(
+            "UPDATE import_user u SET id = a.id FROM accounts_user a "
+            "WHERE a.uuid = u.uuid"
+        )
+        return inserted
+
+    @staticmethod
+    def _insert_addresses(cursor):
+        fields = ", ".join(ADDRESS_FIELDS)
+        cursor.execute(
+            f"INSERT INTO accounts_address (id, {fields}, content_hash) "
+            "SELECT DISTINCT ON (a.id) a.id, "
+            f"{', '.join(f'a.{f}' for f in ADDRESS_FIELDS)}, a.content_hash "
+            "FROM import_address a JOIN import_user u USING (row_no) "
+            "WHERE u.id IS NOT NULL AND NOT EXISTS "
+            "(SELECT 1 FROM accounts_address x WHERE x.id = a.id) "
+            "ORDER BY a.id"
+        )
+        inserted = cursor.rowcount
+        cursor.execute(
+            "INSERT INTO accounts_user_addresses (user_id, address_id) "
+            "SELECT DISTINCT u.id, a.id "
+            "FROM import_address a JOIN import_user u USING (row_no) "
+            "WHERE u.id IS NOT NULL ON CONFLICT DO NOTHING"
+        )
+        return inserted
+
+    def _build_rows(self, record, now):
+        data = record["user"]
+        if not data.get("email"):
+            raise InvalidRow("email is required")
+        values = {}
+        for field in User._meta.concrete_fields:
+            if field.primary_key:
+                continue
+            if field.attname in USER_INPUT_FIELDS and data.get(field.attname):
+                values[field.attname] = self._clean(field, data[field.attname])
+            elif getattr(field, "auto_now", False):
+                values[field.attname] = now
+            else:
+                values[field.attname] = field.get_default()
+        values["email"] = User.objects.normalize_email(values["email"])
+        if not data.get("username"):
+            values["username"] = values["email"]
+        values["is_active"] = self._bool(data.get("is_active"), True)
+        values["password"] = self._password(data.get("password"))
+
+        addresses = [
+            {
+                name: self._clean(
+                    Address._meta.get_field(name), address.get(name, "")
+                )
+                for name in ADDRESS_FIELDS
+            }
+            for address in record["addresses"]
+        ]
+        values["search_document"] = prepare_user_search_document_value(
+            SimpleNamespace(**values),
+            [SimpleNamespace(**address) for address in addresses],
+        )
+        address_rows = [
+            [
+                *(
+                    self._db_value(Address._meta.get_field(name), value)
+                    for name, value in address.items()
+                ),
+                get_address_content_hash(address),
+            ]
+            for address in addresses
+        ]
+        positions = [
+            self._position(record[role], len(address_rows))
+            for role in ADDRESS_ROLES
+        ]
+        user_row = [
+            self._db_value(User._meta.get_field(name), values[name])
+            for name in USER_COLUMNS
+        ]
+        return user_row + positions, address_rows
+
+    @staticmethod
+    def _clean(field, value):
+        if isinstance(value, str):
+            value = value.strip()
+        try:
+            return field.clean(value, None)
+        except ValidationError as e:
+            raise InvalidRow(f"{field.name}: {'; '.join(e.messages)}")
+
+    @staticmethod
+    def _bool(value, default):
+        if value in (None, ""):
+            return default
+        if isinstance(value, bool):
+            return value
+        normalized = str(value).strip().lower()
+        if normalized in ("1", "t", "true", "y", "yes"):
+            return True
+        if normalized in ("0", "f", "false", "n", "no"):
+            return False
+        raise InvalidRow(f"invalid boolean {value!r}")
+
+    @staticmethod
+    def _password(password):
+        """해시된 비밀번호만 받는다. 알 수 없는 형식이면 사용할 수 없는
+        비밀번호로 저장한다."""
+        if password:
+            try:
+                identify_hasher(password)
+                return password
+            except ValueError:
+                pass
+        return make_password(None)
+
+    @staticmethod
+    def _position(value, count):
+        if value in (None, ""):
+            return "\\N"
+        try:
+            position = int(value)
+        except (TypeError, ValueError):
+            raise InvalidRow(f"invalid default address {value!r}")
+        if not 0 <= position < count:
+            raise InvalidRow(f"default address {position} does not exist")
+        return position
+
+    @staticmethod
+    def _db_value(field, value):
+        value = field.get_db_prep_save(value, connection)
+        return "\\N" if value is None else value
@@ -0,0 +1,188 @@
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from ...loadtest import (
+    ENDPOINTS,
+    HTTPClient,
+    Workload,
+    delete_users,
+    run_load,
+    seed_users,
+    send,
+    summarize,
+)
+
+DEFAULT_MIX = "signin=40,token_verify=30,token_refresh=15,signup=10,confirm=5"
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic users, drive an open-loop mix of the accounts "
+        "endpoints against a running server at a target RPS and report "
+        "throughput, error rates and latency percentiles per endpoint. The "
+        "server must share this database and run with THROTTLING_ENABLED="
+        "False."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=1000,
+            help="Active users to seed for signin.",
+        )
+        parser.add_argument("--rps", type=float, default=20)
+        parser.add_argument(
+            "--duration", type=float, default=60, help="Seconds of load."
+        )
+        parser.add_argument(
+            "--mix",
+            default=DEFAULT_MIX,
+            help="Comma-separated endpoint=weight pairs.",
+        )
+        parser.add_argument(
+            "--token-users",
+            type=int,
+            default=10,
+            help="Users to sign in before the run for verify/refresh tokens.",
+        )
+        parser.add_argument("--max-in-flight", type=int, default=200)
+        parser.add_argument("--timeout", type=float, default=30)
+        parser.add_argument("--seed", type=int)
+        parser.add_argument(
+            "--output",
+            help="JSON results file. Defaults to load-test-<run id>.json.",
+        )
+        parser.add_argument(
+            "--keep-users",
+            action="store_true",
+            help="Keep the seeded and signed-up users after the run.",
+        )
+
+    def handle(self, *args, **options):
+        mix = self._parse_mix(options["mix"])
+        if options["rps"] <= 0 or options["duration"] <= 0:
+            raise CommandError("--rps and --duration must be positive.")
+        if options["users"] < 1:
+            raise CommandError("--users must be at least 1.")
+
+        run_id = uuid4().hex[:8]
+        started_at = time.perf_counter()
+        active = seed_users(run_id, options["users"], active=True)
+        # 계정 확인은 사용자마다 한 번만 성공하므로 예상 요청 수보다 넉넉히
+        # 만든다.
+        expected_confirms = (
+            options["rps"]
+            * options["duration"]
+            * mix.get("confirm", 0)
+            / sum(mix.values())
+        )
+        pending = seed_users(
+            run_id, math.ceil(expected_confirms * 1.5), active=False
+        )
+        self.stderr.write(
+            f"Seeded {len(active) + len(pending)} users in "
+            f"{time.perf_counter() - started_at:.1f}s (run {run_id})."
+        )
+
+        client = HTTPClient(options["base_url"], options["timeout"])
+        workload = Workload(run_id, active, pending, options["seed"])
+        try:
+            self._sign_in(client, workload, options)
+            results, elapsed = run_load(
+                client,
+                workload,
+                mix,
+                options["rps"],
+                options["duration"],
+                options["max_in_flight"],
+                options["seed"],
+            )
+        finally:
+            if not options["keep_users"]:
+                delete_users(run_id)
+
+        summary = summarize(results, elapsed)
+        self._print(summary)
+        output = options["output"] or f"load-test-{run_id}.json"
+        with open(output, "w") as f:
+            json.dump(
+                {
+                    "run": {
+                        "id": run_id,
+                        "started_at": timezone.now().isoformat(),
+                        "base_url": options["base_url"],
+                        "rps": options["rps"],
+                        "duration": options["duration"],
+                        "elapsed": round(elapsed, 2),
+                        "mix": mix,
+                        "users": options["users"],
+                    },
+                    "endpoints": summary,
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+        self.stderr.write(f"Wrote results to {output}.")
+
+    @staticmethod
+    def _parse_mix(value):
+        mix = {}
+        for item in value.split(","):
+            endpoint, _, weight = item.partition("=")
+            endpoint = endpoint.strip()
+            if endpoint not in ENDPOINTS:
+                raise CommandError(
+                    f"Unknown endpoint {endpoint!r} in --mix. Choose from "
+                    f"{', '.join(ENDPOINTS)}."
+                )
+            try:
+                mix[endpoint] = float(weight)
+            except ValueError:
+                raise CommandError(f"Invalid weight for {endpoint!r}.")
+        if not any(weight > 0 for weight in mix.values()):
+            raise CommandError("--mix needs at least one positive weight.")
+        return mix
+
+    def _sign_in(self, client, workload, options):
+        """토큰 검증과 갱신에 쓸 토큰을 부하 전에 로그인으로 받아 둔다."""
+        count = min(options["token_users"], options["users"])
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(
+                    lambda _: send(
+                        client, workload, "signin", time.perf_counter()
+                    ),
+                    range(count),
+                )
+            )
+        if count and not workload.refresh_tokens:
+            statuses = sorted({str(result.status) for result in results})
+            raise CommandError(
+                f"Could not sign in any seeded user ({', '.join(statuses)}). "
+                "Is the server running on this database with "
+                "THROTTLING_ENABLED=False?"
+            )
+
+    def _print(self, summary):
+        self.stdout.write(
+            f"{'endpoint':<14} {'requests':>8} {'rps':>8} {'errors':>7} "
+            f"{'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}"
+        )
+        for endpoint, result in summary.items():
+            latency = result["latency_ms"]
+            self.stdout.write(
+                f"{endpoint:<14} {result['requests']:>8} "
+                f"{result['throughput']:>8.1f} "
+                f"{result['error_rate']:>7.1%} "
+                f"{latency['p50']:>7.1f}ms {latency['p90']:>7.1f}ms "
+                f"{latency['p99']:>7.1f}ms {latency['max']:>7.1f}ms"
+            )
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from ....core.smtp import SMTPSink
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local SMTP server that accepts and discards every message. "
+        "Point EMAIL_HOST/EMAIL_PORT at it with EMAIL_USE_TLS=False."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=1025)
+
+    def handle(self, *args, **options):
+        sink = SMTPSink((options["host"], options["port"]), max_messages=0)
+        self.stderr.write(
+            f"SMTP sink listening on {options['host']}:{sink.port}"
+        )
+        try:
+            sink.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            sink.server_close()
+            self.stderr.write(f"Received {sink.received} messages.")
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from ...models import User
+from ...search import update_user_search_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild User.search_document for every user in pk-ordered batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        last_pk, updated = 0, 0
+        while True:
+            pks = list(
+                User.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[: options["batch_size"]]
+            )
+            if not pks:
+                break
+            updated += update_user_search_documents(
+                User.objects.filter(pk__in=pks)
+            )
+            last_pk = pks[-1]
+            if options["verbosity"] >= 2:
+                self.stderr.write(f"{updated} users updated")
+        self.stdout.write(f"Updated {updated} users.")
@@ -1,3 +1,4 @@
+import hashlib
 from functools import partial
 from typing import Any
 from uuid import uuid4
@@ -5,11 +6,48 @@ from uuid import uuid4
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils import timezone
 from django.utils.crypto import get_random_string
 from django.utils.translation import gettext_lazy as _
 
+from .search import (
+    USER_SEARCH_FIELDS,
+    prepare_user_search_document_value,
+    search_vector,
+)
+
+SEARCH_FIELDS = frozenset(USER_SEARCH_FIELDS)
+ADDRESS_CONTENT_FIELDS = (
+    "first_name",
+    "last_name",
+    "company_name",
+    "street_address_1",
+    "street_address_2",
+    "city",
+    "city_area",
+    "postal_code",
+    "country",
+    "country_area",
+    "phone",
+)
+
+
+def generate_pin() -> str:
+    return get_random_string(
+        length=settings.PIN_MAX_LENGTH, allowed_chars="1234567890"
+    )
+
+
+def get_address_content_hash(values: dict[str, Any]) -> str:
+    """공백과 대소문자를 정규화한 주소 내용의 SHA-256 해시"""
+    content = "\x1f".join(
+        " ".join(str(values.get(field) or "").split()).casefold()
+        for field in ADDRESS_CONTENT_FIELDS
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
 
 class Address(models.Model):
     first_name = models.CharField(max_length=255)
@@ -23,10 +61,33 @@ class Address(models.Model):
     country = models.CharField(max_length=2)
     country_area = models.CharField(max_length=128, blank=True)
     phone = models.CharField(max_length=30, blank=True)
+    # 같은 내용의 주소는 한 행을 공유한다. 중복 제거 전의 기존 행은 NULL이다.
+    content_hash = models.CharField(
+        max_length=64, unique=True, null=True, editable=False
+    )
 
     class Meta:
         ordering = ("id",)
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        content_hash = get_address_content_hash(
+            {field: getattr(self, field) for field in ADDRESS_CONTENT_FIELDS}
+        )
+        if not self._state.adding and content_hash != self.content_hash:
+            # 공유하는 행을 고치면 다른 사용자의 주소도 바뀌므로 새 내용의
+            # 행으로 옮긴다.
+            from .addresses import replace_address
+
+            replaced = replace_address(self)
+            for field in self._meta.concrete_fields:
+                setattr(self, field.attname, getattr(replaced, field.attname))
+            return
+        self.content_hash = content_hash
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "content_hash"}
+        super().save(*args, **kwargs)
+
 
 class User(AbstractUser):
     username_validator = UnicodeUsernameValidator()
@@ -75,18 +136,37 @@ class User(AbstractUser):
 
     class Meta:
         ordering = ("email",)
+        indexes = [
+            GinIndex(search_vector, name="user_search_document_idx"),
+            models.Index(
+                fields=("date_joined", "id"),
+                name="user_date_joined_id_idx",
+            ),
+        ]
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """검색 대상 필드가 저장될 때 search_document를 함께 갱신합니다."""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or not SEARCH_FIELDS.isdisjoint(
+            update_fields
+        ):
+            addresses = self.addresses.all() if self.pk else ()
+            self.search_document = prepare_user_search_document_value(
+                self, addresses
+            )
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_document"}
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         return str(self.email)
 
     def set_pin(self) -> None:
         """사용자의 PIN을 설정합니다."""
-        self.pin = get_random_string(
-            length=settings.PIN_MAX_LENGTH, allowed_chars="1234567890"
-        )
+        self.pin = generate_pin()
         self.save(update_fields=["pin"])
         return self.pin
 
@@ -113,12 +193,16 @@ class User(AbstractUser):
         self.pin_failures += 1
         self.save(update_fields=["pin_failures"])
 
-    def activate(self) -> None:
-        """사용자를 활성화합니다."""
+    def _mark_active(self) -> list[str]:
         self.is_active = True
         self.pin = ""
         self.pin_sent_at = None
         self.pin_failures = 0
-        self.save(
-            update_fields=["is_active", "pin", "pin_sent_at", "pin_failures"]
-        )
+        return ["is_active", "pin", "pin_sent_at", "pin_failures"]
+
+    def activate(self) -> None:
+        """사용자를 활성화합니다."""
+        self.save(update_fields=self._mark_active())
+
+    async def aactivate(self) -> None:
+        await self.asave(update_fields=self._mark_active())
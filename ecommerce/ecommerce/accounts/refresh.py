@@ -0,0 +1,112 @@
+import threading
+from functools import lru_cache
+from typing import Any
+from uuid import uuid4
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from ..core.redis import get_redis_client
+from .exceptions import RefreshTokenReusedError
+
+# 제출된 jti가 패밀리의 최신 jti이면 새 jti로 바꾸고, 아니면 패밀리를 폐기합니다.
+ROTATE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    redis.call("SET", KEYS[1], ARGV[2], "EX", ARGV[3])
+    return 1
+end
+redis.call("DEL", KEYS[1])
+return 0
+"""
+
+
+@lru_cache(maxsize=None)
+def get_rotate_script():
+    return get_redis_client().register_script(ROTATE_SCRIPT)
+
+
+class RefreshTokenFamilies:
+    """리프레시 토큰 패밀리의 마지막 발급 jti를 기록합니다.
+
+    로그인 시 새 패밀리가 시작되고, 갱신할 때마다 같은 패밀리에서 새 jti가
+    발급됩니다. 이미 사용된 토큰이 다시 제출되면 패밀리 전체를 폐기합니다.
+    확인과 교체는 서버 측 스크립트 한 번으로 처리되므로 같은 토큰이 동시에
+    제출되어도 하나만 갱신됩니다.
+
+    REDIS_URL이 없으면 기본 캐시에 기록하고 프로세스 내 잠금으로 교체합니다.
+    기본 캐시(locmem)는 워커마다 따로이므로, 다른 워커에서 발급된 토큰은
+    재사용으로 판정됩니다. 여러 워커로 운영할 때는 REDIS_URL이 필요합니다.
+    """
+
+    key_prefix = "accounts:refresh_family"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def _key(self, family: str) -> str:
+        return f"{self.key_prefix}:{family}"
+
+    @staticmethod
+    def _ttl() -> int:
+        return max(int(settings.JWT_TTL_REFRESH.total_seconds()), 1)
+
+    def issue(self) -> dict[str, Any]:
+        """새 패밀리를 시작하고 토큰 payload에 추가할 값을 반환합니다."""
+        family = uuid4().hex
+        jti = uuid4().hex
+        client = get_redis_client()
+        if client is None:
+            cache.set(self._key(family), jti, self._ttl())
+        else:
+            client.set(self._key(family), jti, ex=self._ttl())
+        return {"jti": jti, "family": family}
+
+    async def aissue(self) -> dict[str, Any]:
+        return await sync_to_async(self.issue, thread_sensitive=False)()
+
+    def rotate(self, payload: dict[str, Any]) -> dict[str, Any] | None:
+        """제출된 토큰이 패밀리의 최신 토큰이면 같은 패밀리의 새 jti로 교체하고
+        토큰 payload에 추가할 값을 반환합니다.
+
+        패밀리 정보가 없는 토큰은 새 패밀리를 시작하도록 None을 반환합니다.
+        """
+        family = payload.get("family")
+        jti = payload.get("jti")
+        if not family or not jti:
+            return None
+        new_jti = uuid4().hex
+        client = get_redis_client()
+        if client is None:
+            rotated = self._rotate_in_cache(family, jti, new_jti)
+        else:
+            rotated = get_rotate_script()(
+                keys=[self._key(family)], args=[jti, new_jti, self._ttl()]
+            )
+        if not rotated:
+            raise RefreshTokenReusedError
+        return {"jti": new_jti, "family": family}
+
+    async def arotate(self, payload: dict[str, Any]) -> dict[str, Any] | None:
+        return await sync_to_async(self.rotate, thread_sensitive=False)(
+            payload
+        )
+
+    def _rotate_in_cache(self, family: str, jti: str, new_jti: str) -> bool:
+        with self._lock:
+            if cache.get(self._key(family)) != jti:
+                cache.delete(self._key(family))
+                return False
+            cache.set(self._key(family), new_jti, self._ttl())
+            return True
+
+    def revoke(self, family: str) -> None:
+        """패밀리에 속한 모든 리프레시 토큰을 폐기합니다."""
+        client = get_redis_client()
+        if client is None:
+            cache.delete(self._key(family))
+        else:
+            client.delete(self._key(family))
+
+
+refresh_token_families = RefreshTokenFamilies()
@@ -0,0 +1,246 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+from typing import Any
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from redis.exceptions import RedisError
+
+from ..core.metrics import TOKEN_REVOCATION_CHECKS
+from ..core.redis import get_redis_client
+from .exceptions import TokenRevocationUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """capacity개를 넣었을 때 오탐률이 error_rate가 되도록 크기를 정합니다.
+
+    없는 항목을 있다고 답할 수는 있지만, 넣은 항목을 없다고 답하지는 않습니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.size = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        positions = self._positions(item)
+        with self._lock:
+            added = False
+            for position in positions:
+                mask = 1 << (position & 7)
+                if not self.bits[position >> 3] & mask:
+                    self.bits[position >> 3] |= mask
+                    added = True
+            if added:
+                self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class TokenRevocations:
+    """토큰(jti)과 사용자 단위의 토큰 폐기 목록
+
+    폐기 항목은 토큰이 만료될 때까지 남는 Redis 키로 저장되고, 같은 내용이
+    만료 시각과 함께 스트림에도 추가됩니다. 각 워커는 스트림을
+    TOKEN_REVOCATION_REFRESH_INTERVAL초마다 이어 읽어 프로세스 내 블룸
+    필터에 반영하므로, 폐기되지 않은 토큰은 Redis에 묻지 않고 판정합니다.
+    필터가 양성이라고 답한 토큰만 Redis에서 확인합니다. 다른 워커의 폐기는
+    최대 갱신 주기만큼 늦게 반영됩니다.
+
+    사용자 단위 폐기는 그 시각(초) 이전에 발급된 토큰을 모두 폐기하므로 같은
+    초에 발급된 토큰도 폐기됩니다. REDIS_URL이 없으면 기본 캐시에 저장하고
+    매번 캐시를 확인합니다. 확인 중 Redis 오류는 기록하고 폐기되지 않은
+    것으로 처리하며, 폐기 중 오류는 TokenRevocationUnavailableError(503)로
+    알립니다.
+    """
+
+    key_prefix = "accounts:revoked"
+    stream = "accounts:revocations"
+
+    def __init__(self) -> None:
+        self._filter: BloomFilter | None = None
+        self._last_id = "0-0"
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def _key(self, member: str) -> str:
+        return f"{self.key_prefix}:{member}"
+
+    @staticmethod
+    def _members(payload: dict[str, Any]) -> list[str]:
+        members = []
+        if payload.get("jti"):
+            members.append(f"jti:{payload['jti']}")
+        if payload.get("user_id"):
+            members.append(f"user:{payload['user_id']}")
+        return members
+
+    def revoke_token(self, payload: dict[str, Any]) -> None:
+        """토큰이 만료될 때까지 해당 jti의 토큰을 폐기합니다."""
+        if not payload.get("jti"):
+            return
+        self._revoke(f"jti:{payload['jti']}", 1, int(payload["exp"]))
+
+    def revoke_user(self, user_uuid: UUID | str) -> None:
+        """지금까지 사용자에게 발급된 모든 토큰을 폐기합니다."""
+        now = int(time.time())
+        self._revoke(
+            f"user:{user_uuid}",
+            now,
+            now + int(settings.JWT_TTL_REFRESH.total_seconds()),
+        )
+
+    def _revoke(self, member: str, value: int, exp: int) -> None:
+        """exp(유닉스 시각)까지 member를 폐기합니다."""
+        ttl = max(exp - int(time.time()), 1)
+        client = get_redis_client()
+        if client is None:
+            cache.set(self._key(member), value, ttl)
+            return
+        min_id = int(
+            (time.time() - settings.JWT_TTL_REFRESH.total_seconds()) * 1000
+        )
+        try:
+            with client.pipeline() as pipe:
+                pipe.set(self._key(member), value, ex=ttl)
+                pipe.xadd(
+                    self.stream,
+                    {"member": member, "exp": exp},
+                    minid=min_id,
+                    approximate=True,
+                )
+                pipe.execute()
+        except RedisError:
+            logger.error("Token revocation failed", exc_info=True)
+            raise TokenRevocationUnavailableError
+        if self._filter is not None:
+            self._filter.add(member)
+
+    def is_revoked(self, payload: dict[str, Any]) -> bool:
+        members = self._members(payload)
+        client = get_redis_client()
+        if client is None:
+            return self._check(
+                payload, cache.get_many([self._key(m) for m in members])
+            )
+
+        self._refresh(client)
+        bloom = self._filter
+        if bloom is not None and not any(m in bloom for m in members):
+            TOKEN_REVOCATION_CHECKS.labels("negative").inc()
+            return False
+        try:
+            values = client.mget([self._key(member) for member in members])
+        except RedisError:
+            logger.warning("Token revocation check failed", exc_info=True)
+            return False
+        return self._check(
+            payload,
+            {self._key(m): v for m, v in zip(members, values) if v},
+        )
+
+    async def ais_revoked(self, payload: dict[str, Any]) -> bool:
+        """필터로 판정할 수 있으면 이벤트 루프에서 바로 답하고, Redis가
+        필요하면 스레드에서 확인합니다."""
+        bloom = self._filter
+        if (
+            bloom is not None
+            and time.monotonic() < self._next_refresh
+            and not any(m in bloom for m in self._members(payload))
+        ):
+            TOKEN_REVOCATION_CHECKS.labels("negative").inc()
+            return False
+        return await sync_to_async(self.is_revoked, thread_sensitive=False)(
+            payload
+        )
+
+    def _check(self, payload: dict[str, Any], values: dict[str, Any]) -> bool:
+        revoked = self._key(f"jti:{payload.get('jti')}") in values
+        revoked_at = values.get(self._key(f"user:{payload.get('user_id')}"))
+        if revoked_at is not None:
+            revoked = revoked or payload.get("iat", 0) <= int(revoked_at)
+        TOKEN_REVOCATION_CHECKS.labels(
+            "revoked" if revoked else "not_revoked"
+        ).inc()
+        return revoked
+
+    def _refresh(self, client) -> None:
+        """갱신 주기가 지났으면 스트림의 새 항목을 필터에 추가합니다.
+
+        한 스레드만 갱신하고 나머지는 기존 필터로 판정합니다. 필터가 용량만큼
+        차면 만료되지 않은 항목만으로 다시 만들고, 그래도 CAPACITY의 절반을
+        넘으면 남은 항목 수의 두 배 크기로 만들어 오탐률을 유지합니다.
+        """
+        now = time.monotonic()
+        if now < self._next_refresh or not self._lock.acquire(blocking=False):
+            return
+        try:
+            bloom = self._filter
+            if bloom is None or bloom.count >= bloom.capacity:
+                members, last_id = self._read_stream(client, "0-0")
+                bloom = BloomFilter(
+                    max(
+                        settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+                        len(members) * 2,
+                    ),
+                    settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+                )
+            else:
+                members, last_id = self._read_stream(client, self._last_id)
+            for member in members:
+                bloom.add(member)
+            self._filter, self._last_id = bloom, last_id
+        except RedisError:
+            logger.warning("Token revocation refresh failed", exc_info=True)
+        finally:
+            self._next_refresh = (
+                now + settings.TOKEN_REVOCATION_REFRESH_INTERVAL
+            )
+            self._lock.release()
+
+    def _read_stream(self, client, last_id: str) -> tuple[list[str], str]:
+        """last_id 이후의 항목 중 만료되지 않은 폐기 항목을 읽습니다."""
+        now = time.time()
+        members = []
+        while True:
+            entries = client.xrange(
+                self.stream, f"({last_id}", "+", count=1000
+            )
+            for entry_id, fields in entries:
+                last_id = entry_id.decode()
+                if int(fields.get(b"exp", now + 1)) > now:
+                    members.append(fields[b"member"].decode())
+            if len(entries) < 1000:
+                return members, last_id
+
+    def clear(self) -> None:
+        """프로세스 내 필터를 비웁니다."""
+        with self._lock:
+            self._filter = None
+            self._last_id = "0-0"
+            self._next_refresh = 0.0
+
+
+token_revocations = TokenRevocations()
@@ -0,0 +1,67 @@
+from typing import Iterable
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db.models import QuerySet
+
+SEARCH_CONFIG = "simple"
+USER_SEARCH_FIELDS = ("email", "first_name", "last_name", "phone_number")
+ADDRESS_SEARCH_FIELDS = (
+    "first_name",
+    "last_name",
+    "street_address_1",
+    "street_address_2",
+    "city",
+    "postal_code",
+    "country",
+    "phone",
+)
+
+# 인덱스와 조회가 같은 식을 사용해야 GIN 인덱스를 탈 수 있습니다.
+search_vector = SearchVector("search_document", config=SEARCH_CONFIG)
+
+
+def prepare_user_search_document_value(user, addresses: Iterable = ()) -> str:
+    """사용자와 주소의 검색 대상 값을 소문자로 모은 문서를 만든다.
+
+    이메일은 전체 값과 함께 로컬 파트와 도메인으로 나누어 넣어 접두어로
+    검색할 수 있게 한다.
+    """
+    values = [getattr(user, field) for field in USER_SEARCH_FIELDS]
+    local_part, _, domain = (user.email or "").partition("@")
+    values += [local_part, domain]
+    for address in addresses:
+        values += [getattr(address, field) for field in ADDRESS_SEARCH_FIELDS]
+    words = dict.fromkeys(
+        value.strip().lower() for value in values if value and value.strip()
+    )
+    return "\n".join(words)
+
+
+def update_user_search_documents(queryset: QuerySet) -> int:
+    """사용자의 주소를 다시 읽어 search_document를 한 번에 갱신한다."""
+    users = list(queryset.prefetch_related("addresses"))
+    for user in users:
+        user.search_document = prepare_user_search_document_value(
+            user, user.addresses.all()
+        )
+    return queryset.model.objects.bulk_update(users, ["search_document"])
+
+
+def build_search_query(text: str) -> SearchQuery | None:
+    """입력된 단어를 모두 포함하는(접두어 일치) tsquery를 만든다."""
+    terms = [
+        "'{}':*".format(term.replace("\\", "\\\\").replace("'", "''"))
+        for term in text.lower().split()
+    ]
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(terms), search_type="raw", config=SEARCH_CONFIG
+    )
+
+
+def search_users(queryset: QuerySet, text: str) -> QuerySet:
+    query = build_search_query(text)
+    if query is None:
+        return queryset.none()
+    return queryset.annotate(search=search_vector).filter(search=query)
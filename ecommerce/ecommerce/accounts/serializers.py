@@ -1,12 +1,22 @@
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from django.utils.crypto import get_random_string
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
+from ..core.db.routers import pin_if_user_pinned
+from .addresses import (
+    ADDRESS_BULK_MAX_SIZE,
+    ADDRESS_FIELDS,
+    DEFAULT_ADDRESS_TYPES,
+)
 from .exceptions import (
+    DuplicateEmailError,
     ExpiredPinError,
     InvalidCredentialsError,
     InvalidPinError,
@@ -15,6 +25,7 @@ from .exceptions import (
     PasswordValidationError,
     TooManyPinAttemptsError,
 )
+from .hashing import make_password
 from .jwt import get_payload, get_user_from_payload
 from .models import Address, User
 
@@ -46,13 +57,20 @@ class AccountRegisterSerializer(BaseAccountSerializer):
             "last_name",
             "phone_number",
         )
-        extra_kwargs = BaseAccountSerializer.Meta.extra_kwargs
+        extra_kwargs = {
+            **BaseAccountSerializer.Meta.extra_kwargs,
+            # 중복 이메일은 조회 대신 INSERT의 유일 제약 위반으로 확인한다.
+            "email": {"validators": []},
+        }
 
     def create(self, validated_data: dict[str, Any]) -> User:
-        user = super().create(validated_data)
-        user.set_password(validated_data["password"])
-        user.save(update_fields=["password"])
-        return user
+        """해시된 비밀번호를 포함해 한 번의 INSERT로 사용자를 생성한다."""
+        validated_data["password"] = make_password(validated_data["password"])
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as e:
+            raise DuplicateEmailError from e
 
 
 class AccountConfirmationSerializer(BaseAccountSerializer):
@@ -75,8 +93,8 @@ class AccountConfirmationSerializer(BaseAccountSerializer):
         return value
 
     def validate_email(self, value: str) -> str:
-        """계정이 이미 활성화되었는지 확인한다."""
-        if User.objects.filter(email=value, is_active=True).exists():
+        """계정이 이미 활성화되었는지 확인한다. 뷰가 조회한 사용자를 쓴다."""
+        if self.instance.is_active:
             raise serializers.ValidationError
         return value
 
@@ -88,17 +106,40 @@ class TokenCreateSerializer(BaseAccountSerializer):
     password = serializers.CharField()
 
     def validate_password(self, value: str) -> str:
-        return super().validate_password(value)
+        """로그인 시에는 비밀번호 생성 규칙을 검사하지 않는다."""
+        return value
+
+    @staticmethod
+    def get_user(email: str) -> User | None:
+        """다른 클라이언트에서 방금 인증을 마친 사용자는 레플리카에 아직
+        반영되지 않았을 수 있으므로 프라이머리에서 조회한다."""
+        pin_if_user_pinned(email)
+        return User.objects.filter(email=email).first()
+
+    @staticmethod
+    async def aget_user(email: str) -> User | None:
+        await sync_to_async(pin_if_user_pinned)(email)
+        return await User.objects.filter(email=email).afirst()
 
     def validate_email(self, value: str) -> str:
-        try:
-            user = User.objects.get(email=value)
-        except User.DoesNotExist:
+        """사용자를 한 번만 조회하여 서비스에서 재사용하도록 보관한다.
+
+        비동기 뷰는 미리 조회한 사용자를 context의 user로 전달한다.
+        """
+        if "user" in self.context:
+            self._user = self.context["user"]
+        else:
+            self._user = self.get_user(value)
+        if self._user is None:
             raise InvalidCredentialsError
-        if not user.is_active:
+        if not self._user.is_active:
             raise NotConfirmedError
         return value
 
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        attrs["user"] = self._user
+        return attrs
+
 
 class BaseTokenInputSerializer(serializers.Serializer):
     """토큰 확인 시리얼라이저의 베이스 클래스"""
@@ -110,12 +151,23 @@ class BaseTokenInputSerializer(serializers.Serializer):
         fields = ("token", "user")
 
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
-        """토큰이 유효한지 확인한다."""
-        try:
-            payload = get_payload(attrs["token"])
-            user = get_user_from_payload(payload)
-        except Exception as e:
-            raise JWTInvalidTokenError from e
+        """토큰이 유효한지 확인한다.
+
+        비동기 뷰는 미리 확인한 (사용자, payload)를 context의 principal로
+        전달하고, 확인에 실패했다면 None을 전달한다.
+        """
+        if "principal" in self.context:
+            principal = self.context["principal"]
+        else:
+            try:
+                payload = get_payload(attrs["token"])
+                principal = (get_user_from_payload(payload), payload)
+            except Exception as e:
+                raise JWTInvalidTokenError from e
+        if principal is None:
+            raise JWTInvalidTokenError
+        user, payload = principal
+        attrs["payload"] = payload
         attrs["user"] = user
         return attrs
 
@@ -126,9 +178,89 @@ class TokenRefreshSerializer(BaseTokenInputSerializer):
     class Meta:
         fields = BaseTokenInputSerializer.Meta.fields
 
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """리프레시 토큰인지 확인한다."""
+        attrs = super().validate(attrs)
+        if attrs["payload"].get("type") != settings.JWT_REFRESH_TYPE:
+            raise InvalidCredentialsError
+        return attrs
+
 
 class TokenVerifySerializer(BaseTokenInputSerializer):
     """토큰 확인 시리얼라이저"""
 
     class Meta:
         fields = BaseTokenInputSerializer.Meta.fields
+
+
+class TokenRevokeSerializer(BaseTokenInputSerializer):
+    """토큰 폐기 시리얼라이저. all이면 사용자의 모든 토큰을 폐기한다."""
+
+    all = serializers.BooleanField(default=False, write_only=True)
+
+    class Meta:
+        fields = (*BaseTokenInputSerializer.Meta.fields, "all")
+
+
+class UserListSerializer(serializers.ModelSerializer):
+    """스태프용 사용자 목록/검색 결과 시리얼라이저"""
+
+    class Meta:
+        model = User
+        fields = (
+            "id",
+            "uuid",
+            "email",
+            "username",
+            "first_name",
+            "last_name",
+            "phone_number",
+            "is_active",
+            "is_staff",
+            "date_joined",
+        )
+        read_only_fields = fields
+
+
+class AddressSerializer(serializers.ModelSerializer):
+    """주소록 항목 시리얼라이저. id가 있으면 기존 주소를 수정합니다."""
+
+    id = serializers.IntegerField(required=False, min_value=1)
+    is_default_shipping = serializers.BooleanField(read_only=True)
+    is_default_billing = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = Address
+        fields = (
+            "id",
+            *ADDRESS_FIELDS,
+            "is_default_shipping",
+            "is_default_billing",
+        )
+
+
+class AddressBulkUpsertSerializer(serializers.Serializer):
+    addresses = AddressSerializer(
+        many=True, allow_empty=False, max_length=ADDRESS_BULK_MAX_SIZE
+    )
+
+    def validate_addresses(
+        self, value: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        ids = [item["id"] for item in value if "id" in item]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError(_("Duplicate address id."))
+        return value
+
+
+class AddressBulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=ADDRESS_BULK_MAX_SIZE,
+    )
+
+
+class AddressDefaultSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=DEFAULT_ADDRESS_TYPES)
+    address = serializers.IntegerField(min_value=1, allow_null=True)
@@ -1,16 +1,24 @@
+from functools import partial
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 
+from ..core.tracing import traced
 from . import emails
-from .exceptions import InvalidCredentialsError
-from .jwt import (
-    create_access_token,
-    create_refresh_token,
-    get_payload,
-    get_user_from_payload,
+from .exceptions import DuplicateEmailError, InvalidCredentialsError
+from .hashing import (
+    amake_password,
+    averify_password,
+    rehash_password_later,
+    verify_password,
 )
-from .models import User
+from .jwt import create_access_token, create_refresh_token
+from .models import User, generate_pin
+from .refresh import refresh_token_families
+from .revocation import token_revocations
 
 
 class AccountService:
@@ -19,46 +27,126 @@ class AccountService:
         self.request = request
 
     def create_user(self) -> User:
-        """사용자를 생성하고 이메일 인증이 활성화되어 있으면 이메일을 보냅니다."""
-        instance = self.serializer.save()
+        """사용자를 한 번의 INSERT로 생성하고 이메일 인증이 활성화되어 있으면
+        커밋 후에 이메일을 보냅니다."""
+        instance = self.serializer.save(**self._signup_fields())
         if settings.ENABLE_CONFIRMATION_BY_EMAIL:
-            pin = instance.set_pin()
-            emails.send_account_confirmation_email(instance, pin)
-        else:
-            instance.activate()
+            transaction.on_commit(
+                partial(
+                    emails.enqueue_account_confirmation_email,
+                    instance.email,
+                    instance.pin,
+                )
+            )
         return instance
 
-    def _retrieve_user_from_credentials(self, email, password) -> User | None:
-        """이메일과 비밀번호를 사용하여 사용자를 검색합니다."""
-        user = User.objects.filter(email=email, is_active=True).first()
-        if user and user.check_password(password):
-            return user
-        return None
+    async def acreate_user(self) -> User:
+        """해싱과 브로커 발행이 이벤트 루프를 막지 않도록 사용자를 생성합니다."""
+        validated_data = {
+            **self.serializer.validated_data,
+            **self._signup_fields(),
+        }
+        validated_data["password"] = await amake_password(
+            validated_data["password"]
+        )
+        try:
+            instance = await User.objects.acreate(**validated_data)
+        except IntegrityError as e:
+            raise DuplicateEmailError from e
+        self.serializer.instance = instance
+        if settings.ENABLE_CONFIRMATION_BY_EMAIL:
+            await sync_to_async(
+                emails.enqueue_account_confirmation_email,
+                thread_sensitive=False,
+            )(instance.email, instance.pin)
+        return instance
 
+    @staticmethod
+    def _signup_fields() -> dict[str, Any]:
+        """가입 시 INSERT에 함께 기록할 PIN과 활성화 상태를 반환합니다."""
+        if not settings.ENABLE_CONFIRMATION_BY_EMAIL:
+            return {"is_active": True}
+        return {"pin": generate_pin(), "pin_sent_at": timezone.now()}
+
+    @traced()
     def get_user(self) -> User:
-        """이메일과 비밀번호를 사용하여 사용자를 검색합니다."""
-        email = self.serializer.validated_data["email"]
+        """시리얼라이저가 조회한 사용자의 비밀번호를 확인합니다."""
+        user = self.serializer.validated_data["user"]
+        password = self.serializer.validated_data["password"]
+
+        is_correct, must_update = verify_password(password, user.password)
+        if not is_correct:
+            raise InvalidCredentialsError
+        if must_update:
+            rehash_password_later(user, password)
+        return user
+
+    @traced()
+    async def aget_user(self) -> User:
+        user = self.serializer.validated_data["user"]
         password = self.serializer.validated_data["password"]
 
-        user = self._retrieve_user_from_credentials(email, password)
-        if not user:
+        is_correct, must_update = await averify_password(
+            password, user.password
+        )
+        if not is_correct:
             raise InvalidCredentialsError
+        if must_update:
+            rehash_password_later(user, password)
         return user
 
-    def create_tokens(self, user: User) -> dict[str, Any]:
+    @traced()
+    def create_tokens(
+        self, user: User, refresh_claims: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """사용자에게 토큰을 발급합니다."""
         access_token = create_access_token(user)
-        refresh_token = create_refresh_token(user)
+        refresh_token = create_refresh_token(
+            user, refresh_claims or refresh_token_families.issue()
+        )
         return {
             settings.JWT_ACCESS_TYPE: access_token,
             settings.JWT_REFRESH_TYPE: refresh_token,
         }
 
+    @traced()
     def refresh_token(self) -> dict[str, Any]:
-        """토큰을 갱신하고 새로운 토큰을 반환합니다."""
-        token = self.serializer.validated_data["token"]
-        payload = get_payload(token)
-        if payload["type"] != settings.JWT_REFRESH_TYPE:
-            raise InvalidCredentialsError
-        user = get_user_from_payload(payload)
-        return self.create_tokens(user)
+        """토큰을 갱신하고 새로운 토큰을 반환합니다.
+
+        토큰 검증과 사용자 조회는 시리얼라이저에서 한 번만 수행됩니다.
+        """
+        payload = self.serializer.validated_data["payload"]
+        user = self.serializer.validated_data["user"]
+        claims = refresh_token_families.rotate(payload)
+        return self.create_tokens(user, claims)
+
+    @traced()
+    async def acreate_tokens(
+        self, user: User, refresh_claims: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        access_token = create_access_token(user)
+        refresh_token = create_refresh_token(
+            user, refresh_claims or await refresh_token_families.aissue()
+        )
+        return {
+            settings.JWT_ACCESS_TYPE: access_token,
+            settings.JWT_REFRESH_TYPE: refresh_token,
+        }
+
+    @traced()
+    async def arefresh_token(self) -> dict[str, Any]:
+        payload = self.serializer.validated_data["payload"]
+        user = self.serializer.validated_data["user"]
+        claims = await refresh_token_families.arotate(payload)
+        return await self.acreate_tokens(user, claims)
+
+    def revoke_tokens(self) -> None:
+        """제출된 토큰과 같은 패밀리의 리프레시 토큰을 폐기합니다. all이면
+        사용자에게 발급된 모든 토큰을 폐기합니다."""
+        payload = self.serializer.validated_data["payload"]
+        if self.serializer.validated_data["all"]:
+            token_revocations.revoke_user(payload["user_id"])
+            return
+        token_revocations.revoke_token(payload)
+        if payload.get("family"):
+            refresh_token_families.revoke(payload["family"])
@@ -0,0 +1,91 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from ..core.db.routers import pin_user_to_primary
+from ..core.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_QUEUE_WAIT
+from .cache import PRINCIPAL_FIELDS, principal_cache
+from .hashing import password_hashed
+from .models import Address, User
+from .search import update_user_search_documents
+
+
+@receiver(post_save, sender=User)
+def pin_user_after_write(sender, instance, **kwargs):
+    """변경된 사용자의 조회를 잠시 동안 프라이머리로 보냅니다.
+
+    토큰은 uuid로, 로그인은 이메일로 사용자를 조회하므로 둘 다 고정합니다.
+    """
+    pin_user_to_primary(instance.uuid)
+    pin_user_to_primary(instance.email)
+
+
+@receiver(post_save, sender=User)
+def invalidate_principal_cache(sender, instance, update_fields=None, **kwargs):
+    """인증 정보에 영향을 주는 필드가 저장되면 캐시를 무효화합니다."""
+    if update_fields and set(PRINCIPAL_FIELDS).isdisjoint(update_fields):
+        return
+    principal_cache.delete(instance.uuid)
+    transaction.on_commit(partial(principal_cache.delete, instance.uuid))
+
+
+@receiver(post_delete, sender=User)
+def delete_principal_cache(sender, instance, **kwargs):
+    """사용자가 삭제되면 캐시를 무효화합니다."""
+    principal_cache.delete(instance.uuid)
+
+
+@receiver(post_save, sender=Address)
+def update_search_document_on_address_save(
+    sender, instance, created, **kwargs
+):
+    """주소가 수정되면 연결된 사용자의 검색 문서를 갱신합니다."""
+    if not created:
+        update_user_search_documents(instance.user_addresses.all())
+
+
+@receiver(pre_delete, sender=Address)
+def remember_address_users(sender, instance, **kwargs):
+    instance._search_user_ids = list(
+        instance.user_addresses.values_list("pk", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Address)
+def update_search_document_on_address_delete(sender, instance, **kwargs):
+    user_ids = getattr(instance, "_search_user_ids", None)
+    if user_ids:
+        update_user_search_documents(User.objects.filter(pk__in=user_ids))
+
+
+@receiver(m2m_changed, sender=User.addresses.through)
+def update_search_document_on_addresses_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """사용자와 주소의 연결이 바뀌면 해당 사용자의 검색 문서를 갱신합니다."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            update_user_search_documents(User.objects.filter(pk=instance.pk))
+        return
+    if action == "pre_clear":
+        remember_address_users(Address, instance)
+    elif action in ("post_add", "post_remove"):
+        update_user_search_documents(User.objects.filter(pk__in=pk_set))
+    elif action == "post_clear":
+        update_search_document_on_address_delete(Address, instance)
+
+
+@receiver(password_hashed)
+def observe_password_hashing(
+    sender, operation, queue_wait, compute_time, **kwargs
+):
+    """비밀번호 해시의 대기 시간과 계산 시간을 지표로 기록합니다."""
+    PASSWORD_HASH_QUEUE_WAIT.labels(operation).observe(queue_wait)
+    PASSWORD_HASH_DURATION.labels(operation).observe(compute_time)
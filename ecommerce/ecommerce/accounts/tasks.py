@@ -0,0 +1,15 @@
+from typing import Any
+
+from ..celeryconf import app
+from .addresses import deduplicate_address_chunk
+
+
+@app.task
+def deduplicate_addresses(
+    after_id: int = 0, chunk_size: int = 1000
+) -> dict[str, Any]:
+    """주소 중복 제거를 한 청크씩 진행하고 남은 청크는 다시 예약합니다."""
+    next_id, merged = deduplicate_address_chunk(after_id, chunk_size)
+    if next_id is not None:
+        deduplicate_addresses.delay(next_id, chunk_size)
+    return {"next_id": next_id, "merged": merged}
@@ -1,20 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
 from unittest.mock import patch
 
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase, override_settings
 
+from ...core.db.routers import (
+    end_replica_reads,
+    get_replica_state,
+    start_replica_reads,
+)
 from ..exceptions import (
     ExpiredPinError,
     InvalidCredentialsError,
     InvalidPinError,
     JWTInvalidTokenError,
     PasswordValidationError,
+    RefreshTokenReusedError,
     TooManyPinAttemptsError,
 )
+from ..jwt import get_payload
 from ..models import User
+from ..refresh import refresh_token_families
 from ..serializers import (
     AccountConfirmationSerializer,
     AccountRegisterSerializer,
@@ -30,6 +43,7 @@ class AccountRegisterTestCase(APITestCase):
 
     def setUp(self) -> None:
         super().setUp()
+        cache.clear()
         self.client = APIClient()
         self.url = reverse("signup")
         self.model = User
@@ -81,7 +95,8 @@ class AccountRegisterTestCase(APITestCase):
     )
     @patch("ecommerce.accounts.emails._send_account_confirmation_email")
     def test_register_account(self, send_account_confirmation_email_mock):
-        response = self.client.post(self.url, self.data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, self.data, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(
             send_account_confirmation_email_mock.delay.call_count, 1
@@ -100,11 +115,52 @@ class AccountRegisterTestCase(APITestCase):
         self.assertEqual(self.model.objects.get().is_superuser, False)
         self.assertEqual(self.model.objects.get().groups.count(), 0)
         self.assertEqual(self.model.objects.get().user_permissions.count(), 0)
+        self.assertEqual(len(self.model.objects.get().pin), 6)
+        self.assertIsNotNone(self.model.objects.get().pin_sent_at)
+
+    @override_settings(ENABLE_CONFIRMATION_BY_EMAIL=True)
+    @patch("ecommerce.accounts.emails._send_account_confirmation_email")
+    def test_register_single_insert(
+        self, send_account_confirmation_email_mock
+    ):
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks() as callbacks:
+                response = self.client.post(self.url, self.data, format="json")
+                send_account_confirmation_email_mock.delay.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        statements = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "SAVEPOINT" not in query["sql"]
+        ]
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith("INSERT"))
+        for callback in callbacks:
+            callback()
+        send_account_confirmation_email_mock.delay.assert_called_once()
+
+    @override_settings(ENABLE_CONFIRMATION_BY_EMAIL=True)
+    @patch("ecommerce.accounts.emails._send_account_confirmation_email")
+    def test_register_duplicate_email(
+        self, send_account_confirmation_email_mock
+    ):
+        self.client.post(self.url, self.data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, self.data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data, {"email": ["user with this email already exists."]}
+        )
+        self.assertEqual(self.model.objects.count(), 1)
+        send_account_confirmation_email_mock.delay.assert_not_called()
 
 
 class AccountConfirmationViewTestCase(APITestCase):
     def setUp(self) -> None:
         super().setUp()
+        cache.clear()
         self.client = APIClient()
         self.url = reverse("confirm")
         self.model = User
@@ -177,8 +233,11 @@ class AccountConfirmationViewTestCase(APITestCase):
 
 
 class TokenCreateViewTestCase(APITestCase):
+    query_budget = 1
+
     def setUp(self) -> None:
         super().setUp()
+        cache.clear()
         self.client = APIClient()
         self.url = reverse("signin")
         self.model = User
@@ -210,16 +269,13 @@ class TokenCreateViewTestCase(APITestCase):
         with self.assertRaises(InvalidCredentialsError):
             serializer.validate_email(self.data["email"])
 
-    def test_validate_invalid_password(self):
-        serializer = self.serializer(data=self.data)
-        self.assertTrue(serializer.is_valid())
-
+    def test_password_validators_skipped(self):
         self.data["password"] = "short"
         serializer = self.serializer(data=self.data)
-        self.assertFalse(serializer.is_valid())
+        self.assertTrue(serializer.is_valid())
 
-        with self.assertRaises(PasswordValidationError):
-            serializer.validate_password(self.data["password"])
+        response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_invalid_credentials(self):
         self.data["password"] = "invalid_password"
@@ -234,10 +290,30 @@ class TokenCreateViewTestCase(APITestCase):
         self.assertIn("refresh", response.data)
         self.assertIn("refresh", response.cookies)
 
+    def test_query_budget(self):
+        with self.assertNumQueries(self.query_budget):
+            response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(DATABASE_REPLICA_ENABLED=True)
+    @patch(
+        "ecommerce.core.db.routers.replica_lag_monitor.is_lagging",
+        return_value=False,
+    )
+    def test_recently_confirmed_user_reads_primary(self, is_lagging_mock):
+        self.user.save()
+        token = start_replica_reads()
+        self.addCleanup(end_replica_reads, token)
+
+        serializer = self.serializer(data=self.data)
+        self.assertTrue(serializer.is_valid())
+        self.assertTrue(get_replica_state().pinned)
+
 
 class TokenVerifyViewTestCase(APITestCase):
     def setUp(self) -> None:
         super().setUp()
+        cache.clear()
         self.client = APIClient()
         self.token_url = reverse("signin")
         self.url = reverse("token_verify")
@@ -305,6 +381,7 @@ class TokenVerifyViewTestCase(APITestCase):
 class TokenRefreshViewTestCase(APITestCase):
     def setUp(self) -> None:
         super().setUp()
+        cache.clear()
         self.client = APIClient()
         self.token_url = reverse("signin")
         self.url = reverse("token_refresh")
@@ -376,3 +453,93 @@ class TokenRefreshViewTestCase(APITestCase):
         self.assertIn(
             str(JWTInvalidTokenError.default_detail), response.data["detail"]
         )
+
+    def test_access_token_rejected(self):
+        self.data["token"] = self.access_token
+        response = self.client.post(self.url, self.data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn(
+            str(InvalidCredentialsError.default_detail),
+            response.data["detail"],
+        )
+
+    @patch(
+        "ecommerce.accounts.serializers.get_payload", side_effect=get_payload
+    )
+    def test_token_decoded_once(self, get_payload_mock):
+        response = self.client.post(self.url, self.data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(get_payload_mock.call_count, 1)
+
+    def test_token_refresh_keeps_family(self):
+        response = self.client.post(self.url, self.data, format="json")
+        old_payload = get_payload(self.refresh_token)
+        new_payload = get_payload(response.data["refresh"])
+
+        self.assertEqual(new_payload["family"], old_payload["family"])
+        self.assertNotEqual(new_payload["jti"], old_payload["jti"])
+
+    def test_reused_token_revokes_family(self):
+        response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rotated_token = response.data["refresh"]
+
+        response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn(
+            str(RefreshTokenReusedError.default_detail),
+            response.data["detail"],
+        )
+
+        response = self.client.post(
+            self.url, {"token": rotated_token}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_concurrent_refresh_rotates_once(self):
+        payload = get_payload(self.refresh_token)
+        barrier = Barrier(8)
+
+        def rotate(_):
+            barrier.wait()
+            try:
+                return refresh_token_families.rotate(payload)
+            except RefreshTokenReusedError:
+                return None
+
+        with ThreadPoolExecutor(8) as executor:
+            rotated = [c for c in executor.map(rotate, range(8)) if c]
+
+        self.assertEqual(len(rotated), 1)
+        with self.assertRaises(RefreshTokenReusedError):
+            refresh_token_families.rotate(rotated[0])
+
+
+class AccountThrottleTestCase(APITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("signin")
+        self.data = {"email": "test@test.com", "password": "test1234!!"}
+
+    @patch.dict(
+        "rest_framework.throttling.SimpleRateThrottle.THROTTLE_RATES",
+        {"signin_email": "2/min"},
+    )
+    def test_signin_throttled_by_email(self):
+        for _ in range(2):
+            response = self.client.post(self.url, self.data, format="json")
+            self.assertEqual(
+                response.status_code, status.HTTP_401_UNAUTHORIZED
+            )
+        response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(
+            response.status_code, status.HTTP_429_TOO_MANY_REQUESTS
+        )
+
+        self.data["email"] = "other@test.com"
+        response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
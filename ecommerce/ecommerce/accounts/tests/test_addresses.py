@@ -0,0 +1,223 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..addresses import get_or_create_addresses
+from ..exceptions import SharedAddressError
+from ..models import Address, User
+
+
+def make_address(city="Seoul", **kwargs):
+    return {
+        "first_name": "Alice",
+        "last_name": "Kim",
+        "street_address_1": "1 Road",
+        "city": city,
+        "postal_code": "01234",
+        "country": "KR",
+        **kwargs,
+    }
+
+
+class AddressBookTestCase(APITestCase):
+    """주소록 API 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="alice@test.com", password="test1234!!", username="alice"
+        )
+        self.other = User.objects.create_user(
+            email="bob@test.com", password="test1234!!", username="bob"
+        )
+        self.other_address = Address.objects.create(**make_address("Busan"))
+        self.other.addresses.add(self.other_address)
+        self.client.force_authenticate(self.user)
+
+    def upsert(self, addresses):
+        return self.client.post(
+            reverse("address_book"), {"addresses": addresses}, format="json"
+        )
+
+    def count_queries(self, method, *args, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            response = method(*args, **kwargs)
+        self.assertLess(response.status_code, 300, response.data)
+        return len(context.captured_queries)
+
+    def test_list_uses_fixed_queries(self):
+        self.upsert([make_address()])
+        one = self.count_queries(self.client.get, reverse("address_book"))
+        self.upsert([make_address(f"City {i}") for i in range(20)])
+        many = self.count_queries(self.client.get, reverse("address_book"))
+        self.assertEqual(one, many)
+        self.assertEqual(one, 1)
+
+    def test_upsert_uses_fixed_queries(self):
+        few = self.count_queries(
+            self.upsert, [make_address(f"City {i}") for i in range(2)]
+        )
+        ids = [address.pk for address in self.user.addresses.all()]
+        many = self.count_queries(
+            self.upsert,
+            [make_address("Updated", id=pk) for pk in ids]
+            + [make_address(f"City {i}") for i in range(20)],
+        )
+        # 수정할 주소가 있으면 소유 확인, 연결 해제, 기본 주소 변경, 남은 주소
+        # 삭제 네 문장이 늘어난다.
+        self.assertEqual(many, few + 4)
+
+    def test_upsert(self):
+        response = self.upsert([make_address(), make_address("Incheon")])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [address["city"] for address in response.data],
+            ["Seoul", "Incheon"],
+        )
+        first_id = response.data[0]["id"]
+
+        response = self.upsert(
+            [make_address("Daegu", id=first_id), make_address("Ulsan")]
+        )
+        self.assertEqual(
+            [address["city"] for address in response.data],
+            ["Incheon", "Daegu", "Ulsan"],
+        )
+        self.assertFalse(Address.objects.filter(pk=first_id).exists())
+        self.user.refresh_from_db()
+        self.assertIn("daegu", self.user.search_document)
+        self.assertIn("ulsan", self.user.search_document)
+
+    def test_upsert_rejects_foreign_address(self):
+        response = self.upsert(
+            [
+                make_address("Daegu", id=self.other_address.pk),
+                make_address(),
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.other_address.refresh_from_db()
+        self.assertEqual(self.other_address.city, "Busan")
+        self.assertFalse(self.user.addresses.exists())
+
+    def test_upsert_validation(self):
+        address_id = self.upsert([make_address()]).data[0]["id"]
+        response = self.upsert(
+            [make_address(id=address_id), make_address(id=address_id)]
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.upsert([{"city": "Seoul"}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.upsert([])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_set_default(self):
+        address_id = self.upsert([make_address()]).data[0]["id"]
+        url = reverse("address_default")
+        response = self.client.post(
+            url, {"type": "shipping", "address": address_id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data[0]["is_default_shipping"])
+        self.assertFalse(response.data[0]["is_default_billing"])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.default_shipping_address_id, address_id)
+
+        response = self.client.post(
+            url, {"type": "shipping", "address": None}, format="json"
+        )
+        self.assertFalse(response.data[0]["is_default_shipping"])
+
+        response = self.client.post(
+            url,
+            {"type": "billing", "address": self.other_address.pk},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_bulk_delete(self):
+        response = self.upsert([make_address(), make_address("Incheon")])
+        seoul, incheon = [address["id"] for address in response.data]
+        self.client.post(
+            reverse("address_default"),
+            {"type": "billing", "address": seoul},
+            format="json",
+        )
+
+        url = reverse("address_bulk_delete")
+        response = self.client.post(
+            url, {"ids": [seoul, self.other_address.pk]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.post(url, {"ids": [seoul]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [address["id"] for address in response.data], [incheon]
+        )
+        self.assertFalse(Address.objects.filter(pk=seoul).exists())
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.default_billing_address_id)
+        self.assertNotIn("seoul", self.user.search_document)
+        self.assertTrue(
+            Address.objects.filter(pk=self.other_address.pk).exists()
+        )
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(None)
+        response = self.client.get(reverse("address_book"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_identical_addresses_share_a_row(self):
+        response = self.upsert(
+            [make_address("  busan "), make_address("Busan")]
+        )
+        self.assertEqual(
+            [address["id"] for address in response.data],
+            [self.other_address.pk],
+        )
+
+        # 공유하는 주소를 수정하거나 지워도 다른 사용자의 주소는 그대로다.
+        response = self.upsert(
+            [make_address("Daegu", id=self.other_address.pk)]
+        )
+        self.assertEqual(
+            [address["city"] for address in response.data], ["Daegu"]
+        )
+        self.other_address.refresh_from_db()
+        self.assertEqual(self.other_address.city, "Busan")
+        self.assertEqual(
+            list(self.other.addresses.all()), [self.other_address]
+        )
+
+        self.client.post(
+            reverse("address_bulk_delete"),
+            {"ids": [response.data[0]["id"]]},
+            format="json",
+        )
+        self.assertFalse(Address.objects.filter(city="Daegu").exists())
+
+    def test_direct_save_of_shared_row(self):
+        self.upsert([make_address("Busan")])
+        self.other_address.city = "Daegu"
+        with self.assertRaises(SharedAddressError):
+            self.other_address.save()
+        self.other_address.refresh_from_db()
+        self.assertEqual(self.other_address.city, "Busan")
+
+        # 한 사용자만 쓰는 행은 새 내용의 행으로 옮겨지고, 같은 내용의 행이
+        # 이미 있으면 그 행을 쓴다.
+        self.client.post(
+            reverse("address_bulk_delete"),
+            {"ids": [self.other_address.pk]},
+            format="json",
+        )
+        (seoul,) = get_or_create_addresses([make_address()])
+        self.other_address.city = "seoul"
+        self.other_address.save()
+        self.assertEqual(self.other_address.pk, seoul.pk)
+        self.assertEqual(list(self.other.addresses.all()), [seoul])
+        self.assertFalse(Address.objects.filter(city="Busan").exists())
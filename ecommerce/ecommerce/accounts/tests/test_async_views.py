@@ -0,0 +1,125 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from ..authentication import JWTAuthentication
+from ..models import User
+from ..services import AccountService
+
+
+@override_settings(ROOT_URLCONF="ecommerce.accounts.async_urls")
+class AsyncAccountViewTestCase(TestCase):
+    """ASGI 비동기 계정 API 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password="test1234!!",
+            username="test_user",
+            is_active=True,
+        )
+        self.tokens = AccountService(None).create_tokens(self.user)
+
+    async def post(self, name, data):
+        return await self.async_client.post(
+            reverse(name), data, content_type="application/json"
+        )
+
+    @override_settings(ENABLE_CONFIRMATION_BY_EMAIL=True)
+    @patch("ecommerce.accounts.emails._send_account_confirmation_email")
+    async def test_signup(self, send_account_confirmation_email_mock):
+        response = await self.post(
+            "signup",
+            {
+                "email": "new@test.com",
+                "password": "test1234!!",
+                "username": "new_user",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["email"], "new@test.com")
+        self.assertEqual(
+            send_account_confirmation_email_mock.delay.call_count, 1
+        )
+
+        user = await User.objects.aget(email="new@test.com")
+        self.assertFalse(user.is_active)
+        self.assertTrue(user.pin)
+        self.assertIsNotNone(user.pin_sent_at)
+        self.assertTrue(user.check_password("test1234!!"))
+
+    async def test_signup_duplicate_email(self):
+        response = await self.post(
+            "signup",
+            {
+                "email": self.user.email,
+                "password": "test1234!!",
+                "username": "new_user",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("email", response.json())
+
+    async def test_confirm(self):
+        self.user.is_active = False
+        self.user.pin = "123456"
+        self.user.pin_sent_at = timezone.now()
+        await self.user.asave()
+
+        response = await self.post(
+            "confirm", {"email": self.user.email, "pin": "123456"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        await self.user.arefresh_from_db()
+        self.assertTrue(self.user.is_active)
+
+    async def test_signin(self):
+        response = await self.post(
+            "signin", {"email": self.user.email, "password": "test1234!!"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.json())
+        self.assertIn("refresh", response.cookies)
+
+    async def test_signin_invalid_credentials(self):
+        response = await self.post(
+            "signin", {"email": self.user.email, "password": "wrong1234!!"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("detail", response.json())
+
+    async def test_token_verify(self):
+        response = await self.post(
+            "token_verify", {"token": self.tokens["access"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    async def test_token_verify_invalid_token(self):
+        response = await self.post("token_verify", {"token": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_token_refresh(self):
+        response = await self.post(
+            "token_refresh", {"token": self.tokens["refresh"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.json()["refresh"], self.tokens["refresh"])
+
+        response = await self.post(
+            "token_refresh", {"token": self.tokens["refresh"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_authenticate(self):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}"
+        )
+        user, _ = await JWTAuthentication().aauthenticate(request)
+        self.assertEqual(user.pk, self.user.pk)
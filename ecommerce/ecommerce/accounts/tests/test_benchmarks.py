@@ -0,0 +1,71 @@
+import tempfile
+from pathlib import Path
+
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from ..benchmarks import (
+    BENCHMARK_PASSWORD,
+    BenchmarkResult,
+    find_regressions,
+    get_cases,
+    load_baseline,
+    run_case,
+    save_baseline,
+)
+from ..models import User
+
+
+class BenchmarkTestCase(APITestCase):
+    """마이크로벤치마크 케이스와 기준값 비교 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password=BENCHMARK_PASSWORD,
+            username="test_user",
+            is_active=True,
+        )
+
+    def test_cases_run(self):
+        cases = get_cases(self.user)
+        names = [case.name for case in cases]
+        self.assertIn("check_password[argon2]", names)
+
+        for case in cases:
+            if case.name.startswith("check_password"):
+                continue
+            result = run_case(case, duration=0, min_iterations=2)
+            self.assertEqual(result.iterations, 2)
+            self.assertLessEqual(result.p50_us, result.p99_us)
+
+    def test_find_regressions(self):
+        results = [
+            BenchmarkResult("fast", 10, 1000, 100, 200),
+            BenchmarkResult("slow", 10, 500, 200, 400),
+            BenchmarkResult("new", 10, 500, 200, 400),
+        ]
+        baseline = {"fast": {"p50_us": 90}, "slow": {"p50_us": 100}}
+
+        self.assertEqual(find_regressions(results, baseline, 0.3), ["slow"])
+
+    def test_save_baseline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            self.assertEqual(load_baseline(path), {})
+
+            save_baseline([BenchmarkResult("case", 10, 1000, 100, 200)], path)
+
+            self.assertEqual(
+                load_baseline(path),
+                {
+                    "case": {
+                        "iterations": 10,
+                        "ops_per_sec": 1000,
+                        "p50_us": 100,
+                        "p99_us": 200,
+                    }
+                },
+            )
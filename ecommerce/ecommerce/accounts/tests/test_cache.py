@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from ..cache import LocalTTLCache, principal_cache
+from ..exceptions import JWTInvalidTokenError
+from ..jwt import create_access_token, get_payload, get_user_from_payload
+from ..models import User
+
+
+class LocalTTLCacheTestCase(APITestCase):
+    """프로세스 내 LRU 캐시 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        local = LocalTTLCache(maxsize=2, ttl=60)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+
+        self.assertEqual(local.get("a"), 1)
+        self.assertIsNone(local.get("b"))
+        self.assertEqual(local.get("c"), 3)
+
+    def test_expires_after_ttl(self):
+        local = LocalTTLCache(maxsize=2, ttl=10)
+        with patch("ecommerce.accounts.cache.time.monotonic", return_value=0):
+            local.set("a", 1)
+        with patch("ecommerce.accounts.cache.time.monotonic", return_value=5):
+            self.assertEqual(local.get("a"), 1)
+        with patch("ecommerce.accounts.cache.time.monotonic", return_value=10):
+            self.assertIsNone(local.get("a"))
+
+
+class PrincipalCacheTestCase(APITestCase):
+    """인증 사용자 캐시 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        principal_cache.clear()
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password="test1234!!",
+            username="test_user",
+            is_active=True,
+        )
+        self.payload = get_payload(create_access_token(self.user))
+
+    def test_cached_lookup_does_not_query_database(self):
+        get_user_from_payload(self.payload)
+
+        with self.assertNumQueries(0):
+            user = get_user_from_payload(self.payload)
+        self.assertEqual(user, self.user)
+        self.assertEqual(user.email, self.user.email)
+        self.assertEqual(user.is_staff, self.user.is_staff)
+
+    def test_shared_tier_fills_local_tier(self):
+        get_user_from_payload(self.payload)
+        principal_cache.clear()
+
+        with self.assertNumQueries(0):
+            user = get_user_from_payload(self.payload)
+        self.assertEqual(user, self.user)
+
+    def test_deactivation_invalidates_cache(self):
+        get_user_from_payload(self.payload)
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+
+        with self.assertRaises(JWTInvalidTokenError):
+            get_user_from_payload(self.payload)
+
+    def test_jwt_token_key_rotation_invalidates_cache(self):
+        get_user_from_payload(self.payload)
+        self.user.jwt_token_key = "rotated-key"
+        self.user.save(update_fields=["jwt_token_key"])
+
+        with self.assertRaises(JWTInvalidTokenError):
+            get_user_from_payload(self.payload)
+
+    def test_staff_change_invalidates_cache(self):
+        get_user_from_payload(self.payload)
+        self.user.is_staff = True
+        self.user.save()
+
+        user = get_user_from_payload(self.payload)
+        self.assertTrue(user.is_staff)
+
+    def test_unrelated_update_keeps_cache(self):
+        get_user_from_payload(self.payload)
+        self.user.increase_pin_failures()
+
+        with self.assertNumQueries(0):
+            get_user_from_payload(self.payload)
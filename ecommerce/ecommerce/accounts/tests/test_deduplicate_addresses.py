@@ -0,0 +1,86 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import Address, User, get_address_content_hash
+from ..tasks import deduplicate_addresses
+
+ADDRESS = {
+    "first_name": "Alice",
+    "last_name": "Kim",
+    "street_address_1": "1 Road",
+    "city": "Seoul",
+    "postal_code": "01234",
+    "country": "KR",
+}
+
+
+class DeduplicateAddressesTestCase(TestCase):
+    """기존 주소 중복 제거 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        # 해시가 도입되기 전의 행처럼 content_hash 없이 넣는다.
+        self.addresses = Address.objects.bulk_create(
+            [
+                Address(**ADDRESS),
+                Address(**{**ADDRESS, "city": "SEOUL "}),
+                Address(**{**ADDRESS, "city": "Busan"}),
+                Address(**ADDRESS),
+            ]
+        )
+        (
+            self.seoul,
+            self.seoul_upper,
+            self.busan,
+            self.seoul_again,
+        ) = self.addresses
+        self.alice = User.objects.create_user(
+            email="alice@test.com", password="test1234!!", username="alice"
+        )
+        self.bob = User.objects.create_user(
+            email="bob@test.com", password="test1234!!", username="bob"
+        )
+        self.alice.addresses.add(self.seoul, self.seoul_upper, self.busan)
+        self.bob.addresses.add(self.seoul_again)
+        User.objects.filter(pk=self.bob.pk).update(
+            default_shipping_address=self.seoul_again,
+            default_billing_address=self.seoul_upper,
+        )
+
+    def test_command(self):
+        stdout = StringIO()
+        call_command("deduplicate_addresses", "--chunk-size=2", stdout=stdout)
+
+        self.assertIn("Merged 2 duplicate addresses", stdout.getvalue())
+        self.assertEqual(
+            list(Address.objects.order_by("pk")), [self.seoul, self.busan]
+        )
+        self.assertFalse(Address.objects.filter(content_hash=None).exists())
+        self.assertEqual(
+            Address.objects.get(pk=self.seoul.pk).content_hash,
+            get_address_content_hash(ADDRESS),
+        )
+        self.assertEqual(
+            list(self.alice.addresses.order_by("pk")), [self.seoul, self.busan]
+        )
+        self.bob.refresh_from_db()
+        self.assertEqual(list(self.bob.addresses.all()), [self.seoul])
+        self.assertEqual(self.bob.default_shipping_address, self.seoul)
+        self.assertEqual(self.bob.default_billing_address, self.seoul)
+
+    def test_merges_into_hashed_row(self):
+        hashed = Address.objects.create(**{**ADDRESS, "city": "Busan"})
+        self.assertIsNotNone(hashed.content_hash)
+
+        call_command("deduplicate_addresses", stdout=StringIO())
+        self.assertFalse(Address.objects.filter(pk=self.busan.pk).exists())
+        self.assertIn(hashed, self.alice.addresses.all())
+
+    def test_task_reschedules_until_done(self):
+        with patch.object(deduplicate_addresses, "delay") as delay:
+            result = deduplicate_addresses(0, 3)
+        self.assertEqual(result, {"next_id": self.busan.pk, "merged": 1})
+        delay.assert_called_once_with(self.busan.pk, 3)
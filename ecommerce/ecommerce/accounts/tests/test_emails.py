@@ -1,9 +1,16 @@
+import json
+import smtplib
+import time
+from unittest import skipUnless
 from unittest.mock import patch
 
+from celery.exceptions import Retry
+from django.conf import settings
 from django.core import mail
 from django.utils.crypto import get_random_string
-from rest_framework.test import APIClient, APITestCase
+from rest_framework.test import APIClient, APITestCase, override_settings
 
+from ...core.redis import get_redis_client
 from .. import emails
 from ..models import User
 
@@ -35,3 +42,217 @@ class AccountEmailTestCase(APITestCase):
             mail.outbox[0].body,
             f"Enter this code to verify your account: {pin}",
         )
+
+    def test_connection_reused(self):
+        with patch.object(
+            emails, "get_connection", wraps=emails.get_connection
+        ) as get_connection_mock:
+            emails.mail_connection.close()
+            for _ in range(3):
+                emails._send_account_confirmation_email(self.user.email, "1")
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(get_connection_mock.call_count, 1)
+
+    def test_reconnect_after_disconnect(self):
+        connection = emails.mail_connection.get()
+        with patch.object(
+            connection,
+            "send_messages",
+            side_effect=smtplib.SMTPServerDisconnected,
+        ):
+            emails._send_account_confirmation_email(self.user.email, "1")
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIsNot(emails.mail_connection.get(), connection)
+
+    @override_settings(EMAIL_RETRY_DELAY=30)
+    def test_transient_failure_retried(self):
+        task = emails._send_account_confirmation_email
+        error = smtplib.SMTPDataError(421, b"Try again later")
+        with patch.object(
+            emails, "_send_message", side_effect=error
+        ), patch.object(task, "retry", side_effect=Retry) as retry_mock:
+            with self.assertRaises(Retry):
+                task(self.user.email, "1")
+
+        retry_mock.assert_called_once_with(exc=error, countdown=30)
+
+    def test_permanent_failure_not_retried(self):
+        task = emails._send_account_confirmation_email
+        with patch.object(
+            emails,
+            "_send_message",
+            side_effect=smtplib.SMTPRecipientsRefused({}),
+        ), patch.object(task, "retry") as retry_mock:
+            with self.assertRaises(smtplib.SMTPRecipientsRefused):
+                task(self.user.email, "1")
+
+        retry_mock.assert_not_called()
+
+
+@skipUnless(settings.REDIS_URL, "REDIS_URL is not configured")
+@override_settings(
+    EMAIL_BATCH_ENABLED=True, EMAIL_BATCH_SIZE=3, EMAIL_BATCH_WINDOW=2
+)
+class AccountEmailBatchTestCase(APITestCase):
+    """계정 확인 이메일 배치 전송 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.redis = get_redis_client()
+        (
+            self.queue,
+            flush_lock,
+            self.processing_set,
+        ) = emails.confirmation_email_keys()
+        self.redis.delete(
+            self.queue,
+            flush_lock,
+            self.processing_set,
+            *self.redis.keys(f"{self.processing_set}:*"),
+        )
+
+    @patch("ecommerce.accounts.emails._flush_account_confirmation_emails")
+    def test_flush_scheduled_once_per_window(self, flush_mock):
+        for i in range(2):
+            emails.enqueue_account_confirmation_email(f"{i}@test.com", "1")
+
+        flush_mock.apply_async.assert_called_once_with(countdown=2)
+        flush_mock.delay.assert_not_called()
+        self.assertEqual(len(mail.outbox), 0)
+
+    @patch("ecommerce.accounts.emails._flush_account_confirmation_emails")
+    def test_flush_when_batch_is_full(self, flush_mock):
+        for i in range(3):
+            emails.enqueue_account_confirmation_email(f"{i}@test.com", "1")
+
+        flush_mock.delay.assert_called_once_with()
+
+    @patch(
+        "ecommerce.accounts.emails._flush_account_confirmation_emails.delay"
+    )
+    def test_flush_sends_batch(self, delay_mock):
+        for i in range(4):
+            self.redis.rpush(
+                self.queue,
+                json.dumps([f"{i}@test.com", "1"]),
+            )
+
+        result = emails._flush_account_confirmation_emails()
+        self.assertEqual(result, {"sent": 3, "failed": [], "retrying": []})
+        self.assertEqual(len(mail.outbox), 3)
+        delay_mock.assert_called_once_with()
+
+    @patch(
+        "ecommerce.accounts.emails._flush_account_confirmation_emails.delay"
+    )
+    def test_flush_reports_failed_messages(self, delay_mock):
+        for i in range(3):
+            self.redis.rpush(
+                self.queue,
+                json.dumps([f"{i}@test.com", "1"]),
+            )
+
+        connection = emails.mail_connection.get()
+        send_messages = connection.send_messages
+
+        def fail_second(messages):
+            if messages[0].to == ["1@test.com"]:
+                raise smtplib.SMTPRecipientsRefused({})
+            return send_messages(messages)
+
+        with patch.object(
+            connection, "send_messages", fail_second
+        ), self.assertLogs(emails.logger, "WARNING"):
+            result = emails._flush_account_confirmation_emails()
+
+        self.assertEqual(
+            result, {"sent": 2, "failed": ["1@test.com"], "retrying": []}
+        )
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(self.redis.llen(self.queue), 0)
+
+    @override_settings(EMAIL_MAX_RETRIES=1, EMAIL_RETRY_DELAY=30)
+    @patch(
+        "ecommerce.accounts.emails"
+        "._flush_account_confirmation_emails.apply_async"
+    )
+    def test_flush_requeues_transient_failures(self, apply_async_mock):
+        self.redis.rpush(self.queue, json.dumps(["0@test.com", "1"]))
+        connection = emails.mail_connection.get()
+
+        with patch.object(
+            connection,
+            "send_messages",
+            side_effect=smtplib.SMTPDataError(421, b"Try again later"),
+        ), self.assertLogs(emails.logger, "WARNING"):
+            result = emails._flush_account_confirmation_emails()
+            self.assertEqual(
+                result, {"sent": 0, "failed": [], "retrying": ["0@test.com"]}
+            )
+            apply_async_mock.assert_called_once_with(countdown=30)
+
+            result = emails._flush_account_confirmation_emails()
+            self.assertEqual(
+                result, {"sent": 0, "failed": ["0@test.com"], "retrying": []}
+            )
+
+        self.assertEqual(self.redis.llen(self.queue), 0)
+
+    @patch(
+        "ecommerce.accounts.emails._flush_account_confirmation_emails.delay"
+    )
+    def test_interrupted_flush_recovered(self, delay_mock):
+        for i in range(3):
+            self.redis.rpush(
+                self.queue,
+                json.dumps([f"{i}@test.com", "1"]),
+            )
+        connection = emails.mail_connection.get()
+        send_messages = connection.send_messages
+
+        def crash_on_second(messages):
+            if messages[0].to == ["1@test.com"]:
+                raise SystemExit
+            return send_messages(messages)
+
+        with patch.object(connection, "send_messages", crash_on_second):
+            with self.assertRaises(SystemExit):
+                emails._flush_account_confirmation_emails()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(self.redis.llen(self.queue), 0)
+        (processing,) = self.redis.zrange(self.processing_set, 0, -1)
+        self.assertEqual(self.redis.llen(processing), 2)
+
+        result = emails._flush_account_confirmation_emails()
+        self.assertEqual(result["sent"], 0)
+
+        with override_settings(EMAIL_FLUSH_TIMEOUT=0), self.assertLogs(
+            emails.logger, "WARNING"
+        ):
+            result = emails._flush_account_confirmation_emails()
+        self.assertEqual(result, {"sent": 2, "failed": [], "retrying": []})
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [["0@test.com"], ["1@test.com"], ["2@test.com"]],
+        )
+        self.assertFalse(self.redis.exists(processing))
+        self.assertEqual(self.redis.zcard(self.processing_set), 0)
+
+    @patch(
+        "ecommerce.accounts.emails._flush_account_confirmation_emails.delay"
+    )
+    def test_redelivered_flush_recovers_its_messages(self, delay_mock):
+        processing = f"{self.processing_set}:task-id"
+        self.redis.rpush(processing, json.dumps(["0@test.com", "1"]))
+        self.redis.zadd(self.processing_set, {processing: time.time()})
+
+        with self.assertLogs(emails.logger, "WARNING"):
+            result = emails._flush_account_confirmation_emails.apply(
+                task_id="task-id"
+            ).get()
+
+        self.assertEqual(result, {"sent": 1, "failed": [], "retrying": []})
+        self.assertEqual(len(mail.outbox), 1)
@@ -0,0 +1,164 @@
+import csv
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from .. import export
+from ..models import Address, User
+from ..services import AccountService
+from ..views import UserExportView
+
+
+class UserExportTestCase(APITestCase):
+    """사용자 내보내기 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = APIClient()
+        self.url = reverse("user_export")
+        self.staff_user = User.objects.create_superuser(
+            email="admin@test.com",
+            password="password1234!!",
+            username="admin",
+        )
+        self.users = [
+            User.objects.create_user(
+                email=f"user{i}@test.com",
+                password="test1234!!",
+                username=f"user{i}",
+            )
+            for i in range(4)
+        ]
+        self.address = Address.objects.create(
+            first_name="Alice",
+            last_name="Kim",
+            street_address_1="1 Road",
+            city="Seoul",
+            postal_code="01234",
+            country="KR",
+        )
+        self.users[0].addresses.add(self.address)
+        self.users[0].default_shipping_address = self.address
+        self.users[0].save()
+
+    def test_export_ndjson(self):
+        self.client.force_authenticate(self.staff_user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+
+        records = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual(len(records), 5)
+        record = next(r for r in records if r["email"] == "user0@test.com")
+        self.assertEqual(record["default_shipping_address"]["city"], "Seoul")
+        self.assertIsNone(record["default_billing_address"])
+        self.assertEqual(len(record["addresses"]), 1)
+        self.assertNotIn("password", record)
+
+    def test_export_csv(self):
+        self.client.force_authenticate(self.staff_user)
+        response = self.client.get(self.url, {"output": "csv"})
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual(len(rows), 5)
+        row = next(r for r in rows if r["email"] == "user0@test.com")
+        self.assertEqual(row["shipping_city"], "Seoul")
+        self.assertEqual(row["billing_city"], "")
+
+    def test_export_staff_only(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(self.users[1])
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_invalid_format(self):
+        self.client.force_authenticate(self.staff_user)
+        response = self.client.get(self.url, {"output": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_command_reads_in_chunks(self):
+        stdout = StringIO()
+        # 서버 측 커서 1회와 청크(2명)마다 주소 조회 1회
+        with self.assertNumQueries(4):
+            call_command("export_users", "--chunk-size=2", stdout=stdout)
+        self.assertEqual(len(stdout.getvalue().splitlines()), 5)
+
+
+@override_settings(ROOT_URLCONF="ecommerce.accounts.async_urls")
+class AsyncUserExportTestCase(TransactionTestCase):
+    """ASGI 핸들러를 통한 사용자 내보내기 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.staff_user = User.objects.create_superuser(
+            email="admin@test.com",
+            password="password1234!!",
+            username="admin",
+            is_active=True,
+        )
+        for i in range(4):
+            User.objects.create_user(
+                email=f"user{i}@test.com",
+                password="test1234!!",
+                username=f"user{i}",
+            )
+        self.token = AccountService(None).create_tokens(self.staff_user)[
+            "access"
+        ]
+
+    def test_streams_without_buffering(self):
+        events = []
+        messages = []
+        iter_users = export.iter_users
+
+        def recording_iter_users(*args):
+            for record in iter_users(*args):
+                events.append("record")
+                yield record
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                events.append("body")
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "path": reverse("user_export"),
+            "query_string": b"",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"authorization", f"Bearer {self.token}".encode()),
+            ],
+        }
+        with patch.object(
+            export, "iter_users", recording_iter_users
+        ), patch.object(UserExportView, "chunk_size", 2):
+            async_to_sync(ASGIHandler())(scope, receive, send)
+
+        self.assertEqual(messages[0]["status"], status.HTTP_200_OK)
+        body = b"".join(m.get("body", b"") for m in messages[1:])
+        self.assertEqual(len(body.splitlines()), 5)
+        # 마지막 사용자를 읽기 전에 첫 청크가 전송되어야 합니다.
+        first_body = events.index("body")
+        self.assertLess(events[:first_body].count("record"), 5)
@@ -0,0 +1,191 @@
+import os
+import tempfile
+import time
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.hashers import (
+    check_password,
+    identify_hasher,
+    make_password,
+)
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..exceptions import PasswordHashingBusyError
+from ..hashers import CalibratedArgon2PasswordHasher
+from ..hashing import (
+    PasswordHashingExecutor,
+    _make_password,
+    _rehash_password,
+    _verify_password,
+    password_hashed,
+)
+from ..models import User
+
+
+class PasswordHashingExecutorTestCase(APITestCase):
+    """비밀번호 해싱 실행기 테스트"""
+
+    def test_process_pool(self):
+        executor = PasswordHashingExecutor(
+            workers=1, max_pending=0, timeout=30
+        )
+        encoded = executor.run(_make_password, "test1234!!")
+
+        self.assertTrue(check_password("test1234!!", encoded))
+        self.assertEqual(
+            executor.run(_verify_password, "test1234!!", encoded),
+            (True, False),
+        )
+        self.assertEqual(
+            executor.run(_verify_password, "invalid", encoded), (False, False)
+        )
+
+    def test_rejects_when_queue_is_full(self):
+        executor = PasswordHashingExecutor(workers=0, max_pending=1, timeout=1)
+        executor._slots.acquire()
+        executor._slots.acquire()
+
+        with self.assertRaises(PasswordHashingBusyError):
+            executor.run(_make_password, "test1234!!")
+
+    def test_timed_out_task_keeps_slot(self):
+        executor = PasswordHashingExecutor(
+            workers=1, max_pending=0, timeout=30
+        )
+        executor.run(_make_password, "test1234!!")
+        executor.timeout = 0.1
+
+        with self.assertRaises(PasswordHashingBusyError):
+            executor.run(time.sleep, 1)
+        self.assertFalse(executor._slots.acquire(blocking=False))
+
+        time.sleep(1.5)
+        self.assertTrue(executor._slots.acquire(blocking=False))
+
+    def test_sends_timings(self):
+        executor = PasswordHashingExecutor(workers=0, max_pending=0, timeout=1)
+        received = []
+
+        def receiver(sender, **kwargs):
+            received.append(kwargs)
+
+        password_hashed.connect(receiver)
+        self.addCleanup(password_hashed.disconnect, receiver)
+        executor.run(_make_password, "test1234!!")
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]["operation"], "make_password")
+        self.assertGreater(received[0]["compute_time"], 0)
+        self.assertGreaterEqual(received[0]["queue_wait"], 0)
+
+
+class PasswordHashingBusyTestCase(APITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password="test1234!!",
+            username="test_user",
+            is_active=True,
+        )
+        self.data = {"email": self.user.email, "password": "test1234!!"}
+
+    @patch(
+        "ecommerce.accounts.hashing.executor._slots.acquire",
+        return_value=False,
+    )
+    def test_signin_rejected_when_busy(self, acquire_mock):
+        response = self.client.post(
+            reverse("signin"), self.data, format="json"
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        self.assertEqual(response["Retry-After"], "1")
+
+
+class PasswordRehashTestCase(APITestCase):
+    """로그인 시 비밀번호 재해싱 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.password = "test1234!!"
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password=self.password,
+            username="test_user",
+            is_active=True,
+        )
+        self.user.password = make_password(
+            self.password, hasher="pbkdf2_sha256"
+        )
+        self.user.save(update_fields=["password"])
+        self.data = {"email": self.user.email, "password": self.password}
+
+    @patch("ecommerce.accounts.services.rehash_password_later")
+    def test_signin_schedules_rehash(self, rehash_password_later_mock):
+        response = self.client.post(
+            reverse("signin"), self.data, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rehash_password_later_mock.assert_called_once()
+
+    @patch("ecommerce.accounts.hashing.connection")
+    def test_rehash_legacy_password(self, connection_mock):
+        _rehash_password(self.user.pk, self.password, self.user.password)
+
+        self.user.refresh_from_db()
+        self.assertIsInstance(
+            identify_hasher(self.user.password),
+            CalibratedArgon2PasswordHasher,
+        )
+        self.assertTrue(self.user.check_password(self.password))
+
+    @patch("ecommerce.accounts.hashing.connection")
+    def test_rehash_skipped_after_password_change(self, connection_mock):
+        stale_password = self.user.password
+        self.user.set_password("changed1234!!")
+        self.user.save(update_fields=["password"])
+
+        _rehash_password(self.user.pk, self.password, stale_password)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("changed1234!!"))
+
+
+class CalibrateArgon2CommandTestCase(APITestCase):
+    def test_writes_parameters(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "argon2.env")
+            call_command(
+                "calibrate_argon2",
+                "--target-ms=10000",
+                "--max-memory-mib=8",
+                "--max-time-cost=1",
+                "--parallelism=1",
+                "--samples=2",
+                f"--output={output}",
+                stderr=StringIO(),
+            )
+            with open(output) as f:
+                lines = f.read().splitlines()
+
+        self.assertEqual(
+            lines,
+            [
+                "ARGON2_TIME_COST=1",
+                "ARGON2_MEMORY_COST=8192",
+                "ARGON2_PARALLELISM=1",
+            ],
+        )
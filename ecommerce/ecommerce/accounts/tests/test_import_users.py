@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import User
+
+
+class ImportUsersCommandTestCase(TestCase):
+    """사용자 일괄 가져오기 명령 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.password = make_password("test1234!!")
+        self.existing = User.objects.create_user(
+            email="existing@test.com", password="test1234!!", username="old"
+        )
+
+    def import_users(self, content, suffix, batch_size=2):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, f"users{suffix}")
+            with open(path, "w") as f:
+                f.write(content)
+            stdout = StringIO()
+            call_command(
+                "import_users",
+                path,
+                f"--batch-size={batch_size}",
+                stdout=stdout,
+                stderr=StringIO(),
+            )
+        return stdout.getvalue()
+
+    def test_import_csv(self):
+        address = "Alice,Kim,1 Road,Seoul,01234,KR"
+        header = "email,password,username,is_active," + ",".join(
+            f"{role}_{name}"
+            for role in ("shipping", "billing")
+            for name in (
+                "first_name",
+                "last_name",
+                "street_address_1",
+                "city",
+                "postal_code",
+                "country",
+            )
+        )
+        rows = [
+            header,
+            f'alice@test.com,"{self.password}",alice,true,'
+            f"{address},{address}",
+            f"bob@test.com,plaintext,,false,{address},"
+            "Bob,Lee,2 Ave,Busan,1,KR",
+            "existing@test.com,,new,,,,,,,,,,,,,",
+            "not-an-email,,,,,,,,,,,,,,,",
+        ]
+        output = self.import_users("\n".join(rows) + "\n", ".csv")
+
+        self.assertIn("Imported 2 users and 2 addresses from 4 rows", output)
+        alice = User.objects.get(email="alice@test.com")
+        self.assertTrue(alice.is_active)
+        self.assertTrue(alice.check_password("test1234!!"))
+        self.assertEqual(
+            alice.default_shipping_address, alice.default_billing_address
+        )
+        self.assertEqual(alice.addresses.count(), 1)
+
+        bob = User.objects.get(email="bob@test.com")
+        self.assertFalse(bob.is_active)
+        self.assertFalse(bob.has_usable_password())
+        self.assertEqual(bob.username, "bob@test.com")
+        self.assertEqual(bob.default_billing_address.city, "Busan")
+        self.assertEqual(bob.addresses.count(), 2)
+        self.assertEqual(len(bob.jwt_token_key), 12)
+
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.username, "old")
+
+    def test_import_jsonl(self):
+        address = {
+            "first_name": "Carol",
+            "last_name": "Park",
+            "street_address_1": "3 St",
+            "city": "Daegu",
+            "postal_code": "4",
+            "country": "KR",
+        }
+        lines = [
+            {
+                "email": f"user{i}@test.com",
+                "password": self.password,
+                "username": f"user{i}",
+                "addresses": [address, {**address, "city": "Incheon"}],
+                "default_shipping_address": 1,
+            }
+            for i in range(5)
+        ]
+        output = self.import_users(
+            "\n".join(json.dumps(line) for line in lines), ".jsonl"
+        )
+
+        self.assertIn("Imported 5 users and 2 addresses", output)
+        users = User.objects.filter(email__startswith="user")
+        self.assertEqual(len({user.uuid for user in users}), 5)
+        for user in users:
+            self.assertEqual(user.default_shipping_address.city, "Incheon")
+            self.assertIsNone(user.default_billing_address)
+            self.assertEqual(user.addresses.count(), 2)
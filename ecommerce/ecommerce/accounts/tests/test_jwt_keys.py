@@ -0,0 +1,121 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+import jwt
+from django.conf import settings
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from ..exceptions import JWTInvalidTokenError
+from ..jwt import (
+    create_access_token,
+    get_payload,
+    get_user_from_payload,
+    jwt_decode,
+    jwt_encode,
+)
+from ..keys import get_key_set
+from ..models import User
+
+
+class JWTKeyTestCase(APITestCase):
+    """비대칭 JWT 서명 키와 JWKS 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password="test1234!!",
+            username="test_user",
+            is_active=True,
+        )
+
+    def generate_key(self, name, algorithm="EdDSA"):
+        path = os.path.join(self.directory, name)
+        stdout = StringIO()
+        call_command(
+            "generate_jwt_key",
+            algorithm=algorithm,
+            output=path,
+            stdout=stdout,
+        )
+        return path, stdout.getvalue().strip()
+
+    def key_settings(self, path, algorithm="EdDSA", verification=()):
+        return override_settings(
+            JWT_ALGORITHM=algorithm,
+            JWT_SIGNING_KEY_FILE=path,
+            JWT_VERIFICATION_KEY_FILES=list(verification),
+        )
+
+    def test_sign_and_verify(self):
+        for algorithm in ("EdDSA", "ES256"):
+            path, kid = self.generate_key(algorithm, algorithm)
+            with self.key_settings(path, algorithm):
+                token = create_access_token(self.user)
+                header = jwt.get_unverified_header(token)
+
+                self.assertEqual(header["alg"], algorithm)
+                self.assertEqual(header["kid"], kid)
+                payload = get_payload(token)
+                self.assertEqual(get_user_from_payload(payload), self.user)
+
+    def test_rotation(self):
+        old_path, old_kid = self.generate_key("old")
+        new_path, new_kid = self.generate_key("new")
+        with self.key_settings(old_path):
+            old_token = jwt_encode({"test": "old"})
+
+        with self.key_settings(new_path, verification=[f"{old_path}.pub"]):
+            self.assertEqual(jwt_decode(old_token), {"test": "old"})
+            kids = list(get_key_set().verification_keys)
+            self.assertCountEqual(kids, [old_kid, new_kid])
+
+        with self.key_settings(new_path):
+            with self.assertRaises(JWTInvalidTokenError):
+                get_payload(old_token)
+
+    def test_algorithm_downgrade(self):
+        path, _ = self.generate_key("key")
+        with self.key_settings(path):
+            token = jwt.encode(
+                {"test": "test"},
+                settings.JWT_SECRET_KEY,
+                algorithm="HS256",
+                headers={"kid": get_key_set().kid},
+            )
+            with self.assertRaises(jwt.InvalidAlgorithmError):
+                jwt_decode(token)
+
+    def test_jwks(self):
+        old_path, _ = self.generate_key("old", "ES256")
+        path, kid = self.generate_key("new")
+        with self.key_settings(path, verification=[f"{old_path}.pub"]):
+            token = create_access_token(self.user)
+            response = self.client.get(reverse("jwks"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("max-age=300", response["Cache-Control"])
+        jwks = json.loads(response.content)
+        self.assertEqual(len(jwks["keys"]), 2)
+        for key in jwks["keys"]:
+            self.assertNotIn("d", key)
+            self.assertEqual(key["use"], "sig")
+
+        signing_key = jwt.PyJWKSet.from_dict(jwks)[kid]
+        payload = jwt.decode(token, signing_key.key, algorithms=["EdDSA"])
+        self.assertEqual(payload["user_id"], str(self.user.uuid))
+
+    def test_hs256_default(self):
+        token = jwt_encode({"test": "test"})
+
+        self.assertNotIn("kid", jwt.get_unverified_header(token))
+        response = self.client.get(reverse("jwks"))
+        self.assertEqual(json.loads(response.content), {"keys": []})
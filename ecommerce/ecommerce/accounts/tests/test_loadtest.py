@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import LiveServerTestCase, SimpleTestCase, override_settings
+
+from ..loadtest import RequestResult, summarize
+from ..models import User
+
+
+@override_settings(
+    THROTTLING_ENABLED=False, ENABLE_CONFIRMATION_BY_EMAIL=False
+)
+class LoadTestCommandTestCase(LiveServerTestCase):
+    """부하 테스트 명령 테스트"""
+
+    def test_load_test(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "result.json")
+            call_command(
+                "load_test",
+                base_url=self.live_server_url,
+                users=5,
+                rps=10,
+                duration=1,
+                token_users=2,
+                seed=1,
+                output=output,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+            with open(output) as f:
+                result = json.load(f)
+
+        self.assertEqual(result["run"]["rps"], 10)
+        total = result["endpoints"]["total"]
+        self.assertGreater(total["requests"], 0)
+        self.assertGreater(total["ok"], 0)
+        self.assertFalse(User.objects.filter(email__startswith="load-"))
+
+    def test_invalid_mix(self):
+        with self.assertRaises(CommandError):
+            call_command("load_test", mix="signin=1,unknown=1")
+
+
+class SummarizeTestCase(SimpleTestCase):
+    """부하 테스트 결과 집계 테스트"""
+
+    def test_summarize(self):
+        results = [
+            RequestResult("signin", 200, 0.1),
+            RequestResult("signin", 503, 0.3),
+            RequestResult("token_refresh", "no_data", 0.0),
+        ]
+
+        summary = summarize(results, elapsed=2)
+
+        self.assertEqual(
+            summary["signin"],
+            {
+                "requests": 2,
+                "ok": 1,
+                "errors": 1,
+                "error_rate": 0.5,
+                "skipped": 0,
+                "throughput": 0.5,
+                "statuses": {"200": 1, "503": 1},
+                "latency_ms": {
+                    "p50": 200.0,
+                    "p90": 280.0,
+                    "p99": 298.0,
+                    "max": 300.0,
+                },
+            },
+        )
+        self.assertEqual(summary["token_refresh"]["skipped"], 1)
+        self.assertEqual(summary["total"]["requests"], 2)
@@ -0,0 +1,200 @@
+import time
+import uuid
+from unittest import skipUnless
+from unittest.mock import MagicMock, patch
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from redis.exceptions import RedisError
+from rest_framework.test import APITestCase
+
+from ...core.redis import get_redis_client
+from ..jwt import get_payload
+from ..models import User
+from ..revocation import BloomFilter, TokenRevocations, token_revocations
+from ..services import AccountService
+
+
+class BloomFilterTestCase(SimpleTestCase):
+    """블룸 필터 테스트"""
+
+    def test_bloom_filter(self):
+        bloom = BloomFilter(1000, 0.01)
+        items = [uuid.uuid4().hex for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        self.assertTrue(all(item in bloom for item in items))
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+        self.assertLess(false_positives, 200)
+
+
+class TokenRevocationTestCase(APITestCase):
+    """토큰 폐기 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        token_revocations.clear()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password="test1234!!",
+            username="test_user",
+            is_active=True,
+        )
+        self.tokens = AccountService(None).create_tokens(self.user)
+
+    def post(self, name, token, **data):
+        return self.client.post(
+            reverse(name), {"token": token, **data}, format="json"
+        )
+
+    def test_revoke_token(self):
+        access = self.tokens[settings.JWT_ACCESS_TYPE]
+        refresh = self.tokens[settings.JWT_REFRESH_TYPE]
+
+        response = self.post("token_revoke", refresh)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response.cookies[settings.JWT_REFRESH_TYPE].value, "")
+        response = self.post("token_refresh", refresh)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.post("token_verify", access)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_revoke_user(self):
+        response = self.post(
+            "token_revoke", self.tokens[settings.JWT_ACCESS_TYPE], all=True
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        for token in self.tokens.values():
+            response = self.post("token_verify", token)
+            self.assertEqual(
+                response.status_code, status.HTTP_401_UNAUTHORIZED
+            )
+
+    def test_revoke_unavailable(self):
+        client = MagicMock()
+        client.pipeline.return_value.__enter__.return_value.execute = (
+            MagicMock(side_effect=RedisError)
+        )
+        with patch(
+            "ecommerce.accounts.revocation.get_redis_client",
+            return_value=client,
+        ), self.assertLogs("ecommerce.accounts.revocation", "ERROR"):
+            response = self.post(
+                "token_revoke", self.tokens[settings.JWT_ACCESS_TYPE]
+            )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        self.assertEqual(response["Retry-After"], "1")
+
+    def test_revoked_token_rejected_by_authentication(self):
+        access = self.tokens[settings.JWT_ACCESS_TYPE]
+        token_revocations.revoke_token(get_payload(access))
+
+        response = self.client.get(
+            reverse("address_book"), HTTP_AUTHORIZATION=f"Bearer {access}"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@skipUnless(settings.REDIS_URL, "REDIS_URL is not configured")
+@override_settings(TOKEN_REVOCATION_REFRESH_INTERVAL=0)
+class RedisTokenRevocationTestCase(SimpleTestCase):
+    """Redis 폐기 목록과 워커별 블룸 필터 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.redis = get_redis_client()
+        keys = list(self.redis.scan_iter(f"{TokenRevocations.key_prefix}:*"))
+        self.redis.delete(TokenRevocations.stream, *keys)
+        self.payload = {
+            "jti": uuid.uuid4().hex,
+            "user_id": str(uuid.uuid4()),
+            "iat": int(time.time()) - 10,
+            "exp": int(time.time()) + 60,
+        }
+
+    def test_not_revoked_answered_in_memory(self):
+        revocations = TokenRevocations()
+        revocations.revoke_token({**self.payload, "jti": uuid.uuid4().hex})
+        self.assertFalse(revocations.is_revoked(self.payload))
+
+        with patch.object(self.redis, "mget") as mget_mock:
+            self.assertFalse(revocations.is_revoked(self.payload))
+            self.assertFalse(
+                async_to_sync(revocations.ais_revoked)(self.payload)
+            )
+        mget_mock.assert_not_called()
+
+    def test_revocation_from_other_worker(self):
+        worker, other = TokenRevocations(), TokenRevocations()
+        self.assertFalse(worker.is_revoked(self.payload))
+
+        other.revoke_token(self.payload)
+
+        self.assertTrue(worker.is_revoked(self.payload))
+        self.assertGreater(
+            self.redis.ttl(f"accounts:revoked:jti:{self.payload['jti']}"),
+            50,
+        )
+
+    def test_revoke_user(self):
+        worker = TokenRevocations()
+        worker.revoke_user(self.payload["user_id"])
+
+        self.assertTrue(worker.is_revoked(self.payload))
+        self.assertFalse(
+            worker.is_revoked({**self.payload, "iat": int(time.time()) + 1})
+        )
+
+    @override_settings(TOKEN_REVOCATION_BLOOM_CAPACITY=2)
+    def test_rebuild_when_full(self):
+        worker = TokenRevocations()
+        worker.is_revoked(self.payload)
+        for _ in range(3):
+            worker.revoke_token({**self.payload, "jti": uuid.uuid4().hex})
+        self.redis.delete(TokenRevocations.stream)
+        worker.revoke_token(self.payload)
+
+        worker.is_revoked(self.payload)
+
+        self.assertEqual(worker._filter.count, 1)
+
+    @override_settings(TOKEN_REVOCATION_BLOOM_CAPACITY=2)
+    def test_rebuild_skips_expired(self):
+        worker = TokenRevocations()
+        expired = [uuid.uuid4().hex for _ in range(3)]
+        for jti in expired:
+            worker.revoke_token(
+                {**self.payload, "jti": jti, "exp": int(time.time()) - 1}
+            )
+        worker.revoke_token(self.payload)
+
+        worker.is_revoked(self.payload)
+
+        self.assertEqual(worker._filter.count, 1)
+        self.assertNotIn(f"jti:{expired[0]}", worker._filter)
+        self.assertTrue(worker.is_revoked(self.payload))
+
+    @override_settings(TOKEN_REVOCATION_BLOOM_CAPACITY=2)
+    def test_rebuild_sized_for_live_entries(self):
+        worker = TokenRevocations()
+        for _ in range(3):
+            worker.revoke_token({**self.payload, "jti": uuid.uuid4().hex})
+
+        worker.is_revoked(self.payload)
+        bloom = worker._filter
+        worker.is_revoked(self.payload)
+
+        self.assertEqual(bloom.capacity, 6)
+        self.assertIs(worker._filter, bloom)
@@ -0,0 +1,123 @@
+from io import StringIO
+
+from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..admin import UserAdmin
+from ..models import Address, User
+from ..search import search_users
+
+
+class UserSearchTestCase(APITestCase):
+    """사용자 검색 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = APIClient()
+        self.url = reverse("user_search")
+        self.staff_user = User.objects.create_superuser(
+            email="admin@test.com",
+            password="password1234!!",
+            username="admin",
+        )
+        self.user = User.objects.create_user(
+            email="Alice.Kim@Example.com",
+            password="test1234!!",
+            username="alice",
+            first_name="Alice",
+            last_name="Kim",
+        )
+        self.address = Address.objects.create(
+            first_name="Alice",
+            last_name="Kim",
+            street_address_1="1 Road",
+            city="Seoul",
+            postal_code="01234",
+            country="KR",
+        )
+
+    def search(self, text):
+        return list(search_users(User.objects.all(), text))
+
+    def test_document_on_create(self):
+        self.assertIn("alice.kim@example.com", self.user.search_document)
+        self.assertEqual(self.search("alice.k"), [self.user])
+        self.assertEqual(self.search("example.com kim"), [self.user])
+        self.assertEqual(self.search("bob"), [])
+        self.assertEqual(self.search("  "), [])
+
+    def test_document_on_update(self):
+        self.user.last_name = "Park"
+        self.user.save(update_fields=["last_name"])
+        self.assertEqual(self.search("park"), [self.user])
+
+        self.user.refresh_from_db()
+        self.user.pin_failures = 1
+        self.user.save(update_fields=["pin_failures"])
+        self.user.refresh_from_db()
+        self.assertIn("park", self.user.search_document)
+
+    def test_document_follows_addresses(self):
+        self.user.addresses.add(self.address)
+        self.assertEqual(self.search("seoul"), [self.user])
+
+        self.address.city = "Busan"
+        self.address.save()
+        self.assertEqual(self.search("seoul"), [])
+        self.assertEqual(self.search("busan"), [self.user])
+
+        self.address.delete()
+        self.assertEqual(self.search("busan"), [])
+
+    def test_document_follows_reverse_clear(self):
+        self.address.user_addresses.add(self.user)
+        self.assertEqual(self.search("seoul"), [self.user])
+
+        self.address.user_addresses.clear()
+        self.assertEqual(self.search("seoul"), [])
+
+    def test_search_uses_index(self):
+        queryset = search_users(User.objects.all(), "alice").order_by()
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+        self.assertIn("user_search_document_idx", plan)
+
+    def test_search_api(self):
+        self.client.force_authenticate(self.staff_user)
+        response = self.client.get(self.url, {"q": "ali kim"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [user["email"] for user in response.data["results"]],
+            ["Alice.Kim@example.com"],
+        )
+
+    def test_search_api_staff_only(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(self.url, {"q": "alice"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_admin_search(self):
+        admin = UserAdmin(User, AdminSite())
+        request = RequestFactory().get("/")
+        queryset, may_have_duplicates = admin.get_search_results(
+            request, User.objects.all(), "kim"
+        )
+        self.assertEqual(list(queryset), [self.user])
+        self.assertFalse(may_have_duplicates)
+
+    def test_rebuild_command(self):
+        User.objects.update(search_document="")
+        self.user.addresses.add(self.address)
+        User.objects.update(search_document="")
+
+        call_command(
+            "update_user_search_documents", "--batch-size=1", stdout=StringIO()
+        )
+        self.assertEqual(self.search("seoul"), [self.user])
+        self.assertEqual(self.search("admin"), [self.staff_user])
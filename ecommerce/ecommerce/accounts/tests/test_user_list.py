@@ -0,0 +1,132 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..models import User
+
+
+class UserListTestCase(APITestCase):
+    """사용자 목록 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = APIClient()
+        self.url = reverse("user_list")
+        self.staff_user = User.objects.create_superuser(
+            email="admin@test.com",
+            password="password1234!!",
+            username="admin",
+        )
+        for i in range(5):
+            User.objects.create_user(
+                email=f"user{i}@test.com",
+                password="test1234!!",
+                username=f"user{i}",
+            )
+
+    def collect(self, params):
+        emails, url = [], self.url
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            emails += [user["email"] for user in response.data["results"]]
+            url, params = response.data["next"], None
+        return emails
+
+    def test_list_users(self):
+        self.client.force_authenticate(self.staff_user)
+        self.assertEqual(
+            self.collect({"limit": 2}),
+            list(
+                User.objects.order_by("email", "id").values_list(
+                    "email", flat=True
+                )
+            ),
+        )
+        self.assertEqual(
+            self.collect({"limit": 4, "ordering": "-date_joined"}),
+            list(
+                User.objects.order_by("-date_joined", "-id").values_list(
+                    "email", flat=True
+                )
+            ),
+        )
+
+    def test_previous_page(self):
+        self.client.force_authenticate(self.staff_user)
+        first = self.client.get(self.url, {"limit": 2})
+        second = self.client.get(first.data["next"])
+        self.assertIsNone(first.data["previous"])
+
+        response = self.client.get(second.data["previous"])
+        self.assertEqual(response.data["results"], first.data["results"])
+        self.assertIsNone(response.data["previous"])
+
+    def test_invalid_cursor_and_ordering(self):
+        self.client.force_authenticate(self.staff_user)
+        response = self.client.get(self.url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(self.url, {"ordering": "password"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # 정렬을 바꾸면 이전 정렬의 커서는 쓸 수 없다.
+        url = self.client.get(self.url, {"limit": 2}).data["next"]
+        response = self.client.get(f"{url}&ordering=date_joined")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_staff_only(self):
+        self.client.force_authenticate(User.objects.get(username="user0"))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class UserAdminChangeListTestCase(APITestCase):
+    """관리자 사용자 목록 키셋 페이지네이션 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = reverse("admin:accounts_user_changelist")
+        self.staff_user = User.objects.create_superuser(
+            email="admin@test.com",
+            password="password1234!!",
+            username="admin",
+            is_active=True,
+        )
+        User.objects.bulk_create(
+            User(email=f"user{i:03}@test.com", username=f"user{i:03}")
+            for i in range(150)
+        )
+        self.client.force_login(self.staff_user)
+
+    def test_changelist_pages(self):
+        response = self.client.get(self.url)
+        changelist = response.context["cl"]
+        self.assertTrue(changelist.keyset)
+        self.assertEqual(len(changelist.result_list), 100)
+        self.assertIsNone(changelist.previous_url)
+        self.assertContains(response, "Next")
+
+        response = self.client.get(self.url + changelist.next_url)
+        changelist = response.context["cl"]
+        self.assertEqual(
+            [user.email for user in changelist.result_list],
+            [f"user{i:03}@test.com" for i in range(99, 150)],
+        )
+        self.assertIsNone(changelist.next_url)
+        self.assertIsNotNone(changelist.previous_url)
+
+    def test_changelist_without_count(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+        self.assertFalse(
+            any("COUNT(" in query["sql"] for query in context.captured_queries)
+        )
+
+    def test_changelist_sort_by_column(self):
+        response = self.client.get(self.url, {"o": "2"})
+        changelist = response.context["cl"]
+        self.assertTrue(changelist.keyset)
+        self.assertNotIn("cursor", changelist.get_query_string({"o": "1"}))
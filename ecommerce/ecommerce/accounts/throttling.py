@@ -0,0 +1,29 @@
+from ..core.throttling import EmailRateThrottle, IPRateThrottle
+
+
+class SignupRateThrottle(IPRateThrottle):
+    scope = "signup"
+
+
+class SignupEmailRateThrottle(EmailRateThrottle):
+    scope = "signup_email"
+
+
+class SigninRateThrottle(IPRateThrottle):
+    scope = "signin"
+
+
+class SigninEmailRateThrottle(EmailRateThrottle):
+    scope = "signin_email"
+
+
+class ConfirmRateThrottle(IPRateThrottle):
+    scope = "confirm"
+
+
+class ConfirmEmailRateThrottle(EmailRateThrottle):
+    scope = "confirm_email"
+
+
+class TokenRefreshRateThrottle(IPRateThrottle):
+    scope = "token_refresh"
@@ -3,9 +3,16 @@ from django.urls import path
 from .views import (
     AccountConfirmationView,
     AccountRegisterView,
+    AddressBookView,
+    AddressBulkDeleteView,
+    AddressDefaultView,
     TokenCreateView,
     TokenRefreshView,
+    TokenRevokeView,
     TokenVerifyView,
+    UserExportView,
+    UserListView,
+    UserSearchView,
 )
 
 urlpatterns = [
@@ -14,4 +21,19 @@ urlpatterns = [
     path("confirm/", AccountConfirmationView.as_view(), name="confirm"),
     path("token/verify/", TokenVerifyView.as_view(), name="token_verify"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("token/revoke/", TokenRevokeView.as_view(), name="token_revoke"),
+    path("addresses/", AddressBookView.as_view(), name="address_book"),
+    path(
+        "addresses/delete/",
+        AddressBulkDeleteView.as_view(),
+        name="address_bulk_delete",
+    ),
+    path(
+        "addresses/default/",
+        AddressDefaultView.as_view(),
+        name="address_default",
+    ),
+    path("export/", UserExportView.as_view(), name="user_export"),
+    path("users/", UserListView.as_view(), name="user_list"),
+    path("users/search/", UserSearchView.as_view(), name="user_search"),
 ]
@@ -1,29 +1,64 @@
 from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
 from django.middleware.csrf import _get_new_csrf_string
+from django.utils.cache import patch_cache_control
+from django.views import View
 from rest_framework import generics, status
 from rest_framework.exceptions import APIException
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 
 from . import emails
+from .addresses import (
+    delete_addresses,
+    get_address_book,
+    set_default_address,
+    upsert_addresses,
+)
+from .export import (
+    CONTENT_TYPES,
+    EXPORT_FORMATS,
+    aexport_users,
+    export_users,
+)
 from .jwt import create_access_token, create_refresh_token
+from .keys import get_key_set
 from .models import User
 from .serializers import (
     AccountConfirmationSerializer,
     AccountRegisterSerializer,
+    AddressBulkDeleteSerializer,
+    AddressBulkUpsertSerializer,
+    AddressDefaultSerializer,
+    AddressSerializer,
     JWTInvalidTokenError,
     PasswordValidationError,
     TokenCreateSerializer,
     TokenRefreshSerializer,
+    TokenRevokeSerializer,
     TokenVerifySerializer,
+    UserListSerializer,
 )
+from .search import search_users
 from .services import AccountService
+from .throttling import (
+    ConfirmEmailRateThrottle,
+    ConfirmRateThrottle,
+    SigninEmailRateThrottle,
+    SigninRateThrottle,
+    SignupEmailRateThrottle,
+    SignupRateThrottle,
+    TokenRefreshRateThrottle,
+)
 
 
 class AccountRegisterView(generics.CreateAPIView):
+    query_budget = 4
     serializer_class = AccountRegisterSerializer
     permission_classes = (AllowAny,)
+    throttle_classes = (SignupRateThrottle, SignupEmailRateThrottle)
     queryset = User.objects.all()
 
     def post(self, request, *args, **kwargs):
@@ -39,13 +74,17 @@ class AccountRegisterView(generics.CreateAPIView):
 
 
 class AccountConfirmationView(generics.GenericAPIView):
+    query_budget = 3
     serializer_class = AccountConfirmationSerializer
     permission_classes = (AllowAny,)
+    throttle_classes = (ConfirmRateThrottle, ConfirmEmailRateThrottle)
     queryset = User.objects.all()
 
     def post(self, request, *args, **kwargs):
         try:
-            user = User.objects.get(email=request.data["email"])
+            user = User.objects.using(
+                settings.DATABASE_CONNECTION_DEFAULT_NAME
+            ).get(email=request.data["email"])
         except User.DoesNotExist:
             return Response(
                 {"email": "User with this email does not exist."},
@@ -62,8 +101,10 @@ class AccountConfirmationView(generics.GenericAPIView):
 
 
 class TokenCreateView(generics.GenericAPIView):
+    query_budget = 1
     serializer_class = TokenCreateSerializer
     permission_classes = (AllowAny,)
+    throttle_classes = (SigninRateThrottle, SigninEmailRateThrottle)
     queryset = User.objects.all()
 
     def post(self, request, *args, **kwargs):
@@ -96,6 +137,7 @@ class TokenCreateView(generics.GenericAPIView):
 
 
 class TokenVerifyView(generics.GenericAPIView):
+    query_budget = 1
     permission_classes = (AllowAny,)
     serializer_class = TokenVerifySerializer
 
@@ -109,7 +151,9 @@ class TokenVerifyView(generics.GenericAPIView):
 
 
 class TokenRefreshView(generics.GenericAPIView):
+    query_budget = 1
     permission_classes = (AllowAny,)
+    throttle_classes = (TokenRefreshRateThrottle,)
     serializer_class = TokenRefreshSerializer
 
     def post(self, request, *args, **kwargs):
@@ -138,3 +182,149 @@ class TokenRefreshView(generics.GenericAPIView):
             secure=settings.SECURE_SSL_REDIRECT,
         )
         return response
+
+
+class TokenRevokeView(generics.GenericAPIView):
+    """로그아웃. 제출된 토큰을 폐기하고 토큰 쿠키를 지웁니다."""
+
+    query_budget = 1
+    permission_classes = (AllowAny,)
+    serializer_class = TokenRevokeSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except ValidationError as e:
+            return Response(e.detail, status=e.status_code)
+
+        AccountService(serializer, request).revoke_tokens()
+
+        response = Response(status=status.HTTP_204_NO_CONTENT)
+        response.delete_cookie(settings.JWT_ACCESS_TYPE, samesite="lax")
+        response.delete_cookie(settings.JWT_REFRESH_TYPE, samesite="lax")
+        return response
+
+
+class JWKSView(View):
+    """액세스 토큰 검증용 공개 키 목록(JWKS). 다른 서비스가 캐시해 토큰을
+    직접 검증할 수 있다."""
+
+    query_budget = 0
+
+    def get(self, request, *args, **kwargs):
+        response = HttpResponse(
+            get_key_set().jwks, content_type="application/json"
+        )
+        patch_cache_control(
+            response, public=True, max_age=settings.JWT_JWKS_MAX_AGE
+        )
+        return response
+
+
+class UserExportView(generics.GenericAPIView):
+    """사용자와 주소를 NDJSON 또는 CSV로 스트리밍합니다.
+
+    ASGI에서는 비동기 이터레이터로 응답해야 전체를 메모리에 모으지 않습니다.
+    """
+
+    permission_classes = (IsAdminUser,)
+    chunk_size = 2000
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.query_params.get("output", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"output": [f"Choose one of: {', '.join(EXPORT_FORMATS)}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        replica = request.query_params.get("replica") in ("1", "true")
+        export = (
+            aexport_users
+            if isinstance(request._request, ASGIRequest)
+            else export_users
+        )
+        response = StreamingHttpResponse(
+            export(export_format, replica, self.chunk_size),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="users.{export_format}"'
+        return response
+
+
+USER_KEYSET_ORDERINGS = {
+    "email": ("email", "id"),
+    "-email": ("-email", "-id"),
+    "date_joined": ("date_joined", "id"),
+    "-date_joined": ("-date_joined", "-id"),
+}
+
+
+class UserListView(generics.ListAPIView):
+    """사용자 목록을 (email, id) 또는 (date_joined, id) 키셋으로 페이지네이션합니다."""
+
+    query_budget = 2
+    permission_classes = (IsAdminUser,)
+    serializer_class = UserListSerializer
+    keyset_orderings = USER_KEYSET_ORDERINGS
+    queryset = User.objects.all()
+
+
+class UserSearchView(UserListView):
+    """search_document 인덱스로 사용자를 검색합니다."""
+
+    def get_queryset(self):
+        return search_users(
+            super().get_queryset(), self.request.query_params.get("q", "")
+        )
+
+
+class AddressBookView(generics.GenericAPIView):
+    """내 주소록을 조회하거나 여러 주소를 한 번에 생성/수정합니다."""
+
+    query_budget = {"GET": 2, "POST": 16}
+    serializer_class = AddressBulkUpsertSerializer
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, *args, **kwargs):
+        return self.address_book_response()
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upsert_addresses(request.user, serializer.validated_data["addresses"])
+        return self.address_book_response()
+
+    def address_book_response(self):
+        addresses = get_address_book(self.request.user)
+        return Response(AddressSerializer(addresses, many=True).data)
+
+
+class AddressBulkDeleteView(AddressBookView):
+    query_budget = {"POST": 12}
+    serializer_class = AddressBulkDeleteSerializer
+    http_method_names = ("post", "options")
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        delete_addresses(request.user, serializer.validated_data["ids"])
+        return self.address_book_response()
+
+
+class AddressDefaultView(AddressBookView):
+    query_budget = {"POST": 6}
+    serializer_class = AddressDefaultSerializer
+    http_method_names = ("post", "options")
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        set_default_address(
+            request.user,
+            serializer.validated_data["type"],
+            serializer.validated_data["address"],
+        )
+        return self.address_book_response()
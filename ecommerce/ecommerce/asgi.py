@@ -11,6 +11,10 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from ecommerce.core.tracing import configure_tracing
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ecommerce.settings")
+os.environ.setdefault("ACCOUNTS_ASYNC_VIEWS", "True")
 
 application = get_asgi_application()
+configure_tracing("ecommerce-api")
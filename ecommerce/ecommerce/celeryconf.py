@@ -3,9 +3,11 @@ import os
 from celery import Celery
 from django.conf import settings
 
+from .core.tracing import TracedTask
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ecommerce.settings")
 
-app = Celery("ecommerce")
+app = Celery("ecommerce", task_cls=TracedTask)
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
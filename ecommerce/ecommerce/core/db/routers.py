@@ -0,0 +1,140 @@
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+REPLICA_LAG_SQL = (
+    "SELECT COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+)
+
+
+@dataclass
+class ReplicaState:
+    pinned: bool = False
+    written: bool = False
+
+
+_replica_state: ContextVar[ReplicaState | None] = ContextVar(
+    "replica_state", default=None
+)
+
+
+def start_replica_reads(pinned: bool = False):
+    """요청 범위에서 레플리카 읽기를 허용합니다. reset 토큰을 반환합니다."""
+    return _replica_state.set(ReplicaState(pinned=pinned))
+
+
+def end_replica_reads(token) -> None:
+    _replica_state.reset(token)
+
+
+def get_replica_state() -> ReplicaState | None:
+    return _replica_state.get()
+
+
+def pin_to_primary() -> None:
+    """현재 요청의 남은 읽기를 프라이머리로 보냅니다."""
+    state = _replica_state.get()
+    if state is not None:
+        state.pinned = True
+
+
+def _user_pin_key(user_key) -> str:
+    return f"db:primary_pin:user:{user_key}"
+
+
+def pin_user_to_primary(user_key) -> None:
+    """쓰기 직후 일정 시간 동안 사용자 조회를 프라이머리로 보냅니다.
+
+    user_key는 사용자를 조회하는 키(uuid 또는 이메일)입니다.
+    """
+    if settings.DATABASE_REPLICA_ENABLED:
+        cache.set(
+            _user_pin_key(user_key),
+            True,
+            settings.DATABASE_REPLICA_STICKINESS_SECONDS,
+        )
+
+
+def pin_if_user_pinned(user_key) -> None:
+    """사용자가 최근 변경되었다면 현재 요청을 프라이머리로 고정합니다."""
+    state = _replica_state.get()
+    if state is None or state.pinned:
+        return
+    if cache.get(_user_pin_key(user_key)):
+        state.pinned = True
+
+
+class ReplicaLagMonitor:
+    """레플리카 지연 시간을 주기적으로 확인하여 프로세스 내에 보관합니다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._lagging = False
+
+    def is_lagging(self) -> bool:
+        interval = settings.DATABASE_REPLICA_LAG_CHECK_INTERVAL
+        if time.monotonic() - self._checked_at < interval:
+            return self._lagging
+        with self._lock:
+            if time.monotonic() - self._checked_at >= interval:
+                self._lagging = (
+                    self._get_lag() > settings.DATABASE_REPLICA_MAX_LAG
+                )
+                self._checked_at = time.monotonic()
+        return self._lagging
+
+    def _get_lag(self) -> float:
+        replica = connections[settings.DATABASE_CONNECTION_REPLICA_NAME]
+        try:
+            with replica.cursor() as cursor:
+                cursor.execute(REPLICA_LAG_SQL)
+                return float(cursor.fetchone()[0])
+        except DatabaseError:
+            logger.warning("Replica lag check failed", exc_info=True)
+            return float("inf")
+
+
+replica_lag_monitor = ReplicaLagMonitor()
+
+
+class PrimaryReplicaRouter:
+    """요청 중의 안전한 읽기를 레플리카로 보내는 라우터
+
+    요청 범위 밖(Celery 작업, 관리 명령)의 읽기, 같은 요청에서 쓰기가
+    일어난 뒤의 읽기, 고정된 클라이언트나 사용자의 읽기, 레플리카 지연이
+    큰 경우의 읽기는 프라이머리로 보냅니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _replica_state.get()
+        if (
+            not settings.DATABASE_REPLICA_ENABLED
+            or state is None
+            or state.pinned
+            or replica_lag_monitor.is_lagging()
+        ):
+            return settings.DATABASE_CONNECTION_DEFAULT_NAME
+        return settings.DATABASE_CONNECTION_REPLICA_NAME
+
+    def db_for_write(self, model, **hints):
+        state = _replica_state.get()
+        if state is not None:
+            state.pinned = True
+            state.written = True
+        return settings.DATABASE_CONNECTION_DEFAULT_NAME
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == settings.DATABASE_CONNECTION_DEFAULT_NAME
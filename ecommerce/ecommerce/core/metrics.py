@@ -0,0 +1,125 @@
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,  # noqa: F401
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# 여러 워커 프로세스로 실행할 때는 프로세스를 띄우기 전에
+# PROMETHEUS_MULTIPROC_DIR을 비어 있는 디렉터리로 지정해야 합니다. 각 프로세스가
+# 그 디렉터리에 값을 기록하고, 스크레이프 요청은 모든 파일을 합쳐 응답합니다.
+
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by URL name.",
+    ["url_name", "method", "status"],
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Total database time spent in a request.",
+    ["url_name"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Number of SQL queries run by a request.",
+    ["url_name"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34),
+)
+JWT_DURATION = Histogram(
+    "jwt_duration_seconds",
+    "Time spent encoding or decoding a JWT.",
+    ["operation"],
+    buckets=FAST_BUCKETS,
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent computing a password hash.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a password hash waited for a hashing worker.",
+    ["operation"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+THROTTLE_REJECTIONS = Counter(
+    "throttle_rejections",
+    "Requests rejected by a rate throttle.",
+    ["scope"],
+)
+TOKEN_REVOCATION_CHECKS = Counter(
+    "token_revocation_checks",
+    "Token revocation checks by result. negative means the in-process "
+    "filter answered without a Redis lookup.",
+    ["result"],
+)
+
+
+def generate_metrics() -> bytes:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+def mark_process_dead(pid: int) -> None:
+    """종료된 워커의 게이지 파일을 정리합니다. 서버의 child_exit 훅에서
+    호출합니다."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid)
+
+
+class MetricsMiddleware:
+    """URL 이름별 요청 지연 시간과 요청의 DB 시간, 쿼리 수를 기록합니다.
+
+    DB 값은 안쪽의 QueryBudgetMiddleware가 남긴 request.query_stats를
+    사용합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        started_at = time.perf_counter()
+        response = self.get_response(request)
+        self._observe(request, response, time.perf_counter() - started_at)
+        return response
+
+    async def __acall__(self, request):
+        started_at = time.perf_counter()
+        response = await self.get_response(request)
+        self._observe(request, response, time.perf_counter() - started_at)
+        return response
+
+    @staticmethod
+    def _observe(request, response, elapsed: float) -> None:
+        match = request.resolver_match
+        url_name = match.url_name if match and match.url_name else "unmatched"
+        REQUEST_LATENCY.labels(
+            url_name, request.method, str(response.status_code)
+        ).observe(elapsed)
+        stats = getattr(request, "query_stats", None)
+        if stats is not None:
+            REQUEST_DB_DURATION.labels(url_name).observe(stats.duration)
+            REQUEST_DB_QUERIES.labels(url_name).observe(stats.count)
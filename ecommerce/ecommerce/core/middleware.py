@@ -0,0 +1,58 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .db.routers import (
+    end_replica_reads,
+    get_replica_state,
+    start_replica_reads,
+)
+
+
+class ReplicaStickinessMiddleware:
+    """요청 동안 레플리카 읽기를 허용하고, 쓰기가 있었던 클라이언트는
+    쿠키로 일정 시간 프라이머리에 고정합니다.
+
+    ASGI에서 비동기 뷰가 스레드로 옮겨지지 않도록 동기와 비동기 체인을
+    모두 지원합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        token = self._start(request)
+        try:
+            return self._finish(self.get_response(request))
+        finally:
+            end_replica_reads(token)
+
+    async def __acall__(self, request):
+        token = self._start(request)
+        try:
+            return self._finish(await self.get_response(request))
+        finally:
+            end_replica_reads(token)
+
+    def _start(self, request):
+        cookie_name = settings.DATABASE_REPLICA_STICKINESS_COOKIE
+        return start_replica_reads(pinned=cookie_name in request.COOKIES)
+
+    def _finish(self, response):
+        if get_replica_state().written:
+            response.set_cookie(
+                settings.DATABASE_REPLICA_STICKINESS_COOKIE,
+                "1",
+                max_age=settings.DATABASE_REPLICA_STICKINESS_SECONDS,
+                httponly=True,
+                samesite="lax",
+                secure=settings.SECURE_SSL_REDIRECT,
+            )
+        return response
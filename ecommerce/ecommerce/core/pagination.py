@@ -0,0 +1,300 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q, QuerySet
+from django.db.models.expressions import OrderBy
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+CURSOR_VAR = "cursor"
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """정렬 키 값과 탐색 방향. reverse이면 이전 페이지를 가리킨다."""
+
+    position: tuple[str, ...]
+    reverse: bool = False
+
+
+@dataclass
+class KeysetPage:
+    results: list
+    next: Cursor | None
+    previous: Cursor | None
+
+
+def encode_cursor(cursor: Cursor, ordering: Sequence[str]) -> str:
+    data = {"o": list(ordering), "p": list(cursor.position)}
+    if cursor.reverse:
+        data["r"] = 1
+    return base64.urlsafe_b64encode(
+        json.dumps(data, separators=(",", ":")).encode()
+    ).decode()
+
+
+def decode_cursor(value: str, ordering: Sequence[str]) -> Cursor:
+    """다른 정렬로 만든 커서는 받지 않는다."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(value.encode()))
+        position = tuple(str(item) for item in data["p"])
+        if data["o"] != list(ordering) or len(position) != len(ordering):
+            raise InvalidCursor
+        return Cursor(position, bool(data.get("r")))
+    except (
+        binascii.Error,
+        ValueError,
+        TypeError,
+        KeyError,
+        UnicodeError,
+    ) as e:
+        raise InvalidCursor from e
+
+
+def keyset_filter(ordering: Sequence[str], position: Sequence[str]) -> Q:
+    """(a, b) > (x, y)를 a >= x AND (a > x OR (a = x AND b > y))로 만든다.
+
+    앞의 a >= x 조건은 첫 번째 정렬 필드의 인덱스 범위 탐색에 쓰인다.
+    """
+    fields = [
+        (name.lstrip("-"), name.startswith("-"), value)
+        for name, value in zip(ordering, position)
+    ]
+    condition = None
+    for name, descending, value in reversed(fields):
+        after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        if condition is not None:
+            after |= Q(**{name: value}) & condition
+        condition = after
+    name, descending, value = fields[0]
+    start = Q(**{f"{name}__{'lte' if descending else 'gte'}": value})
+    return start & condition
+
+
+def _position(obj: Any, ordering: Sequence[str]) -> tuple[str, ...]:
+    opts = obj._meta
+    return tuple(
+        opts.get_field(name.lstrip("-")).value_to_string(obj)
+        for name in ordering
+    )
+
+
+def _invert(name: str) -> str:
+    return name[1:] if name.startswith("-") else f"-{name}"
+
+
+def paginate_keyset(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    page_size: int,
+    cursor: Cursor | None = None,
+) -> KeysetPage:
+    """ordering의 마지막 필드까지 합쳐 유일해야 하며, 모든 필드가 NOT NULL
+    이어야 한다. COUNT 없이 page_size + 1개를 읽어 다음 페이지 여부를 판단한다.
+    """
+    reverse = cursor is not None and cursor.reverse
+    order = [_invert(name) for name in ordering] if reverse else ordering
+    queryset = queryset.order_by(*order)
+    if cursor is not None:
+        queryset = queryset.filter(keyset_filter(order, cursor.position))
+    results = list(queryset[: page_size + 1])
+    has_more = len(results) > page_size
+    del results[page_size:]
+    if reverse:
+        results.reverse()
+
+    has_next = True if reverse else has_more
+    has_previous = has_more if reverse else cursor is not None
+    return KeysetPage(
+        results,
+        Cursor(_position(results[-1], ordering))
+        if results and has_next
+        else None,
+        Cursor(_position(results[0], ordering), reverse=True)
+        if results and has_previous
+        else None,
+    )
+
+
+class KeysetPagination(BasePagination):
+    """COUNT와 OFFSET 없이 정렬 키 값으로 페이지를 넘기는 페이지네이션
+
+    뷰의 keyset_orderings로 ?ordering= 값과 정렬 필드를 지정하며, 첫 번째
+    항목이 기본 정렬입니다.
+    """
+
+    cursor_query_param = CURSOR_VAR
+    ordering_query_param = "ordering"
+    page_size_query_param = "limit"
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 100
+    orderings = {"id": ("id",), "-id": ("-id",)}
+    invalid_cursor_message = _("Invalid cursor")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        ordering = self.get_ordering(request, view)
+        cursor = None
+        if value := request.query_params.get(self.cursor_query_param):
+            try:
+                cursor = decode_cursor(value, ordering)
+            except InvalidCursor:
+                raise NotFound(self.invalid_cursor_message)
+
+        self.ordering = ordering
+        self.page = paginate_keyset(
+            queryset, ordering, self.get_page_size(request), cursor
+        )
+        return self.page.results
+
+    def get_ordering(self, request, view=None) -> Sequence[str]:
+        orderings = getattr(view, "keyset_orderings", self.orderings)
+        key = request.query_params.get(self.ordering_query_param)
+        if key is None:
+            return next(iter(orderings.values()))
+        if key not in orderings:
+            raise ValidationError(
+                {
+                    self.ordering_query_param: [
+                        f"Choose one of: {', '.join(orderings)}."
+                    ]
+                }
+            )
+        return orderings[key]
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_link(self, cursor: Cursor | None) -> str | None:
+        if cursor is None:
+            return None
+        return replace_query_param(
+            self.base_url,
+            self.cursor_query_param,
+            encode_cursor(cursor, self.ordering),
+        )
+
+    def get_next_link(self):
+        return self.get_link(self.page.next)
+
+    def get_previous_link(self):
+        return self.get_link(self.page.previous)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        link = {"type": "string", "nullable": True, "format": "uri"}
+        return {
+            "type": "object",
+            "properties": {
+                "next": link,
+                "previous": link,
+                "results": schema,
+            },
+        }
+
+
+class KeysetChangeList(ChangeList):
+    """관리자 목록을 ?cursor= 키셋 페이지로 보여준다.
+
+    정렬이 키셋으로 표현되지 않거나 list_editable을 쓰면 기본 페이지네이션을
+    사용한다.
+    """
+
+    keyset = False
+    next_url = previous_url = None
+
+    def get_filters_params(self, params=None):
+        params = super().get_filters_params(params)
+        params.pop(CURSOR_VAR, None)
+        return params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # 정렬이나 필터가 바뀌면 커서는 더 이상 유효하지 않다.
+        return super().get_query_string(
+            new_params, [*(remove or ()), CURSOR_VAR]
+        )
+
+    def get_results(self, request):
+        ordering = self._get_keyset_ordering()
+        if ordering is None or self.list_editable:
+            return super().get_results(request)
+
+        cursor = None
+        if value := self.params.get(CURSOR_VAR):
+            try:
+                cursor = decode_cursor(value, ordering)
+            except InvalidCursor:
+                raise IncorrectLookupParameters
+        page = paginate_keyset(
+            self.queryset, ordering, self.list_per_page, cursor
+        )
+
+        self.keyset = True
+        self.next_url = self._get_cursor_url(page.next, ordering)
+        self.previous_url = self._get_cursor_url(page.previous, ordering)
+        self.result_count = len(page.results)
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = page.results
+        self.can_show_all = False
+        self.multi_page = False
+        self.paginator = None
+
+    def _get_cursor_url(self, cursor, ordering):
+        if cursor is None:
+            return None
+        return self.get_query_string(
+            {CURSOR_VAR: encode_cursor(cursor, ordering)}
+        )
+
+    def _get_keyset_ordering(self) -> list[str] | None:
+        """changelist의 정렬을 키셋에 쓸 수 있는 필드 이름 목록으로 바꾼다."""
+        opts = self.lookup_opts
+        ordering = []
+        for item in self.queryset.query.order_by:
+            if isinstance(item, OrderBy) and isinstance(item.expression, F):
+                item = (
+                    f"{'-' if item.descending else ''}{item.expression.name}"
+                )
+            if not isinstance(item, str) or "__" in item:
+                return None
+            name = item.lstrip("-")
+            if name == "pk":
+                name = opts.pk.name
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.is_relation or field.null:
+                return None
+            ordering.append(f"{'-' if item.startswith('-') else ''}{name}")
+            if field.primary_key or field.unique:
+                return ordering
+        return None
@@ -0,0 +1,157 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    """요청 하나에서 실행된 쿼리 수, DB 시간과 SQL별 실행 횟수"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started_at
+            self.count += 1
+            self.statements[sql] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """파라미터만 다른 같은 SQL이 threshold번 이상 실행된 목록(N+1)"""
+        return [
+            (sql, count)
+            for sql, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    return stats(execute, sql, params, many, context)
+
+
+def install_query_recorder(connection) -> None:
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+@receiver(connection_created)
+def install_query_recorder_on_connect(sender, connection, **kwargs):
+    """sync_to_async 스레드의 연결에서 실행된 쿼리도 요청에 기록합니다."""
+    install_query_recorder(connection)
+
+
+class QueryBudgetMiddleware:
+    """요청마다 쿼리 수와 DB 시간을 기록하고 뷰의 query_budget을 검사합니다.
+
+    예산을 넘기거나 같은 SQL이 QUERY_N_PLUS_ONE_THRESHOLD번 이상 반복되면
+    경고를 남기고, QUERY_BUDGET_STRICT(테스트)에서는 QueryBudgetExceeded를
+    발생시킵니다.
+
+    query_budget은 정수 또는 {"GET": 2, "POST": 5}처럼 메서드별로 지정합니다.
+    스트리밍 응답의 본문을 만들며 실행되는 쿼리는 포함되지 않습니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = request.query_stats = QueryStats()
+        token = self._start(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        self._finish(request, stats)
+        return response
+
+    async def __acall__(self, request):
+        stats = request.query_stats = QueryStats()
+        token = self._start(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        self._finish(request, stats)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None) or getattr(
+            view_func, "view_class", None
+        )
+        budget = getattr(view_class, "query_budget", None)
+        if isinstance(budget, dict):
+            budget = budget.get(request.method)
+        request.query_budget_view = (view_class or view_func).__name__
+        request.query_budget = budget
+
+    @staticmethod
+    def _start(stats: QueryStats):
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+        return _current_stats.set(stats)
+
+    @staticmethod
+    def _finish(request, stats: QueryStats) -> None:
+        view = getattr(request, "query_budget_view", request.path)
+        budget = getattr(request, "query_budget", None)
+        logger.debug(
+            "%s: %d queries in %.1fms",
+            view,
+            stats.count,
+            stats.duration * 1000,
+        )
+
+        problems = []
+        if budget is not None and stats.count > budget:
+            problems.append(
+                f"{stats.count} queries exceed the budget of {budget}"
+            )
+        for sql, count in stats.repeated(settings.QUERY_N_PLUS_ONE_THRESHOLD):
+            problems.append(f"possible N+1, {count} times: {sql}")
+        if not problems:
+            return
+
+        message = f"{request.method} {view}: " + "; ".join(problems)
+        if settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(
+            message,
+            extra={
+                "view": view,
+                "query_count": stats.count,
+                "query_budget": budget,
+                "db_time_ms": round(stats.duration * 1000, 1),
+            },
+        )
@@ -0,0 +1,111 @@
+import logging
+import math
+import os
+import resource
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+# cgroup v1은 제한이 없을 때 페이지 크기로 내림한 최대 정수를 기록합니다.
+UNLIMITED_MEMORY = 1 << 62
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def get_cpu_limit(root: str = "/sys/fs/cgroup") -> float:
+    """cgroup의 CPU 할당량(코어 수). 제한이 없으면 사용할 수 있는 코어 수"""
+    cgroup = Path(root)
+    cpu_max = _read(cgroup / "cpu.max")
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max":
+            return int(quota) / int(period or 100000)
+    else:
+        quota = _read(cgroup / "cpu" / "cpu.cfs_quota_us")
+        period = _read(cgroup / "cpu" / "cpu.cfs_period_us")
+        if quota and period and int(quota) > 0:
+            return int(quota) / int(period)
+    return float(len(os.sched_getaffinity(0)))
+
+
+def get_memory_limit(root: str = "/sys/fs/cgroup") -> int:
+    """cgroup의 메모리 제한(바이트). 제한이 없으면 물리 메모리 크기"""
+    cgroup = Path(root)
+    limit = _read(cgroup / "memory.max")
+    if limit is None:
+        limit = _read(cgroup / "memory" / "memory.limit_in_bytes")
+    if limit and limit != "max" and int(limit) < UNLIMITED_MEMORY:
+        return int(limit)
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+
+
+@dataclass(frozen=True)
+class ServerSize:
+    workers: int
+    threads: int
+    max_worker_memory: int
+
+
+def get_server_size(
+    cpu: float,
+    memory: int,
+    app_memory: int,
+    worker_memory: int,
+    hashing_memory: int,
+    threads_per_cpu: int = 8,
+    memory_headroom: float = 0.15,
+) -> ServerSize:
+    """CPU와 메모리 제한 안에서 워커와 스레드 수를 정합니다.
+
+    GIL 때문에 워커 하나는 코어 하나 이상을 쓰지 못하므로 워커는 코어 수만큼
+    두고, DB와 Redis를 기다리는 시간은 스레드로 채웁니다. 마스터가 미리 읽은
+    앱(app_memory)은 워커와 공유되므로 한 번만 세고, 워커마다 추가로 쓰는
+    메모리(worker_memory)와 비밀번호 해싱 프로세스(hashing_memory)가 여유분을
+    뺀 메모리 안에 들어가도록 워커 수를 줄입니다. max_worker_memory는 워커를
+    교체할 RSS 최고치로, 공유하는 앱 메모리를 포함합니다.
+    """
+    usable = memory * (1 - memory_headroom) - app_memory
+    per_worker = worker_memory + hashing_memory
+    workers = max(1, min(math.ceil(cpu), int(usable // per_worker)))
+    threads = max(2, math.ceil(cpu * threads_per_cpu / workers))
+    max_worker_memory = app_memory + max(
+        int(usable / workers) - hashing_memory, worker_memory
+    )
+    return ServerSize(workers, threads, max_worker_memory)
+
+
+def get_max_rss() -> int:
+    """현재 프로세스의 RSS 최고치(바이트)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def watch_memory(limit: int, interval: float = 5) -> threading.Thread:
+    """RSS 최고치가 limit을 넘으면 워커에 SIGTERM을 보냅니다.
+
+    gthread와 uvicorn 워커 모두 SIGTERM을 받으면 처리 중인 요청을 마치고
+    종료하며, 마스터가 새 워커를 띄웁니다.
+    """
+
+    def watch():
+        while get_max_rss() <= limit:
+            time.sleep(interval)
+        logger.warning(
+            "Worker %s reached %d MiB RSS, restarting",
+            os.getpid(),
+            get_max_rss() // MiB,
+        )
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    thread = threading.Thread(target=watch, name="memory-watch", daemon=True)
+    thread.start()
+    return thread
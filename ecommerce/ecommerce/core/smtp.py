@@ -0,0 +1,120 @@
+import socketserver
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass
+class ReceivedMessage:
+    received_at: float
+    mail_from: str
+    recipients: list[str]
+    data: bytes
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """메시지를 전달하지 않고 기록만 하는 최소한의 SMTP 세션 처리기"""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        self.reply("220 ecommerce SMTP sink")
+        mail_from, recipients = "", []
+        while line := self.rfile.readline():
+            command = line.decode(errors="replace").strip()
+            verb = command[:4].upper()
+            if verb in ("HELO", "EHLO"):
+                self.reply("250 ecommerce")
+            elif verb == "MAIL":
+                mail_from, recipients = _address(command), []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(_address(command))
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                self.server.record(mail_from, recipients, self._read_data())
+                mail_from, recipients = "", []
+                self.reply("250 OK")
+            elif verb in ("RSET", "NOOP"):
+                if verb == "RSET":
+                    mail_from, recipients = "", []
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+    def _read_data(self) -> bytes:
+        lines = []
+        while (line := self.rfile.readline()) and line != b".\r\n":
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        return b"".join(lines)
+
+
+def _address(command: str) -> str:
+    _, _, address = command.partition(":")
+    return address.strip().split(" ")[0].strip("<>")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """로컬 벤치마크와 개발용 SMTP 서버
+
+    받은 메시지는 전달하지 않고 수신 시각과 함께 메모리에 보관합니다.
+    오래 실행할 때는 max_messages로 최근 메시지만 보관하고 received로 받은
+    개수를 셉니다. STARTTLS와 인증은 지원하지 않으므로 EMAIL_USE_TLS=False로
+    연결합니다.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        max_messages: int | None = None,
+    ) -> None:
+        super().__init__(address, SMTPSinkHandler)
+        self.messages: deque[ReceivedMessage] = deque(maxlen=max_messages)
+        self.received = 0
+        self._received = threading.Condition()
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def record(self, mail_from: str, recipients: list[str], data: bytes):
+        message = ReceivedMessage(time.time(), mail_from, recipients, data)
+        with self._received:
+            self.messages.append(message)
+            self.received += 1
+            self._received.notify_all()
+
+    def wait_for(self, count: int, timeout: float) -> bool:
+        """count개의 메시지를 받을 때까지 기다립니다."""
+        with self._received:
+            return self._received.wait_for(
+                lambda: self.received >= count, timeout
+            )
+
+    def clear(self) -> None:
+        with self._received:
+            self.messages.clear()
+            self.received = 0
+
+    def start(self) -> "SMTPSink":
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="smtp-sink", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,17 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class QueryBudgetTestRunner(DiscoverRunner):
+    """뷰의 쿼리 예산을 넘기거나 N+1이 감지되면 요청이 실패하도록 합니다."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._query_budget_settings = override_settings(
+            QUERY_BUDGET_STRICT=True
+        )
+        self._query_budget_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._query_budget_settings.disable()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,131 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient, APIRequestFactory
+
+from ...accounts.hashing import make_password
+from ...accounts.jwt import jwt_decode, jwt_encode
+from ..metrics import generate_metrics
+from ..throttling import IPRateThrottle
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MetricsTestCase(TestCase):
+    """Prometheus 지표 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("metrics")
+
+    def test_request_latency_by_url_name(self):
+        labels = {"url_name": "signin", "method": "POST", "status": "400"}
+        before = sample("http_request_duration_seconds_count", **labels)
+        queries = sample("http_request_db_queries_count", url_name="signin")
+
+        self.client.post(reverse("signin"), {}, format="json")
+
+        self.assertEqual(
+            sample("http_request_duration_seconds_count", **labels),
+            before + 1,
+        )
+        self.assertEqual(
+            sample("http_request_db_queries_count", url_name="signin"),
+            queries + 1,
+        )
+
+    def test_unmatched_url(self):
+        labels = {"url_name": "unmatched", "method": "GET", "status": "404"}
+        before = sample("http_request_duration_seconds_count", **labels)
+
+        self.client.get("/not-found/")
+
+        self.assertEqual(
+            sample("http_request_duration_seconds_count", **labels),
+            before + 1,
+        )
+
+    def test_scrape(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(b"http_request_duration_seconds", response.content)
+        self.assertIn(b"throttle_rejections_total", response.content)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_scrape_requires_token(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
+
+        response = self.client.get(
+            self.url, HTTP_AUTHORIZATION="Bearer secret"
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class OperationMetricsTestCase(SimpleTestCase):
+    """JWT, 비밀번호 해시, 스로틀 지표 테스트"""
+
+    def test_jwt_duration(self):
+        encoded = sample("jwt_duration_seconds_count", operation="encode")
+        decoded = sample("jwt_duration_seconds_count", operation="decode")
+
+        jwt_decode(jwt_encode({"user_id": "1"}))
+
+        self.assertEqual(
+            sample("jwt_duration_seconds_count", operation="encode"),
+            encoded + 1,
+        )
+        self.assertEqual(
+            sample("jwt_duration_seconds_count", operation="decode"),
+            decoded + 1,
+        )
+
+    def test_password_hash_duration(self):
+        labels = {"operation": "make_password"}
+        before = sample("password_hash_duration_seconds_count", **labels)
+
+        make_password("test1234!!")
+
+        self.assertEqual(
+            sample("password_hash_duration_seconds_count", **labels),
+            before + 1,
+        )
+        self.assertEqual(
+            sample("password_hash_queue_wait_seconds_count", **labels),
+            before + 1,
+        )
+
+    @patch("ecommerce.core.throttling.get_redis_client", return_value=None)
+    def test_throttle_rejections(self, get_redis_client_mock):
+        class Throttle(IPRateThrottle):
+            scope = "metrics_test"
+            rate = "1/min"
+
+        cache.clear()
+        request = APIRequestFactory().get("/")
+        before = sample("throttle_rejections_total", scope="metrics_test")
+
+        self.assertTrue(Throttle().allow_request(request, None))
+        self.assertFalse(Throttle().allow_request(request, None))
+
+        self.assertEqual(
+            sample("throttle_rejections_total", scope="metrics_test"),
+            before + 1,
+        )
+
+    def test_multiprocess_collector(self):
+        with tempfile.TemporaryDirectory() as path, patch.dict(
+            os.environ, {"PROMETHEUS_MULTIPROC_DIR": path}
+        ):
+            self.assertEqual(generate_metrics(), b"")
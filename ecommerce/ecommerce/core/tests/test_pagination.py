@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+from django.test import TestCase
+
+from ...accounts.models import User
+from ..pagination import (
+    Cursor,
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    paginate_keyset,
+)
+
+ORDERING = ("-date_joined", "-id")
+
+
+class KeysetPaginationTestCase(TestCase):
+    """키셋 페이지네이션 테스트"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # 같은 date_joined를 가진 사용자를 섞어 id로 순서를 정하는지 확인한다.
+        cls.users = User.objects.bulk_create(
+            User(
+                email=f"user{i}@test.com",
+                username=f"user{i}",
+                date_joined=datetime(
+                    2023, 1, 1, 0, 0, i // 2, 123456, tzinfo=timezone.utc
+                ),
+            )
+            for i in range(7)
+        )
+        cls.expected = sorted(
+            cls.users, key=lambda user: (user.date_joined, user.id)
+        )[::-1]
+
+    def collect(self, page_size):
+        pages = [paginate_keyset(User.objects.all(), ORDERING, page_size)]
+        while pages[-1].next:
+            pages.append(
+                paginate_keyset(
+                    User.objects.all(), ORDERING, page_size, pages[-1].next
+                )
+            )
+        return pages
+
+    def test_forward(self):
+        for page_size in (1, 2, 3, 7, 10):
+            with self.subTest(page_size=page_size):
+                pages = self.collect(page_size)
+                self.assertEqual(
+                    [user for page in pages for user in page.results],
+                    self.expected,
+                )
+                self.assertIsNone(pages[0].previous)
+                self.assertTrue(all(page.results for page in pages))
+
+    def test_backward(self):
+        pages = self.collect(2)
+        for i in range(len(pages) - 1, 0, -1):
+            previous = paginate_keyset(
+                User.objects.all(), ORDERING, 2, pages[i].previous
+            )
+            self.assertEqual(previous.results, pages[i - 1].results)
+            self.assertEqual(previous.next, pages[i - 1].next)
+        self.assertIsNone(previous.previous)
+
+    def test_single_query_without_count(self):
+        cursor = self.collect(3)[0].next
+        with self.assertNumQueries(1) as context:
+            paginate_keyset(User.objects.all(), ORDERING, 3, cursor)
+        sql = context.captured_queries[0]["sql"]
+        self.assertNotIn("COUNT", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_cursor(self):
+        cursor = Cursor(("2023-01-01T00:00:00.123456+00:00", "3"), True)
+        value = encode_cursor(cursor, ORDERING)
+        self.assertEqual(decode_cursor(value, ORDERING), cursor)
+        for invalid in ("", "abc", encode_cursor(cursor, ("email", "id"))):
+            with self.subTest(value=invalid):
+                with self.assertRaises(InvalidCursor):
+                    decode_cursor(invalid, ORDERING)
@@ -0,0 +1,78 @@
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+from django.urls import path
+from django.views import View
+
+from ...accounts.models import User
+from ..queries import QueryBudgetExceeded
+
+
+class UsersView(View):
+    query_budget = {"GET": 3}
+
+    def get(self, request):
+        for pk in range(int(request.GET.get("count", 1))):
+            User.objects.filter(pk=pk).exists()
+        return HttpResponse()
+
+    def post(self, request):
+        User.objects.filter(email="a").exists()
+        User.objects.filter(username="a").exists()
+        User.objects.filter(uuid=None).exists()
+        User.objects.filter(pin="a").exists()
+        return HttpResponse()
+
+
+class AsyncUsersView(View):
+    query_budget = 1
+
+    async def get(self, request):
+        await User.objects.filter(pk=1).aexists()
+        await sync_to_async(User.objects.filter(pk=2).exists)()
+        return HttpResponse()
+
+
+urlpatterns = [
+    path("users/", UsersView.as_view()),
+    path("async-users/", AsyncUsersView.as_view()),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__, QUERY_N_PLUS_ONE_THRESHOLD=3)
+class QueryBudgetMiddlewareTestCase(TestCase):
+    """요청별 쿼리 예산 테스트"""
+
+    def test_within_budget(self):
+        with self.assertNoLogs("ecommerce.core.queries", level="WARNING"):
+            self.client.get("/users/", {"count": 2})
+            # 메서드별 예산이 없으면 검사하지 않는다.
+            self.client.post("/users/")
+
+    @override_settings(QUERY_BUDGET_STRICT=True, QUERY_N_PLUS_ONE_THRESHOLD=10)
+    def test_strict_mode_raises(self):
+        with self.assertRaisesMessage(
+            QueryBudgetExceeded, "4 queries exceed the budget of 3"
+        ):
+            self.client.get("/users/", {"count": 4})
+
+    @override_settings(QUERY_BUDGET_STRICT=False)
+    def test_logs_n_plus_one(self):
+        with self.assertLogs("ecommerce.core.queries", "WARNING") as logs:
+            response = self.client.get("/users/", {"count": 4})
+        self.assertEqual(response.status_code, 200)
+        (record,) = logs.records
+        self.assertIn("GET UsersView", record.getMessage())
+        self.assertIn("4 queries exceed the budget of 3", record.getMessage())
+        self.assertIn("possible N+1, 4 times", record.getMessage())
+        self.assertEqual(record.query_count, 4)
+        self.assertEqual(record.query_budget, 3)
+        self.assertGreater(record.db_time_ms, 0)
+
+    @override_settings(QUERY_BUDGET_STRICT=False)
+    async def test_counts_queries_from_async_views(self):
+        with self.assertLogs("ecommerce.core.queries", "WARNING") as logs:
+            await self.async_client.get("/async-users/")
+        self.assertIn(
+            "2 queries exceed the budget of 1", logs.records[0].getMessage()
+        )
@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from ..db.routers import (
+    PrimaryReplicaRouter,
+    end_replica_reads,
+    pin_if_user_pinned,
+    pin_user_to_primary,
+    start_replica_reads,
+)
+from ..middleware import ReplicaStickinessMiddleware
+
+PRIMARY = settings.DATABASE_CONNECTION_DEFAULT_NAME
+REPLICA = settings.DATABASE_CONNECTION_REPLICA_NAME
+
+
+@override_settings(DATABASE_REPLICA_ENABLED=True)
+@patch(
+    "ecommerce.core.db.routers.replica_lag_monitor.is_lagging",
+    return_value=False,
+)
+class PrimaryReplicaRouterTestCase(SimpleTestCase):
+    """레플리카 라우터 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.router = PrimaryReplicaRouter()
+
+    def test_read_outside_request_uses_primary(self, is_lagging_mock):
+        self.assertEqual(self.router.db_for_read(None), PRIMARY)
+
+    def test_read_in_request_uses_replica(self, is_lagging_mock):
+        token = start_replica_reads()
+        self.addCleanup(end_replica_reads, token)
+
+        self.assertEqual(self.router.db_for_read(None), REPLICA)
+
+    def test_read_after_write_uses_primary(self, is_lagging_mock):
+        token = start_replica_reads()
+        self.addCleanup(end_replica_reads, token)
+
+        self.assertEqual(self.router.db_for_write(None), PRIMARY)
+        self.assertEqual(self.router.db_for_read(None), PRIMARY)
+
+    def test_lagging_replica_uses_primary(self, is_lagging_mock):
+        is_lagging_mock.return_value = True
+        token = start_replica_reads()
+        self.addCleanup(end_replica_reads, token)
+
+        self.assertEqual(self.router.db_for_read(None), PRIMARY)
+
+    @override_settings(DATABASE_REPLICA_ENABLED=False)
+    def test_disabled_replica_uses_primary(self, is_lagging_mock):
+        token = start_replica_reads()
+        self.addCleanup(end_replica_reads, token)
+
+        self.assertEqual(self.router.db_for_read(None), PRIMARY)
+
+    def test_pinned_user_uses_primary(self, is_lagging_mock):
+        pin_user_to_primary("user-uuid")
+        token = start_replica_reads()
+        self.addCleanup(end_replica_reads, token)
+
+        pin_if_user_pinned("other-uuid")
+        self.assertEqual(self.router.db_for_read(None), REPLICA)
+        pin_if_user_pinned("user-uuid")
+        self.assertEqual(self.router.db_for_read(None), PRIMARY)
+
+
+@override_settings(DATABASE_REPLICA_ENABLED=True)
+@patch(
+    "ecommerce.core.db.routers.replica_lag_monitor.is_lagging",
+    return_value=False,
+)
+class ReplicaStickinessMiddlewareTestCase(SimpleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.factory = RequestFactory()
+        self.router = PrimaryReplicaRouter()
+        self.cookie = settings.DATABASE_REPLICA_STICKINESS_COOKIE
+
+    def test_write_sets_cookie(self, is_lagging_mock):
+        def view(request):
+            self.router.db_for_write(None)
+            return HttpResponse()
+
+        response = ReplicaStickinessMiddleware(view)(self.factory.post("/"))
+        self.assertIn(self.cookie, response.cookies)
+
+    def test_read_does_not_set_cookie(self, is_lagging_mock):
+        def view(request):
+            self.assertEqual(self.router.db_for_read(None), REPLICA)
+            return HttpResponse()
+
+        response = ReplicaStickinessMiddleware(view)(self.factory.get("/"))
+        self.assertNotIn(self.cookie, response.cookies)
+
+    def test_cookie_pins_to_primary(self, is_lagging_mock):
+        def view(request):
+            self.assertEqual(self.router.db_for_read(None), PRIMARY)
+            return HttpResponse()
+
+        request = self.factory.get("/")
+        request.COOKIES[self.cookie] = "1"
+        ReplicaStickinessMiddleware(view)(request)
+
+    async def test_async_write_sets_cookie(self, is_lagging_mock):
+        async def view(request):
+            self.router.db_for_write(None)
+            return HttpResponse()
+
+        middleware = ReplicaStickinessMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = await middleware(self.factory.post("/"))
+        self.assertIn(self.cookie, response.cookies)
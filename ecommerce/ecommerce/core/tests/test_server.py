@@ -0,0 +1,103 @@
+import os
+import runpy
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from ..server import MiB, get_cpu_limit, get_memory_limit, get_server_size
+
+
+class CgroupLimitTestCase(SimpleTestCase):
+    """cgroup CPU/메모리 제한 읽기 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+
+    def write(self, name, value):
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{value}\n")
+
+    def test_cgroup_v2(self):
+        self.write("cpu.max", "50000 100000")
+        self.write("memory.max", 512 * MiB)
+
+        self.assertEqual(get_cpu_limit(self.root), 0.5)
+        self.assertEqual(get_memory_limit(self.root), 512 * MiB)
+
+    def test_cgroup_v1(self):
+        self.write("cpu/cpu.cfs_quota_us", 150000)
+        self.write("cpu/cpu.cfs_period_us", 100000)
+        self.write("memory/memory.limit_in_bytes", 1024 * MiB)
+
+        self.assertEqual(get_cpu_limit(self.root), 1.5)
+        self.assertEqual(get_memory_limit(self.root), 1024 * MiB)
+
+    def test_unlimited(self):
+        self.write("cpu.max", "max 100000")
+        self.write("memory/memory.limit_in_bytes", 9223372036854771712)
+
+        self.assertEqual(
+            get_cpu_limit(self.root), len(os.sched_getaffinity(0))
+        )
+        self.assertEqual(
+            get_memory_limit(self.root),
+            os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES"),
+        )
+
+
+class ServerSizeTestCase(SimpleTestCase):
+    """워커와 스레드 수 계산 테스트"""
+
+    def get_size(self, cpu, memory, hashing_memory=180 * MiB):
+        return get_server_size(
+            cpu=cpu,
+            memory=memory * MiB,
+            app_memory=80 * MiB,
+            worker_memory=96 * MiB,
+            hashing_memory=hashing_memory,
+        )
+
+    def test_small_container(self):
+        size = self.get_size(0.5, 512)
+
+        self.assertEqual((size.workers, size.threads), (1, 4))
+        self.assertEqual(size.max_worker_memory // MiB, 255)
+
+    def test_memory_bound(self):
+        size = self.get_size(4, 1024)
+
+        self.assertEqual((size.workers, size.threads), (2, 16))
+
+    def test_cpu_bound(self):
+        size = self.get_size(2, 8192, hashing_memory=0)
+
+        self.assertEqual((size.workers, size.threads), (2, 8))
+
+
+class GunicornConfigTestCase(SimpleTestCase):
+    """gunicorn 설정 파일 테스트"""
+
+    def test_config(self):
+        with tempfile.TemporaryDirectory() as directory, patch.dict(
+            os.environ,
+            {
+                "WEB_CPU_LIMIT": "0.5",
+                "WEB_MEMORY_LIMIT": "512",
+                "PROMETHEUS_MULTIPROC_DIR": directory,
+            },
+        ):
+            config = runpy.run_path(
+                str(settings.BASE_DIR / "gunicorn.conf.py")
+            )
+
+        self.assertTrue(config["preload_app"])
+        self.assertEqual(config["wsgi_app"], "ecommerce.wsgi:application")
+        self.assertEqual((config["workers"], config["threads"]), (1, 4))
+        self.assertGreater(config["max_worker_memory"], 200 * MiB)
@@ -0,0 +1,57 @@
+from django.core.mail import EmailMessage, get_connection
+from django.test import SimpleTestCase
+
+from ..smtp import SMTPSink
+
+
+class SMTPSinkTestCase(SimpleTestCase):
+    """로컬 SMTP 싱크 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.sink = SMTPSink().start()
+        self.addCleanup(self.sink.stop)
+
+    def connect(self, sink):
+        return get_connection(
+            "django.core.mail.backends.smtp.EmailBackend",
+            host="127.0.0.1",
+            port=sink.port,
+            username="",
+            password="",
+            use_tls=False,
+            use_ssl=False,
+        )
+
+    def test_receives_messages_over_one_connection(self):
+        connection = self.connect(self.sink)
+        messages = [
+            EmailMessage("Subject", f".body {i}", "from@test.com", [to])
+            for i, to in enumerate(["a@test.com", "b@test.com"])
+        ]
+        self.assertEqual(connection.send_messages(messages), 2)
+
+        self.assertTrue(self.sink.wait_for(2, timeout=5))
+        self.assertEqual(
+            [message.recipients for message in self.sink.messages],
+            [["a@test.com"], ["b@test.com"]],
+        )
+        self.assertEqual(self.sink.messages[0].mail_from, "from@test.com")
+        self.assertIn(b"\n.body 0", self.sink.messages[0].data)
+
+    def test_max_messages_bounds_memory(self):
+        sink = SMTPSink(max_messages=1).start()
+        self.addCleanup(sink.stop)
+        connection = self.connect(sink)
+        messages = [
+            EmailMessage("Subject", "body", "from@test.com", [to])
+            for to in ["a@test.com", "b@test.com"]
+        ]
+        connection.send_messages(messages)
+
+        self.assertTrue(sink.wait_for(2, timeout=5))
+        self.assertEqual(sink.received, 2)
+        self.assertEqual(
+            [message.recipients for message in sink.messages],
+            [["b@test.com"]],
+        )
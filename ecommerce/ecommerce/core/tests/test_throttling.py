@@ -0,0 +1,83 @@
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from ..redis import get_redis_client
+from ..throttling import EmailRateThrottle, IPRateThrottle
+
+
+class SigninThrottle(IPRateThrottle):
+    scope = "test"
+    rate = "2/min"
+
+
+class SigninEmailThrottle(EmailRateThrottle):
+    scope = "test_email"
+    rate = "2/min"
+
+
+class SlidingWindowRateThrottleTestCase(SimpleTestCase):
+    """슬라이딩 윈도 스로틀 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.factory = APIRequestFactory()
+
+    def request(self, email="test@test.com"):
+        return Request(
+            self.factory.post("/", {"email": email}, format="json"),
+            parsers=[JSONParser()],
+        )
+
+    def assert_limits(self, throttle_class):
+        throttle = throttle_class()
+        self.assertTrue(throttle.allow_request(self.request(), None))
+        self.assertTrue(throttle.allow_request(self.request(), None))
+        self.assertFalse(throttle.allow_request(self.request(), None))
+        self.assertGreater(throttle.wait(), 0)
+        self.assertLessEqual(throttle.wait(), 60)
+
+    @patch("ecommerce.core.throttling.get_redis_client", return_value=None)
+    def test_falls_back_to_cache(self, get_redis_client_mock):
+        self.assert_limits(SigninThrottle)
+
+    @override_settings(THROTTLING_ENABLED=False)
+    def test_disabled(self):
+        throttle = SigninThrottle()
+        for _ in range(3):
+            self.assertTrue(throttle.allow_request(self.request(), None))
+
+    @skipUnless(settings.REDIS_URL, "REDIS_URL is not configured")
+    def test_redis_sliding_window(self):
+        self.assert_limits(SigninThrottle)
+
+    @skipUnless(settings.REDIS_URL, "REDIS_URL is not configured")
+    def test_redis_keys_by_email(self):
+        throttle = SigninEmailThrottle()
+        for _ in range(2):
+            throttle.allow_request(self.request(), None)
+
+        self.assertFalse(throttle.allow_request(self.request(), None))
+        self.assertFalse(
+            throttle.allow_request(self.request(" TEST@test.com"), None)
+        )
+        self.assertTrue(
+            throttle.allow_request(self.request("other@test.com"), None)
+        )
+
+    @skipUnless(settings.REDIS_URL, "REDIS_URL is not configured")
+    def test_redis_single_round_trip(self):
+        throttle = SigninThrottle()
+        client = get_redis_client()
+        with patch.object(
+            client, "evalsha", wraps=client.evalsha
+        ) as evalsha_mock:
+            throttle.allow_request(self.request(), None)
+        self.assertEqual(evalsha_mock.call_count, 1)
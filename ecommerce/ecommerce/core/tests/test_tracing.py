@@ -0,0 +1,143 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind
+from rest_framework.test import APIClient
+
+from ...accounts.emails import _send_account_confirmation_email
+from ...accounts.models import User
+from ..tracing import create_tracer_provider, tracer
+
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+PARENT_ID = "b7ad6b7169203331"
+TRACEPARENT = f"00-{TRACE_ID}-{PARENT_ID}-01"
+
+exporter = InMemorySpanExporter()
+provider = TracerProvider()
+provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+
+def setUpModule():
+    trace.set_tracer_provider(provider)
+
+
+def tearDownModule():
+    exporter.shutdown()
+
+
+class TracingTestCase(TestCase):
+    """요청, 서비스, JWT, 쿼리 스팬 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        exporter.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password="test1234!!",
+            username="test_user",
+            is_active=True,
+        )
+
+    def signin(self, **extra):
+        response = self.client.post(
+            reverse("signin"),
+            {"email": self.user.email, "password": "test1234!!"},
+            format="json",
+            **extra,
+        )
+        self.assertEqual(response.status_code, 200)
+        return {span.name: span for span in exporter.get_finished_spans()}
+
+    def test_signin_spans(self):
+        spans = self.signin()
+
+        root = spans["POST accounts/signin/"]
+        self.assertEqual(root.kind, SpanKind.SERVER)
+        self.assertIsNone(root.parent)
+        for name in (
+            "AccountService.get_user",
+            "verify_password",
+            "AccountService.create_tokens",
+            "jwt_encode",
+            "db.query",
+        ):
+            self.assertEqual(
+                spans[name].context.trace_id, root.context.trace_id
+            )
+        self.assertEqual(
+            spans["verify_password"].parent.span_id,
+            spans["AccountService.get_user"].context.span_id,
+        )
+
+    def test_continues_incoming_trace(self):
+        spans = self.signin(HTTP_TRACEPARENT=TRACEPARENT)
+
+        root = spans["POST accounts/signin/"]
+        self.assertEqual(root.context.trace_id, int(TRACE_ID, 16))
+        self.assertEqual(root.parent.span_id, int(PARENT_ID, 16))
+
+
+class CeleryTracingTestCase(TestCase):
+    """Celery 발행과 실행 사이의 트레이스 전달 테스트"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        exporter.clear()
+        self.task = _send_account_confirmation_email
+
+    @patch("celery.app.task.Task.apply_async")
+    def test_publish_injects_trace_context(self, apply_async_mock):
+        with tracer.start_as_current_span("request") as parent:
+            self.task.delay("test@test.com", "123456")
+
+        publish = exporter.get_finished_spans()[0]
+        self.assertEqual(publish.name, f"celery.publish {self.task.name}")
+        self.assertEqual(publish.parent.span_id, parent.context.span_id)
+        headers = apply_async_mock.call_args.kwargs["headers"]
+        _, trace_id, span_id, _ = headers["traceparent"].split("-")
+        self.assertEqual(int(trace_id, 16), publish.context.trace_id)
+        self.assertEqual(int(span_id, 16), publish.context.span_id)
+
+    @patch("ecommerce.accounts.emails._send_message")
+    def test_worker_continues_trace(self, send_message_mock):
+        self.task.push_request(traceparent=TRACEPARENT)
+        try:
+            self.task("test@test.com", "123456")
+        finally:
+            self.task.pop_request()
+
+        run = exporter.get_finished_spans()[0]
+        self.assertEqual(run.name, f"celery.run {self.task.name}")
+        self.assertEqual(run.kind, SpanKind.CONSUMER)
+        self.assertEqual(run.context.trace_id, int(TRACE_ID, 16))
+        self.assertEqual(run.parent.span_id, int(PARENT_ID, 16))
+
+    def test_worker_keeps_task_request(self):
+        task_ids = []
+        with patch(
+            "ecommerce.accounts.emails._send_message",
+            side_effect=lambda message: task_ids.append(self.task.request.id),
+        ):
+            self.task.apply(("test@test.com", "123456"), task_id="task-id")
+
+        self.assertEqual(task_ids, ["task-id"])
+
+    def test_head_sampling(self):
+        for sample_rate, recording in ((0.0, False), (1.0, True)):
+            sampled = create_tracer_provider(
+                "test", InMemorySpanExporter(), sample_rate
+            )
+            span = sampled.get_tracer(__name__).start_span("request")
+            self.assertEqual(span.is_recording(), recording)
+            span.end()
+            sampled.shutdown()
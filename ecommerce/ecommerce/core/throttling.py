@@ -0,0 +1,110 @@
+import hashlib
+import logging
+import time
+from functools import lru_cache
+from uuid import uuid4
+
+from django.conf import settings
+from redis.exceptions import RedisError
+from rest_framework import throttling
+
+from .metrics import THROTTLE_REJECTIONS
+from .redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 윈도 밖의 기록을 지우고, 한도 안이면 현재 요청을 기록합니다.
+# 거절되면 가장 오래된 기록이 윈도를 벗어날 때까지 남은 밀리초를 반환합니다.
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - window)
+if redis.call("ZCARD", KEYS[1]) >= limit then
+    local oldest = redis.call("ZRANGE", KEYS[1], 0, 0, "WITHSCORES")
+    return {0, tonumber(oldest[2]) + window - now}
+end
+redis.call("ZADD", KEYS[1], now, ARGV[4])
+redis.call("PEXPIRE", KEYS[1], window)
+return {1, 0}
+"""
+
+
+@lru_cache(maxsize=None)
+def get_sliding_window_script():
+    return get_redis_client().register_script(SLIDING_WINDOW_SCRIPT)
+
+
+class SlidingWindowRateThrottle(throttling.SimpleRateThrottle):
+    """Redis 정렬 집합에 요청 시각을 기록하는 슬라이딩 윈도 스로틀
+
+    확인과 기록은 서버 측 스크립트 한 번으로 원자적으로 처리되므로 모든
+    워커가 같은 한도를 공유합니다. REDIS_URL이 없으면 기본 캐시를 사용하는
+    SimpleRateThrottle로 동작합니다. THROTTLING_ENABLED가 꺼져 있으면(부하
+    테스트) 모든 요청을 허용합니다.
+    """
+
+    def allow_request(self, request, view):
+        if not settings.THROTTLING_ENABLED:
+            return True
+        allowed = self._allow_request(request, view)
+        if not allowed:
+            THROTTLE_REJECTIONS.labels(self.scope).inc()
+        return allowed
+
+    def _allow_request(self, request, view):
+        client = get_redis_client()
+        if client is None:
+            return super().allow_request(request, view)
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        try:
+            allowed, wait_ms = get_sliding_window_script()(
+                keys=[self.key],
+                args=[
+                    int(time.time() * 1000),
+                    self.duration * 1000,
+                    self.num_requests,
+                    uuid4().hex,
+                ],
+            )
+        except RedisError:
+            logger.warning("Throttle check failed", exc_info=True)
+            return True
+        self._wait = wait_ms / 1000
+        return bool(allowed)
+
+    def wait(self):
+        if hasattr(self, "_wait"):
+            return self._wait
+        return super().wait()
+
+
+class AnonRateThrottle(SlidingWindowRateThrottle, throttling.AnonRateThrottle):
+    pass
+
+
+class IPRateThrottle(SlidingWindowRateThrottle):
+    """클라이언트 IP 기준 스로틀. 하위 클래스에서 scope를 지정합니다."""
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class EmailRateThrottle(SlidingWindowRateThrottle):
+    """요청 본문의 대상 이메일 기준 스로틀. 하위 클래스에서 scope를 지정합니다."""
+
+    def get_cache_key(self, request, view):
+        data = request.data
+        email = data.get("email") if isinstance(data, dict) else None
+        if not isinstance(email, str) or not email:
+            return None
+        ident = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
@@ -0,0 +1,225 @@
+import os
+import threading
+from functools import wraps
+from typing import Any, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from celery import Task
+from celery.signals import worker_process_init
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from opentelemetry import propagate, trace
+from opentelemetry.propagators.textmap import Getter
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind
+
+# TracerProvider가 설정되기 전에는 아무것도 기록하지 않는 스팬을 만듭니다.
+tracer = trace.get_tracer("ecommerce")
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def create_tracer_provider(
+    service_name: str, exporter: SpanExporter, sample_rate: float
+) -> TracerProvider:
+    """요청 시작 시점에 trace id로 샘플링 여부를 정하고, 상위 스팬이 있으면
+    그 결정을 따릅니다."""
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(sample_rate)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    return provider
+
+
+def get_span_exporter() -> SpanExporter:
+    if settings.TRACING_EXPORTER == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+    if settings.TRACING_EXPORTER == "file":
+        return ConsoleSpanExporter(
+            out=open(settings.TRACING_FILE, "a", buffering=1),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    raise ImproperlyConfigured(
+        f"Unknown TRACING_EXPORTER {settings.TRACING_EXPORTER!r}"
+    )
+
+
+def configure_tracing(service_name: str) -> None:
+    """TRACING_EXPORTER가 지정되어 있으면 프로세스의 TracerProvider를
+    설정합니다. 여러 번 호출해도 한 번만 설정됩니다."""
+    global _configured
+    if not settings.TRACING_EXPORTER:
+        return
+    with _configure_lock:
+        if _configured:
+            return
+        trace.set_tracer_provider(
+            create_tracer_provider(
+                service_name,
+                get_span_exporter(),
+                settings.TRACING_SAMPLE_RATE,
+            )
+        )
+        _configured = True
+
+
+@worker_process_init.connect
+def configure_worker_tracing(**kwargs: Any) -> None:
+    # 내보내기 스레드가 fork 이후 워커 프로세스에서 시작되도록 합니다.
+    configure_tracing("ecommerce-worker")
+
+
+def traced(name: str | None = None) -> Callable:
+    """함수 호출을 스팬으로 감쌉니다. 이름을 생략하면 함수의 qualname을
+    사용합니다."""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.start_as_current_span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _trace_query(execute, sql, params, many, context):
+    if not trace.get_current_span().is_recording():
+        return execute(sql, params, many, context)
+    with tracer.start_as_current_span(
+        "db.query",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": context["connection"].vendor,
+            "db.statement": sql,
+        },
+    ):
+        return execute(sql, params, many, context)
+
+
+def install_query_tracer(connection) -> None:
+    if _trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_trace_query)
+
+
+@receiver(connection_created)
+def install_query_tracer_on_connect(sender, connection, **kwargs):
+    install_query_tracer(connection)
+
+
+class TracingMiddleware:
+    """요청마다 서버 스팬을 시작합니다. traceparent 헤더가 있으면 그
+    트레이스를 이어 갑니다."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with self._start(request) as span:
+            response = self.get_response(request)
+            self._finish(span, request, response)
+            return response
+
+    async def __acall__(self, request):
+        with self._start(request) as span:
+            response = await self.get_response(request)
+            self._finish(span, request, response)
+            return response
+
+    @staticmethod
+    def _start(request):
+        for connection in connections.all(initialized_only=True):
+            install_query_tracer(connection)
+        return tracer.start_as_current_span(
+            request.method,
+            context=propagate.extract(request.headers),
+            kind=SpanKind.SERVER,
+            attributes={
+                "http.request.method": request.method,
+                "url.path": request.path,
+            },
+        )
+
+    @staticmethod
+    def _finish(span, request, response) -> None:
+        if not span.is_recording():
+            return
+        match = request.resolver_match
+        if match:
+            span.update_name(f"{request.method} {match.route}")
+            span.set_attribute("http.route", match.route)
+        span.set_attribute("http.response.status_code", response.status_code)
+
+
+class _TaskRequestGetter(Getter):
+    def get(self, carrier, key):
+        value = getattr(carrier, key, None)
+        return [value] if value is not None else None
+
+    def keys(self, carrier):
+        return []
+
+
+class TracedTask(Task):
+    """발행을 스팬으로 감싸고 트레이스 컨텍스트를 메시지 헤더로 워커에
+    전달합니다."""
+
+    def apply_async(self, args=None, kwargs=None, **options):
+        with tracer.start_as_current_span(
+            f"celery.publish {self.name}", kind=SpanKind.PRODUCER
+        ):
+            headers = dict(options.get("headers") or {})
+            propagate.inject(headers)
+            options["headers"] = headers
+            return super().apply_async(args, kwargs, **options)
+
+    def __call__(self, *args, **kwargs):
+        # 헤더가 없으면(직접 호출, eager 실행) 현재 컨텍스트를 이어 갑니다.
+        context = None
+        if getattr(self.request, "traceparent", None):
+            context = propagate.extract(
+                self.request, getter=_TaskRequestGetter()
+            )
+        with tracer.start_as_current_span(
+            f"celery.run {self.name}", context=context, kind=SpanKind.CONSUMER
+        ):
+            # 워커가 넣어 둔 요청(id, retries)을 덮어쓰지 않도록 run을 바로
+            # 호출합니다. Task.__call__은 빈 요청을 새로 넣습니다.
+            if self.request_stack.top is not None:
+                return self.run(*args, **kwargs)
+            return super().__call__(*args, **kwargs)
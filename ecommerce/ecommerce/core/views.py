@@ -0,0 +1,18 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+
+from .metrics import CONTENT_TYPE_LATEST, generate_metrics
+
+
+@require_GET
+def metrics(request):
+    """Prometheus 스크레이프 엔드포인트. DRF 인증과 스로틀을 거치지 않는다."""
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        provided = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(provided.encode(), expected.encode()):
+            return HttpResponseForbidden()
+    return HttpResponse(generate_metrics(), content_type=CONTENT_TYPE_LATEST)
@@ -60,10 +60,14 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "ecommerce.core.tracing.TracingMiddleware",
+    "ecommerce.core.metrics.MetricsMiddleware",
+    "ecommerce.core.queries.QueryBudgetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "ecommerce.core.middleware.ReplicaStickinessMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -114,6 +118,37 @@ DATABASES = {
         conn_max_age=DB_CONN_MAX_AGE,
     ),
 }
+DATABASES[DATABASE_CONNECTION_REPLICA_NAME]["TEST"] = {
+    "MIRROR": DATABASE_CONNECTION_DEFAULT_NAME
+}
+
+DATABASE_ROUTERS = ["ecommerce.core.db.routers.PrimaryReplicaRouter"]
+DATABASE_REPLICA_ENABLED = get_bool_from_env(
+    "DATABASE_REPLICA_ENABLED", "DATABASE_REPLICA_URL" in os.environ
+)
+DATABASE_REPLICA_MAX_LAG = float(os.environ.get("DATABASE_REPLICA_MAX_LAG", 2))
+DATABASE_REPLICA_LAG_CHECK_INTERVAL = float(
+    os.environ.get("DATABASE_REPLICA_LAG_CHECK_INTERVAL", 1)
+)
+DATABASE_REPLICA_STICKINESS_SECONDS = int(
+    os.environ.get("DATABASE_REPLICA_STICKINESS_SECONDS", 5)
+)
+DATABASE_REPLICA_STICKINESS_COOKIE = "primary_pin"
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+REDIS_URL = os.environ.get("REDIS_URL", "")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+    if REDIS_URL
+    else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
 
 
 # Password validation
@@ -169,14 +204,27 @@ CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", None)
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60
+# 작업을 발행하는 기본 큐. 벤치마크 워커는 다른 워커와 섞이지 않도록 고유한
+# 큐를 사용합니다.
+CELERY_TASK_DEFAULT_QUEUE = os.environ.get(
+    "CELERY_TASK_DEFAULT_QUEUE", "celery"
+)
 
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "ecommerce.accounts.hashers.CalibratedArgon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
     "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
     "django.contrib.auth.hashers.ScryptPasswordHasher",
 ]
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", 2))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_MEMORY_COST", 102400))
+ARGON2_PARALLELISM = int(os.environ.get("ARGON2_PARALLELISM", 8))
+PASSWORD_HASHING_WORKERS = int(os.environ.get("PASSWORD_HASHING_WORKERS", 1))
+PASSWORD_HASHING_MAX_PENDING = int(
+    os.environ.get("PASSWORD_HASHING_MAX_PENDING", 8)
+)
+PASSWORD_HASHING_TIMEOUT = float(os.environ.get("PASSWORD_HASHING_TIMEOUT", 5))
 PIN_MAX_LENGTH = 6
 PIN_FAILURES_LIMIT = 5
 PIN_EXPIRE_TIMEDELTA_SECONDS = 300
@@ -190,6 +238,20 @@ EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = get_bool_from_env("EMAIL_USE_TLS", True)
 EMAIL_USE_SSL = get_bool_from_env("EMAIL_USE_SSL", False)
 
+# 계정 확인 이메일을 Redis 대기열에 모았다가 하나의 연결로 전송합니다.
+EMAIL_BATCH_ENABLED = get_bool_from_env("EMAIL_BATCH_ENABLED", False)
+EMAIL_BATCH_SIZE = int(os.environ.get("EMAIL_BATCH_SIZE", 100))
+EMAIL_BATCH_WINDOW = float(os.environ.get("EMAIL_BATCH_WINDOW", 2))
+EMAIL_BATCH_QUEUE_KEY = os.environ.get(
+    "EMAIL_BATCH_QUEUE_KEY", "accounts:confirmation_emails"
+)
+# 플러시는 이 시간 안에 끝나야 하며, 그보다 오래된 처리 목록은 중단된
+# 플러시의 것으로 보고 대기열로 되돌립니다.
+EMAIL_FLUSH_TIMEOUT = int(os.environ.get("EMAIL_FLUSH_TIMEOUT", 300))
+# 일시적인 전송 실패는 EMAIL_RETRY_DELAY초부터 두 배씩 늘려 다시 보냅니다.
+EMAIL_MAX_RETRIES = int(os.environ.get("EMAIL_MAX_RETRIES", 5))
+EMAIL_RETRY_DELAY = int(os.environ.get("EMAIL_RETRY_DELAY", 30))
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "ecommerce.accounts.authentication.JWTAuthentication",
@@ -202,20 +264,34 @@ REST_FRAMEWORK = {
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "ecommerce.core.pagination.KeysetPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
+        "ecommerce.core.throttling.AnonRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "120/min",
+        "signup": "10/min",
+        "signup_email": "3/min",
+        "signin": "30/min",
+        "signin_email": "5/min",
+        "confirm": "30/min",
+        "confirm_email": "5/min",
+        "token_refresh": "60/min",
     },
 }
 
+# 부하 테스트 대상 서버에서만 끕니다. 한 IP에서 보내는 요청이 스로틀에 막히지
+# 않도록 합니다.
+THROTTLING_ENABLED = get_bool_from_env("THROTTLING_ENABLED", True)
+
 ENABLE_CONFIRMATION_BY_EMAIL = get_bool_from_env(
     "ENABLE_CONFIRMATION_BY_EMAIL", True
 )
 
+# ASGI 진입점(asgi.py)은 기본으로 비동기 계정 API를 사용합니다.
+ACCOUNTS_ASYNC_VIEWS = get_bool_from_env("ACCOUNTS_ASYNC_VIEWS", False)
+
 CLIENT_HOST = os.environ.get("CLIENT_HOST", "http://localhost:8000")
 
 AUTH_HEADER_TYPE = "Bearer"
@@ -223,8 +299,61 @@ AUTH_HEADER_REALM = "api"
 
 JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "jwt-secret")
 JWT_ALGORITHM = os.environ.get("JWT_ALGORITHM", "HS256")
+# EdDSA/ES256은 JWT_SIGNING_KEY_FILE의 PEM 개인 키로 서명하고 kid 헤더를
+# 붙입니다. 키를 교체할 때는 새 공개 키를 JWT_VERIFICATION_KEY_FILES에 먼저
+# 추가해 JWKS 캐시(JWT_JWKS_MAX_AGE)가 갱신된 뒤 서명 키를 바꾸고, 이전 키는
+# 리프레시 토큰이 만료된 뒤(JWT_TTL_REFRESH) 목록에서 뺍니다.
+JWT_SIGNING_KEY_FILE = os.environ.get("JWT_SIGNING_KEY_FILE", "")
+JWT_VERIFICATION_KEY_FILES = [
+    path
+    for path in os.environ.get("JWT_VERIFICATION_KEY_FILES", "").split(",")
+    if path
+]
+JWT_JWKS_MAX_AGE = int(os.environ.get("JWT_JWKS_MAX_AGE", 300))
 JWT_ACCESS_TYPE = "access"
 JWT_REFRESH_TYPE = "refresh"
 JWT_TTL_ACCESS = timedelta(seconds=int(os.environ.get("JWT_TTL_ACCESS", 300)))
 JWT_TTL_REFRESH = timedelta(days=int(os.environ.get("JWT_TTL_REFRESH", 7)))
 SECURE_SSL_REDIRECT = get_bool_from_env("SECURE_SSL_REDIRECT", False)
+
+PRINCIPAL_CACHE_SIZE = int(os.environ.get("PRINCIPAL_CACHE_SIZE", 10000))
+PRINCIPAL_CACHE_LOCAL_TTL = int(os.environ.get("PRINCIPAL_CACHE_LOCAL_TTL", 5))
+PRINCIPAL_CACHE_TTL = int(os.environ.get("PRINCIPAL_CACHE_TTL", 300))
+
+# 워커마다 폐기 목록을 블룸 필터로 들고 있다가 이 주기(초)마다 새 항목을
+# 가져옵니다. 필터 크기는 CAPACITY개를 넣었을 때 오탐률이 ERROR_RATE가 되도록
+# 정해지며(최소값), 항목 100,000개와 0.1%이면 약 180KB입니다. 만료되지 않은
+# 항목이 더 많으면 그 두 배 크기로 다시 만듭니다.
+TOKEN_REVOCATION_REFRESH_INTERVAL = float(
+    os.environ.get("TOKEN_REVOCATION_REFRESH_INTERVAL", 1)
+)
+TOKEN_REVOCATION_BLOOM_CAPACITY = int(
+    os.environ.get("TOKEN_REVOCATION_BLOOM_CAPACITY", 100000)
+)
+TOKEN_REVOCATION_BLOOM_ERROR_RATE = float(
+    os.environ.get("TOKEN_REVOCATION_BLOOM_ERROR_RATE", 0.001)
+)
+
+# 요청의 쿼리 수가 뷰의 query_budget을 넘거나 같은 SQL이 임계값 이상 반복되면
+# 경고를 남깁니다. 테스트 러너는 엄격 모드로 실행해 테스트를 실패시킵니다.
+QUERY_BUDGET_STRICT = get_bool_from_env("QUERY_BUDGET_STRICT", False)
+QUERY_N_PLUS_ONE_THRESHOLD = int(
+    os.environ.get("QUERY_N_PLUS_ONE_THRESHOLD", 5)
+)
+TEST_RUNNER = "ecommerce.core.test_runner.QueryBudgetTestRunner"
+
+# /metrics/에서 Prometheus 지표를 노출합니다. METRICS_TOKEN을 지정하면
+# Authorization: Bearer <token> 헤더가 있는 요청만 허용합니다. 여러 프로세스로
+# 실행할 때는 PROMETHEUS_MULTIPROC_DIR 환경 변수를 지정합니다.
+METRICS_ENABLED = get_bool_from_env("METRICS_ENABLED", True)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# 트레이스를 TRACING_EXPORTER("otlp" 또는 "file")로 내보냅니다. 비어 있으면
+# 스팬을 기록하지 않습니다. 새 트레이스는 TRACING_SAMPLE_RATE 비율만 기록하고,
+# traceparent 헤더로 이어지는 트레이스는 상위의 샘플링 결정을 따릅니다.
+TRACING_EXPORTER = os.environ.get("TRACING_EXPORTER", "")
+TRACING_OTLP_ENDPOINT = os.environ.get(
+    "TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"
+)
+TRACING_FILE = os.environ.get("TRACING_FILE", "traces.jsonl")
+TRACING_SAMPLE_RATE = float(os.environ.get("TRACING_SAMPLE_RATE", 0.01))
@@ -18,11 +18,25 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 
+from .accounts.views import JWKSView
+from .core.views import metrics
+
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("accounts/", include("ecommerce.accounts.urls")),
+    path(".well-known/jwks.json", JWKSView.as_view(), name="jwks"),
+    path(
+        "accounts/",
+        include(
+            "ecommerce.accounts.async_urls"
+            if settings.ACCOUNTS_ASYNC_VIEWS
+            else "ecommerce.accounts.urls"
+        ),
+    ),
 ]
 
+if settings.METRICS_ENABLED:
+    urlpatterns += [path("metrics/", metrics, name="metrics")]
+
 if settings.DEBUG:
     import debug_toolbar
 
@@ -0,0 +1,116 @@
+"""
+운영 서버(gunicorn) 설정
+
+    gunicorn -c gunicorn.conf.py
+
+마스터가 앱을 미리 읽은 뒤 워커를 fork하므로 워커는 앱 메모리를 copy-on-write로
+공유합니다. 워커와 스레드 수는 컨테이너의 cgroup CPU/메모리 제한으로 정하며
+WEB_CONCURRENCY, WEB_THREADS로 덮어쓸 수 있습니다. 워커는 WEB_MAX_REQUESTS개의
+요청을 처리했거나 RSS 최고치가 WEB_MAX_WORKER_MEMORY(MiB)를 넘으면 처리 중인
+요청을 마치고 교체됩니다. WEB_WORKER_CLASS=uvicorn이면 ASGI 앱을 띄웁니다.
+
+재시작
+    SIGHUP: 설정을 다시 읽고 새 워커를 띄운 뒤 기존 워커를 정상 종료합니다.
+        앱을 미리 읽었으므로 코드는 바뀌지 않습니다.
+    SIGUSR2: 새 코드로 새 마스터를 띄우고, 새 마스터가 준비되면 기존 마스터를
+        정상 종료합니다. 리스닝 소켓을 넘겨받으므로 연결이 끊기지 않습니다.
+        gunicorn이 컨테이너의 PID 1이면 기존 마스터와 함께 컨테이너가
+        종료되므로 컨테이너를 교체하는 롤링 배포를 사용합니다.
+"""
+import os
+import signal
+import tempfile
+
+from ecommerce.core.server import (
+    MiB,
+    get_cpu_limit,
+    get_memory_limit,
+    get_server_size,
+    watch_memory,
+)
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ecommerce.settings")
+# 워커가 교체되어도 지표가 이어지도록 모든 워커가 같은 디렉터리에 기록합니다.
+# prometheus_client를 불러오기 전에 지정해야 합니다.
+if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(
+        prefix="prometheus-"
+    )
+
+from django.conf import settings  # noqa: E402
+
+APP_MEMORY = int(os.environ.get("WEB_APP_MEMORY", 80)) * MiB
+WORKER_MEMORY = int(os.environ.get("WEB_WORKER_MEMORY", 96)) * MiB
+# 워커마다 PASSWORD_HASHING_WORKERS개의 해싱 프로세스를 띄우고, 각 프로세스는
+# 앱을 따로 읽은 뒤 해시마다 ARGON2_MEMORY_COST(KiB)를 씁니다.
+HASHING_MEMORY = settings.PASSWORD_HASHING_WORKERS * (
+    APP_MEMORY + settings.ARGON2_MEMORY_COST * 1024
+)
+
+size = get_server_size(
+    cpu=float(os.environ.get("WEB_CPU_LIMIT", 0)) or get_cpu_limit(),
+    memory=int(os.environ.get("WEB_MEMORY_LIMIT", 0)) * MiB
+    or get_memory_limit(),
+    app_memory=APP_MEMORY,
+    worker_memory=WORKER_MEMORY,
+    hashing_memory=HASHING_MEMORY,
+)
+
+if os.environ.get("WEB_WORKER_CLASS") == "uvicorn":
+    wsgi_app = "ecommerce.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+else:
+    wsgi_app = "ecommerce.wsgi:application"
+    worker_class = "gthread"
+
+bind = os.environ.get("WEB_BIND", "0.0.0.0:8000")
+preload_app = True
+workers = int(os.environ.get("WEB_CONCURRENCY", size.workers))
+threads = int(os.environ.get("WEB_THREADS", size.threads))
+max_requests = int(os.environ.get("WEB_MAX_REQUESTS", 5000))
+max_requests_jitter = int(
+    os.environ.get("WEB_MAX_REQUESTS_JITTER", max_requests // 10)
+)
+max_worker_memory = (
+    int(os.environ.get("WEB_MAX_WORKER_MEMORY", 0)) * MiB
+    or size.max_worker_memory
+)
+timeout = int(os.environ.get("WEB_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("WEB_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("WEB_KEEPALIVE", 5))
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+accesslog = os.environ.get("WEB_ACCESS_LOG") or None
+errorlog = "-"
+
+
+def when_ready(server):
+    server.log.info(
+        "Serving %s with %d %s workers x %d threads, recycling at %d "
+        "requests or %d MiB",
+        wsgi_app,
+        workers,
+        worker_class,
+        threads,
+        max_requests,
+        max_worker_memory // MiB,
+    )
+    # SIGUSR2로 띄운 새 마스터라면 기존 마스터를 정상 종료합니다.
+    if server.master_pid:
+        os.kill(server.master_pid, signal.SIGTERM)
+
+
+def post_fork(server, worker):
+    # 미리 읽는 중에 열린 DB 연결을 워커끼리 공유하지 않도록 닫습니다.
+    from django.db import connections
+
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    watch_memory(max_worker_memory)
+
+
+def child_exit(server, worker):
+    from ecommerce.core.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)